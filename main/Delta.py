@@ -2,25 +2,28 @@ import os
 import sys
 import json
 import time
-import base64
-import queue
-import array
-import subprocess
+import asyncio
 import threading
-import audioop 
 import collections
-import speech_recognition as sr
 
 from typing import Optional
 
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer, QObject, pyqtSignal, QThread
-
-import pyttsx3
+from PyQt5.QtCore import QTimer, QObject, pyqtSignal
 
 # local UI / audio tools
 from parts.mouth import ReactiveWireframe2DCircle
 from parts.mic_system import MicSystem
+from parts.level_channel import LevelChannel
+from parts.vad_engine import VadEngine
+from parts.stt_backend import create_stt_backend
+from parts.wake_word import create_wake_word_detector
+from parts.tts_worker import TtsWorker
+from parts.sentence_stream import SentenceSplitter
+from parts.response_cache import create_response_cache
+from parts.intent_router import build_intent_router
+from parts.turn_scheduler import TurnScheduler
+from parts.tool_runner import create_tool_runner
 
 # langchain / tools
 from langchain_core.messages import HumanMessage
@@ -29,8 +32,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain.tools import Tool
 
 from tools.opencode_module import OpenCodeModule
-from tools.AppLauncher import AppLauncher
-from tools.kill_process import kill_process_tool
+from tools.AppLauncher import AppLauncher, is_known_app, warm_up as warm_up_app_index
+from tools.kill_process import kill_process_tool, is_known_process
 from tools.docker_mcp import docker_mcp
 
 from langchain_ollama import ChatOllama, OllamaLLM
@@ -49,40 +52,37 @@ CALIBRATION_SECONDS = 1.0
 SILENCE_CHUNKS_END = 20       # ~0.6 sec at 30 ms chunks
 MIN_PHRASE_SECONDS = 0.5
 PHRASE_TIME_LIMIT = 15.0      # cut very long monologues
+CANCEL_POLL_SECONDS = 0.1     # how often a running agent turn checks whether it was superseded
 
-# Helper: compact subprocess TTS to avoid blocking Qt
-def _run_tts_subprocess(text: str):
-    try:
-        encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
-        script = (
-            "import base64,pyttsx3,sys\n"
-            "t=base64.b64decode(sys.argv[1]).decode('utf-8')\n"
-            "e=pyttsx3.init()\n"
-            "try:\n"
-            "    e.setProperty('rate',180)\n"
-            "    e.setProperty('volume',1.0)\n"
-            "except Exception:\n"
-            "    pass\n"
-            "e.say(t)\n"
-            "e.runAndWait()\n"
-        )
-        subprocess.run([sys.executable, "-c", script, encoded], check=False)
-    except Exception as e:
-        print("TTS failed (subprocess):", e)
+# --- orb ---
+ORB_FPS = 30
+# speech level for the orb: the TTS worker writes its RMS envelope here, the orb timer reads it
+orb_level = LevelChannel()
 
-# safe orb level setter from non-Qt threads
-def _safe_set_orb_level(level: float):
-    try:
-        orb = globals().get("orb_instance")
-        if orb is not None and hasattr(orb, "setLevel"):
-            orb.setLevel(level)
-    except Exception:
-        pass
+def load_settings_dict() -> dict:
+    candidates = [
+        os.path.join(os.path.dirname(__file__), "config", "settings.json"),
+        os.path.join(os.path.dirname(__file__), "settings.json"),
+        os.path.join(os.getcwd(), "settings.json"),
+    ]
+    for p in candidates:
+        if os.path.isfile(p):
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception:
+                pass
+    return {}
 
 # LLM & agent setup (kept compact)
 llm = ChatOllama(model="qwen3:1.7b", reasoning=False)
 
-tools = [AppLauncher, kill_process_tool, OpenCodeModule, docker_mcp]
+# every tool call goes through one bounded pool with per-tool timeouts; the async
+# agent loop gathers the calls of a step, so independent ones run side by side
+tool_runner = create_tool_runner(load_settings_dict().get("tools"))
+tools = tool_runner.wrap_all([AppLauncher, kill_process_tool, OpenCodeModule, docker_mcp])
+warm_up_app_index()  # load + incrementally refresh the app index off the main thread
+TOOLS_BY_NAME = {t.name: t for t in tools}
 
 prompt = ChatPromptTemplate.from_messages([
     ("system", "You are Delta, an intelligent, conversational AI assistant. Be helpful, friendly, concise."),
@@ -93,45 +93,55 @@ prompt = ChatPromptTemplate.from_messages([
 agent = create_tool_calling_agent(llm=llm, tools=tools, prompt=prompt)
 executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
 
+def _load_commands() -> dict:
+    path = os.path.join(os.path.dirname(__file__), "config", "commands.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+# rule/trie fast path ahead of the agent: commands.json phrases + tool docstring examples
+# prefix routes ("open X", "kill X") only skip the agent for exact app / process names or PIDs
+intent_router = build_intent_router(tools, _load_commands(),
+                                    known={"AppLauncher": is_known_app, "kill_process": is_known_process})
+
 # ChatAI: compact, readable, and de-duplicated speech/recognition handling
 class ChatAI:
     def __init__(self):
-        self.recognizer = sr.Recognizer()
-        self.audio_queue = queue.Queue()
-        self._mic_system: Optional[MicSystem] = None
-        self.speaking_flag = False
+        self.stt = create_stt_backend(load_settings_dict().get("stt"), SAMPLE_RATE)
+        # one warm pyttsx3 process (plus a spare) instead of an interpreter per reply;
+        # it reports each sentence's RMS envelope at the orb frame rate and drops to 0 when idle
+        self.tts = TtsWorker(rate=180, volume=1.0, envelope_fps=ORB_FPS, level_channel=orb_level)
+        self.tts.start()
+
+    @property
+    def speaking_flag(self) -> bool:
+        """True while any reply is queued or playing (follows TTS completion events)."""
+        return self.tts.speaking()
 
     def stop(self):
-        pass
+        self.tts.close()
 
-    # wrapper to run TTS in a background thread while updating orb
-    def _speak_in_thread(self, text: str):
-        def runner():
-            try:
-                self.speaking_flag = True
-                QTimer.singleShot(0, lambda: _safe_set_orb_level(0.3))
-                _run_tts_subprocess(text)
-                QTimer.singleShot(0, lambda: _safe_set_orb_level(0.0))
-            finally:
-                self.speaking_flag = False
-        threading.Thread(target=runner, daemon=True).start()
-        
-    def speak(self, text: str):
-        """Public TTS entrypoint used by speak_with_orb()."""
-        self._speak_in_thread(text)
+    def stop_speaking(self):
+        """Barge-in: cut the current reply and drop anything queued."""
+        self.tts.cancel()
 
-    def _audio_callback(self, chunk):
-        self.audio_queue.put(chunk)
+    def speak(self, text: str):
+        """
+        Public TTS entrypoint used by speak_with_orb(). Returns immediately with the
+        Utterance: utt.wait(), `await utt` or utt.add_done_callback(fn).
+        The orb follows the audio through orb_level.
+        """
+        return self.tts.say(text)
 
     # single helper to convert raw frames into text (returns "" on unknown)
     def _recognize_audio(self, frames: bytes, rate: int):
-        audio = sr.AudioData(frames, rate, 2)
         try:
-            return self.recognizer.recognize_google(audio)
-        except sr.UnknownValueError:
+            return self.stt.transcribe(frames, rate)
+        except Exception as e:
+            print("STT error:", e)
             return ""
-        except sr.RequestError:
-            return "Speech recognition service unavailable."
 
     def get_input(self) -> str:
         return ""
@@ -141,84 +151,14 @@ class ChatAI:
         print(f"Delta: {text}")
         if speak:
             try:
-                # Pulse orb immediately on the Qt thread (match belt.py behavior)
-                try:
-                    QTimer.singleShot(0, lambda: _safe_set_orb_level(0.3))
-                except Exception:
-                    pass
-
-                self._speak_in_thread(text)
+                self.speak(text)
             except Exception:
                 pass
 
-    # continuous listening; user_callback receives raw text
-    def start_continuous_listening(self, user_callback):
-        def rms(chunk):
-            samples = array.array('h', chunk)
-            if not samples:
-                return 0
-            mean_square = sum(s * s for s in samples) / len(samples)
-            return mean_square ** 0.5
-
-        def loop():
-            buffer = []
-            silence_chunks = 0
-            silence_threshold = 150
-            silence_chunk_limit = 20
-
-            while True:
-                if self.speaking_flag:
-                    buffer.clear()
-                    silence_chunks = 0
-                    time.sleep(0.05)
-                    continue
-
-                try:
-                    chunk = self.audio_queue.get(timeout=0.5)
-                    buffer.append(chunk)
-                    if rms(chunk) < silence_threshold:
-                        silence_chunks += 1
-                    else:
-                        silence_chunks = 0
-
-                    if silence_chunks >= silence_chunk_limit and buffer:
-                        audio_data = b"".join(buffer)
-                        text = self._recognize_audio(audio_data, self._mic_system.rate)
-                        if text.strip():
-                            user_callback(text)
-                        buffer.clear()
-                        silence_chunks = 0
-
-                except queue.Empty:
-                    if buffer:
-                        audio_data = b"".join(buffer)
-                        text = self._recognize_audio(audio_data, self._mic_system.rate)
-                        if text.strip():
-                            user_callback(text)
-                        buffer.clear()
-                        silence_chunks = 0
-
-        t = threading.Thread(target=loop, daemon=True)
-        t.start()
-
 
 # small helpers used in main
 def load_settings() -> int:
-    default = 0
-    candidates = [
-        os.path.join(os.path.dirname(__file__), "config", "settings.json"),
-        os.path.join(os.path.dirname(__file__), "settings.json"),
-        os.path.join(os.getcwd(), "settings.json"),
-    ]
-    for p in candidates:
-        if os.path.isfile(p):
-            try:
-                with open(p, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                return cfg.get("default_screen_index", default)
-            except Exception:
-                pass
-    return default
+    return load_settings_dict().get("default_screen_index", 0)
 
 def create_orb(screen_geom):
     max_orb_size = min(300, screen_geom.width(), screen_geom.height())
@@ -226,10 +166,11 @@ def create_orb(screen_geom):
         orb = ReactiveWireframe2DCircle(
             n_nodes=50,
             threshold=0.6,
-            fps=30,
+            fps=ORB_FPS,
             diameter=max_orb_size,
             max_pulse=0.5,
-            damping=0.2
+            damping=0.2,
+            level_source=orb_level.read
         )
         orb.setMinimumSize(max_orb_size, max_orb_size)
         orb.setMaximumSize(max_orb_size, max_orb_size)
@@ -265,104 +206,294 @@ def set_orb_level(level: float):
         return
     bridge.setLevelRequested.emit(level)
 
-def speak_with_orb(ai: "ChatAI", text: str):
+def speak_with_orb(ai: "ChatAI", text: str, timeout: float = 120.0) -> bool:
     """
-    Raise orb, speak (async), wait until speaking finishes,
-    then lower orb. Safe from any thread.
+    Speak and block until the utterance's completion event fires (2 min
+    safety cap). The orb follows the audio through orb_level and drops when
+    the TTS goes idle. Safe from any thread; returns False on timeout.
     """
-    # raise
-    set_orb_level(0.3)
+    return ai.speak(text).wait(timeout)
 
-    # start TTS (this returns immediately; TTS runs in a thread)
-    ai.speak(text)
+def _extract_output(result) -> str:
+    if not isinstance(result, dict):
+        return str(result)
+    return (result.get("output") or result.get("result") or result.get("text")
+            or next((v for v in result.values() if isinstance(v, str) and v.strip()), str(result)))
 
-    # wait while TTS is active
-    deadline = time.time() + 120  # 2 min safety cap
-    while ai.speaking_flag and time.time() < deadline:
-        QThread.msleep(50)  # do not busy-spike CPU
+async def _astream_agent(text: str, on_token, tool_calls: list = None, on_step=None, cancelled=None):
+    """
+    Run the agent, handing chat-model tokens to on_token as they arrive; returns
+    the final output. Tool invocations are appended to tool_calls as (name, input).
 
-    # lower
-    set_orb_level(0.0)
+    on_step() is called when a new chat-model call starts and when the current
+    one turns out to be a tool-calling step, so the caller can drop what it
+    collected: only the last call's text is the answer. Tokens of a call stop
+    going to on_token once it emits tool-call chunks.
 
-def _calibrate_noise_floor(recognizer: sr.Recognizer, mic: sr.Microphone) -> float:
-    with mic as source:
-        recognizer.adjust_for_ambient_noise(source, duration=CALIBRATION_SECONDS)
-        # Grab a short buffer to estimate RMS
-        frames_to_read = int(SAMPLE_RATE * CALIBRATION_SECONDS) * SAMPLE_WIDTH
+    cancelled() is polled every CANCEL_POLL_SECONDS, also while a tool or the
+    model is silent; once it returns True the stream is closed and None is
+    returned. A tool already running finishes on its pool thread, unheard.
+    """
+    async def consume():
+        output = None
+        tool_step = False
+        stream = executor.astream_events({"input": text}, version="v2")
+        try:
+            async for ev in stream:
+                kind = ev.get("event")
+                if kind == "on_chat_model_start":
+                    tool_step = False
+                    if on_step is not None:
+                        on_step()
+                elif kind == "on_chat_model_stream":
+                    chunk = ev["data"].get("chunk")
+                    if getattr(chunk, "tool_call_chunks", None) and not tool_step:
+                        tool_step = True
+                        if on_step is not None:
+                            on_step()
+                    content = getattr(chunk, "content", "")
+                    if not tool_step and isinstance(content, str) and content:
+                        on_token(content)
+                elif kind == "on_tool_start":
+                    if on_step is not None:
+                        on_step()
+                    if tool_calls is not None:
+                        tool_calls.append((ev.get("name"), ev["data"].get("input")))
+                elif kind == "on_chain_end" and ev.get("name") == "AgentExecutor":
+                    output = _extract_output(ev["data"].get("output"))
+        finally:
+            await stream.aclose()
+        return output
+
+    task = asyncio.ensure_future(consume())
+    while cancelled is not None and not task.done():
+        await asyncio.wait({task}, timeout=CANCEL_POLL_SECONDS)
+        if cancelled() and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return None
+    return await task
+
+def _replay_cached(cache, entry) -> Optional[str]:
+    """Answer a turn from a cache entry; None if a cached tool call fails (caller falls back to the agent)."""
+    t0 = time.perf_counter()
+    if entry.kind == "answer":
+        output = entry.payload["output"]
+    else:
+        tool = TOOLS_BY_NAME.get(entry.payload.get("tool"))
+        if tool is None:
+            return None
         try:
-            raw = source.stream.read(frames_to_read)
-        except OSError:
-            # If overflow occurs, use zeros so VAD still starts with conservative floor
-            raw = b"\x00" * frames_to_read
-        rms = audioop.rms(raw, SAMPLE_WIDTH)
-        return max(100, rms)  # avoid zero floor
-
-
-def start_vad_listener(on_phrase, stop_event: threading.Event, mic_index: int = None):
-    """Continuously read the mic stream and emit whole phrases via on_phrase(text)."""
-    recognizer = sr.Recognizer()
-    recognizer.energy_threshold = 300
-    recognizer.dynamic_energy_threshold = True
-    recognizer.pause_threshold = 0.8
-    recognizer.phrase_threshold = 0.2
-    recognizer.non_speaking_duration = 0.5
-
-    mic = sr.Microphone(device_index=mic_index, sample_rate=SAMPLE_RATE)
-    noise_floor = _calibrate_noise_floor(recognizer, mic)
-    vad_threshold = noise_floor * ENERGY_BOOST
+            output = str(tool.invoke(entry.payload.get("input")))
+        except Exception as e:
+            print("Cached tool call failed:", e)
+            return None
+    cache.record_saving(entry.latency - (time.perf_counter() - t0))
+    return output
+
+class SpokenTurn:
+    """
+    One agent turn, spoken sentence by sentence while the LLM is still generating.
+    Times are measured from when the phrase was recognized.
+
+    gate() is called before the first sentence is spoken; returning False mutes
+    the turn (it was superseded by a newer phrase).
+    """
+    def __init__(self, ai: "ChatAI", t0: float = None, gate=None):
+        self.ai = ai
+        self.splitter = SentenceSplitter()
+        self.t0 = t0 or time.perf_counter()
+        self.gate = gate
+        self.muted = False
+        self.t_first_token = None
+        self.t_first_sentence = None
+        self.tokens = []
+        self.utterances = []
+
+    def on_token(self, token: str):
+        if self.t_first_token is None:
+            self.t_first_token = time.perf_counter()
+        self.tokens.append(token)
+        for sentence in self.splitter.feed(token):
+            self._say(sentence)
+
+    def new_step(self):
+        """A new LLM call (or a tool call) began: text collected so far was not the answer."""
+        self.splitter = SentenceSplitter()
+        self.tokens = []
+
+    def _say(self, sentence: str):
+        if self.muted:
+            return
+        if not self.utterances:
+            if self.gate is not None and not self.gate():
+                self.muted = True
+                return
+            self.t_first_sentence = time.perf_counter()
+        self.utterances.append(self.ai.speak(sentence))
+
+    def finish(self, output: str):
+        """Speak the remainder, wait for the audio to end and report timings."""
+        rest = self.splitter.flush()
+        if rest:
+            self._say(rest)
+        # return_direct tools answer without going through the chat model stream; self.tokens only
+        # holds the last LLM call, so a streamed final answer matches and is not spoken twice
+        if output and output.strip() != "".join(self.tokens).strip():
+            self._say(output)
+        if not self.utterances:
+            if self.muted:
+                print("[Turn] superseded by a newer phrase, not spoken")
+            return
+        for utt in self.utterances:
+            utt.wait(120)  # 2 min safety cap per sentence
+        self.report()
 
+    def report(self):
+        def ms(t):
+            return "-" if t is None else f"{(t - self.t0) * 1000:.0f} ms"
+        first_audio = next((u.t_start for u in self.utterances if u.t_start is not None), None)
+        print(f"[Turn] first token {ms(self.t_first_token)}, first sentence {ms(self.t_first_sentence)}, "
+              f"first audio {ms(first_audio)}, done {ms(time.perf_counter())}, "
+              f"{len(self.utterances)} sentence(s)")
+
+_mic = None
+
+def shared_mic(device_index: int = None) -> MicSystem:
+    """
+    The one capture stream, opened on first use and kept open: the wake word,
+    the VAD and the STT all read its ring, each through its own reader.
+    """
+    global _mic
+    if _mic is None:
+        _mic = MicSystem(rate=SAMPLE_RATE, chunk_size=int(SAMPLE_RATE * CHUNK_MS / 1000),
+                         device_index=device_index)
+        _mic.start_stream()
+    return _mic
+
+def _calibrate_noise_floor(reader, vad: VadEngine) -> float:
+    # a short stretch of (hopefully) room noise from the ring
+    nbytes = int(SAMPLE_RATE * CALIBRATION_SECONDS) * SAMPLE_WIDTH
+    raw = reader.read(nbytes, timeout=CALIBRATION_SECONDS + 1.0)
+    if raw is None:
+        # no audio yet: zeros so the VAD still starts with a conservative floor
+        raw = b"\x00" * nbytes
+    return vad.calibrate(raw)  # clamped to vad.min_floor
+
+
+def start_vad_listener(on_phrase, stop_event: threading.Event, mic: MicSystem, on_partial=None, tts=None):
+    """
+    Read the shared mic ring and emit whole phrases via on_phrase(text).
+    Voiced chunks are streamed into the STT backend as they arrive, so a local
+    engine is already done decoding when the phrase ends; on_partial(text)
+    receives interim hypotheses.
+
+    While `tts` (a TtsWorker) is speaking the mic only hears Delta itself:
+    the listener blocks on tts.idle, then skips the audio captured meanwhile
+    and resets the VAD, so it reopens on fresh audio only.
+    """
     chunk_frames = int(SAMPLE_RATE * (CHUNK_MS / 1000.0))
-    max_frames = int(SAMPLE_RATE * PHRASE_TIME_LIMIT)
-    min_frames = int(SAMPLE_RATE * MIN_PHRASE_SECONDS)
+    chunk_bytes = chunk_frames * SAMPLE_WIDTH
+    vad = VadEngine(
+        sample_rate=SAMPLE_RATE,
+        max_chunk_samples=chunk_frames,
+        energy_boost=ENERGY_BOOST,
+        min_floor=100.0,
+        silence_chunks_end=SILENCE_CHUNKS_END,
+        min_phrase_seconds=MIN_PHRASE_SECONDS,
+        max_phrase_seconds=PHRASE_TIME_LIMIT,
+    )
+
+    stt = create_stt_backend(load_settings_dict().get("stt"), SAMPLE_RATE)
+
+    reader = mic.reader()
+    _calibrate_noise_floor(reader, vad)
+
+    while not stop_event.is_set():
+        if tts is not None and not tts.idle.is_set():
+            if vad.voiced:
+                stt.cancel()
+            while not tts.idle.wait(0.5):
+                if stop_event.is_set():
+                    return
+            reader.seek_to_end()
+            vad.reset()
+            print(f"[Mic] reopened {(time.perf_counter() - tts.t_idle) * 1000:.1f} ms after speech")
+            continue
 
-    with mic as source:
-        stream = source.stream  # PyAudio stream (stays OPEN)
-        buffer = bytearray()
-        voiced = False
-        silence_chunks = 0
+        chunk = reader.read(chunk_bytes, timeout=0.5)  # zero-copy view into the ring
+        if chunk is None:
+            continue
 
-        while not stop_event.is_set():
-            try:
-                chunk = stream.read(chunk_frames * SAMPLE_WIDTH)
-            except OSError:
+        event = vad.process(chunk)
+        try:
+            if event == VadEngine.SPEECH_START:
+                # hand over the pre-roll + onset chunk; later chunks stream straight in
+                stt.start(on_partial)
+                stt.accept(vad.current_phrase())
                 continue
-            if not chunk:
+            if vad.voiced:
+                stt.accept(chunk)
+            if event != VadEngine.PHRASE_END:
                 continue
 
-            # Keep the stream alive—no open/close toggling
-            buffer.extend(chunk)
-            rms = audioop.rms(chunk, SAMPLE_WIDTH)
-
-            if rms > vad_threshold:
-                voiced = True
-                silence_chunks = 0
-            else:
-                if voiced:
-                    silence_chunks += 1
-
-            phrase_ended = voiced and (
-                silence_chunks >= SILENCE_CHUNKS_END
-                or len(buffer) >= max_frames * SAMPLE_WIDTH
-            )
-
-            if phrase_ended:
-                # Only accept phrases with some minimum length
-                if len(buffer) >= min_frames * SAMPLE_WIDTH:
-                    audio = sr.AudioData(bytes(buffer), SAMPLE_RATE, SAMPLE_WIDTH)
-                    try:
-                        # Use the same recognizer backend you already use elsewhere
-                        text = recognizer.recognize_google(audio)
-                        if text and text.strip():
-                            on_phrase(text.strip())
-                    except sr.UnknownValueError:
-                        pass
-                    except Exception as e:
-                        print("STT error:", e)
-
-                # Reset for next phrase (stream stays open)
-                buffer.clear()
-                voiced = False
-                silence_chunks = 0
+            # take_phrase() drops phrases under MIN_PHRASE_SECONDS and resets the VAD
+            if not vad.take_phrase():
+                stt.cancel()
+                continue
+            text = stt.finish()
+            if text:
+                on_phrase(text)
+        except Exception as e:
+            print("STT error:", e)
+            stt.cancel()
+            vad.reset()
+
+
+def listen_for_wake_word(detector, mic: MicSystem) -> str:
+    """
+    Run the keyword spotter on 30 ms chunks of the shared mic ring until it
+    fires. No STT runs here; the full recognition pipeline only starts after a hit.
+    """
+    chunk_bytes = int(SAMPLE_RATE * (CHUNK_MS / 1000.0)) * SAMPLE_WIDTH
+    reader = mic.reader()
+    detector.reset()
+    print("active")
+    while True:
+        chunk = reader.read(chunk_bytes, timeout=0.5)
+        if chunk is not None and detector.process(chunk):
+            return TRIGGER_WORD
+
+
+def listen_for_trigger_phrase(stt, mic: MicSystem, phrase_seconds: float = 3.5) -> str:
+    """
+    Without an enrolled wake word: cut phrases from the shared mic ring with
+    the VAD and run STT on each until one contains the trigger word.
+    """
+    chunk_bytes = int(SAMPLE_RATE * (CHUNK_MS / 1000.0)) * SAMPLE_WIDTH
+    vad = VadEngine(sample_rate=SAMPLE_RATE, energy_boost=ENERGY_BOOST, min_floor=100.0,
+                    silence_chunks_end=SILENCE_CHUNKS_END, min_phrase_seconds=MIN_PHRASE_SECONDS,
+                    max_phrase_seconds=phrase_seconds)
+    reader = mic.reader()
+    _calibrate_noise_floor(reader, vad)
+    print("active")
+    while True:
+        chunk = reader.read(chunk_bytes, timeout=0.5)
+        if chunk is None or vad.process(chunk) != VadEngine.PHRASE_END:
+            continue
+        phrase = vad.take_phrase()
+        if not phrase:
+            continue
+        try:
+            spoken_text = stt.transcribe(phrase, SAMPLE_RATE)
+        except Exception as err:
+            print("Wake STT error:", err)
+            continue
+        if spoken_text and TRIGGER_WORD.lower() in spoken_text.lower():
+            return spoken_text
 
 
 def start_ui_and_ai(on_exit):
@@ -382,11 +513,72 @@ def start_ui_and_ai(on_exit):
     global _orb_bridge
     if orb is not None:
         _orb_bridge = OrbBridge(orb)
+        # one signal per utterance to bring an idle orb back to full frame rate
+        orb_level.on_wake = set_orb_level
 
     session_stop = threading.Event()
     exit_signaled = False
+    response_cache = create_response_cache(load_settings_dict().get("response_cache"))
+
+    # runs on a scheduler worker; job is a parts.turn_scheduler.Turn
+    def process(job):
+        text = job.text
+        # sentences go to TTS while the model is still generating
+        turn = SpokenTurn(ai, t0=job.t_submit, gate=lambda: scheduler.acquire_speech(job))
+
+        # one-to-one commands ("open X", "kill 1234") go straight to the tool
+        t0 = time.perf_counter()
+        try:
+            resp = intent_router.dispatch(text)
+        except Exception as e:
+            print("Routed command failed:", e)
+            resp = None
+        if resp is not None:
+            print(f"Delta (routed, {(time.perf_counter() - t0) * 1000:.1f} ms):", resp)
+            turn.finish(resp)
+            return
+
+        # a newer phrase superseded this turn: stop before the next stage, not just mute it
+        if job.cancelled:
+            print("[Turn] superseded before the agent ran")
+            return
+
+        # repeated commands replay the cached tool call / answer without the LLM
+        hit = response_cache.lookup(text)
+        resp = _replay_cached(response_cache, hit) if hit is not None else None
+        if resp is not None:
+            print("Delta (cached):", resp)
+            turn.finish(resp)
+            print("[Cache]", response_cache.stats())
+            return
+
+        if job.cancelled:
+            print("[Turn] superseded before the agent ran")
+            return
+
+        tool_calls = []
+        t0 = time.perf_counter()
+        try:
+            resp = asyncio.run(_astream_agent(text, turn.on_token, tool_calls, on_step=turn.new_step,
+                                              cancelled=lambda: job.cancelled))
+            if job.cancelled:
+                # the stream was closed part way; nothing to speak or cache
+                print("[Turn] superseded, agent stopped after", f"{(time.perf_counter() - t0) * 1000:.0f} ms")
+                return
+            resp = resp or "".join(turn.tokens)
+            response_cache.store(text, resp, tool_calls, time.perf_counter() - t0)
+        except Exception as e:
+            print("Agent error:", e)
+            resp = "Sorry, I couldn't process that."
+        if tool_calls:
+            print("[Tools]", tool_runner.summary(since=t0), tool_runner.stats())
+        print("Delta:", resp)
+        turn.finish(resp)
+        print("[Scheduler]", scheduler.stats())
+
+    # bounded pool; newer phrases supersede queued ones, replies are spoken in order
+    scheduler = TurnScheduler(process, **load_settings_dict().get("scheduler", {}))
 
-    # One worker that processes phrases
     def handle_phrase(text: str):
         nonlocal exit_signaled
         print("User:", text)
@@ -394,6 +586,8 @@ def start_ui_and_ai(on_exit):
 
         # exit words end the ACTIVE session
         if any(kw in lower for kw in EXIT_WORDS):
+            scheduler.close()
+            ai.stop_speaking()
             try: speak_with_orb(ai, "")
             except Exception: pass
             # ensure no further audio processing runs
@@ -403,23 +597,12 @@ def start_ui_and_ai(on_exit):
             on_exit()
             return
 
-        def process():
-            try:
-                result = executor.invoke({"input": text})
-                resp = (result.get("output") or result.get("result") or result.get("text")
-                        or next((v for v in result.values() if isinstance(v, str) and v.strip()), str(result))
-                        if isinstance(result, dict) else str(result))
-            except Exception as e:
-                print("Agent error:", e)
-                resp = "Sorry, I couldn't process that."
-            print("Delta:", resp)
-            speak_with_orb(ai, resp)
-
-        threading.Thread(target=process, daemon=True).start()
+        scheduler.submit(text)
 
     threading.Thread(
         target=start_vad_listener,
-        args=(handle_phrase, session_stop, MIC_INDEX),
+        args=(handle_phrase, session_stop, shared_mic(MIC_INDEX)),
+        kwargs={"tts": ai.tts},
         daemon=True
     ).start()
 
@@ -431,6 +614,7 @@ def start_ui_and_ai(on_exit):
     session_stop.set()
     if not exit_signaled:
         on_exit()
+    scheduler.close()
     try: ai.stop()
     except Exception: pass
     try:
@@ -438,42 +622,29 @@ def start_ui_and_ai(on_exit):
         if o is not None: o.close()
         globals()["orb_instance"] = None
         globals()["_orb_bridge"] = None
+        orb_level.on_wake = None
     except Exception: pass
 
 
 if __name__ == "__main__":
-    recognizer = sr.Recognizer()
-    mic = sr.Microphone(device_index=MIC_INDEX)
+    settings = load_settings_dict()
+    wake_stt = create_stt_backend(settings.get("stt"), SAMPLE_RATE)
+    wake_detector = create_wake_word_detector(settings.get("wake_word"), SAMPLE_RATE)
+    if wake_detector is None:
+        print("No wake word templates enrolled (see parts/wake_word.py); using STT for the trigger word.")
 
-    def listen_for_trigger(timeout=10):
+    def listen_for_trigger():
         """
-        Keep the microphone stream open and continuously monitor for the trigger word.
-        We only close the stream when a trigger phrase is detected so the device does
-        not churn on/off between timeouts.
+        Wait for the trigger word on the shared mic stream, which stays open across
+        sessions so the device does not churn on/off.
         """
-        with mic as source:
-            recognizer.adjust_for_ambient_noise(source, duration=0.5)
-            print("active")
-
-            while True:
-                try:
-                    audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=3.5)
-                except sr.WaitTimeoutError:
-                    continue
-
-                try:
-                    spoken_text = recognizer.recognize_google(audio)
-                except sr.UnknownValueError:
-                    continue
-                except Exception as err:
-                    print("Wake STT error:", err)
-                    continue
-
-                if spoken_text and TRIGGER_WORD.lower() in spoken_text.lower():
-                    return spoken_text
+        mic = shared_mic(MIC_INDEX)
+        if wake_detector is not None:
+            return listen_for_wake_word(wake_detector, mic)
+        return listen_for_trigger_phrase(wake_stt, mic)
 
     while True:
-        text = listen_for_trigger(timeout=10)
+        text = listen_for_trigger()
         if not text:
             continue
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+bench_app_index.py
+
+Cold vs warm app lookup over a synthetic tree (default 10k entries):
+
+    legacy glob  – the old _build_index: recursive glob of every tree on
+                   the first call, in memory only
+    cold         – AppIndex with no database yet: full scan + SQLite write
+    warm         – new AppIndex on the existing database (a restart): load
+                   + mtime-only refresh, then the lookup
+    incremental  – warm refresh after adding one shortcut
+
+The tree mimics a Start Menu (nested folders of shortcuts) plus a flat
+PATH-like directory of executables. Nothing outside a temp dir is touched.
+
+Usage:
+    python benchmarks/bench_app_index.py
+    python benchmarks/bench_app_index.py --entries 50000 --per-dir 25
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from tools.app_index import AppIndex, Source
+
+
+def build_tree(root: str, entries: int, per_dir: int):
+    menu = os.path.join(root, "Start Menu", "Programs")
+    bin_dir = os.path.join(root, "bin")
+    os.makedirs(bin_dir)
+    n_menu = entries * 4 // 5
+    for i in range(n_menu):
+        vendor, product = divmod(i // per_dir, 10)
+        d = os.path.join(menu, f"Vendor {vendor:03d}", f"Product {product}")
+        os.makedirs(d, exist_ok=True)
+        open(os.path.join(d, f"app {i:05d}.lnk"), "w").close()
+    for i in range(entries - n_menu):
+        open(os.path.join(bin_dir, f"tool{i:05d}.exe"), "w").close()
+    return [Source(menu, ("*.lnk",), "lnk"),
+            Source(bin_dir, ("*.exe",), "exe", priority=1, recursive=False)]
+
+
+def legacy_build(sources):
+    idx = {}
+    for src in sources:
+        if src.recursive:
+            paths = glob.glob(os.path.join(src.root, "**", "*.lnk"), recursive=True)
+        else:
+            paths = glob.glob(os.path.join(src.root, "*.exe"))
+        for path in paths:
+            idx.setdefault(os.path.splitext(os.path.basename(path))[0].lower(), path)
+    return idx
+
+
+def ms(t0):
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--entries", type=int, default=10000)
+    ap.add_argument("--per-dir", type=int, default=20, help="shortcuts per Start Menu folder")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="app_index_bench_")
+    try:
+        sources = build_tree(tmp, args.entries, args.per_dir)
+        db = os.path.join(tmp, "app_index.sqlite")
+        query = "app 04242"
+
+        t0 = time.perf_counter()
+        legacy = legacy_build(sources)
+        legacy.get(query)
+        print(f"legacy glob   first lookup {ms(t0):8.1f} ms   ({len(legacy)} entries)")
+
+        t0 = time.perf_counter()
+        index = AppIndex(db, sources)
+        stats = index.refresh()
+        index.lookup(query)
+        print(f"cold          first lookup {ms(t0):8.1f} ms   ({stats['dirs']} dirs scanned)")
+        index.close()
+
+        t0 = time.perf_counter()
+        index = AppIndex(db, sources)
+        index.load()
+        found = index.lookup(query)
+        t_load = ms(t0)
+        stats = index.refresh()
+        print(f"warm          first lookup {t_load:8.1f} ms   (load from disk; hit={found is not None})")
+        print(f"              mtime refresh {stats['seconds'] * 1000:7.1f} ms   "
+              f"({stats['dirs']} dirs checked, {stats['rescanned']} re-listed)")
+
+        new_dir = os.path.dirname(found)
+        open(os.path.join(new_dir, "freshly installed.lnk"), "w").close()
+        t0 = time.perf_counter()
+        stats = index.refresh()
+        hit = index.lookup("freshly installed")
+        print(f"incremental   refresh+hit  {ms(t0):8.1f} ms   "
+              f"({stats['rescanned']} dir re-listed, hit={hit is not None})")
+
+        t0 = time.perf_counter()
+        for _ in range(10000):
+            index.lookup(query)
+        print(f"steady state  lookup       {ms(t0) / 10000 * 1000:8.2f} us")
+        index.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+bench_fuzzy_match.py
+
+App-name lookup latency and recall: difflib.get_close_matches over
+list(names) (the old _Launcher._lookup) versus FuzzyIndex, at 1k/10k/100k
+synthetic names.
+
+Names are 1-3 word app-like strings ("nova studio pro"). Queries are
+names with one typo (swap / drop / replace a letter), shuffled word order,
+or a single distinctive word, so each has a known intended answer.
+
+    hit@1     – top match is the intended name
+    recall@5  – intended name is in the top 5 (difflib: n=5)
+    agree     – FuzzyIndex's top 5 contains difflib's top match
+                (queries where difflib found one)
+
+Usage:
+    python benchmarks/bench_fuzzy_match.py
+    python benchmarks/bench_fuzzy_match.py --sizes 1000 10000 --queries 200
+"""
+
+import sys
+import time
+import random
+import argparse
+from difflib import get_close_matches
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from tools.fuzzy_match import FuzzyIndex, tokens
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ra", "to", "vi", "zu", "sa", "pe", "qu", "or", "an", "el", "is", "um"]
+SUFFIXES = ["", "", "", "pro", "studio", "player", "editor", "manager", "beta", "tools"]
+
+
+def make_names(n: int, rng: random.Random) -> list:
+    names = set()
+    while len(names) < n:
+        words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(rng.randint(1, 2))]
+        suffix = rng.choice(SUFFIXES)
+        names.add(" ".join(words + ([suffix] if suffix else [])))
+    return sorted(names)
+
+
+def typo(word: str, rng: random.Random) -> str:
+    if len(word) < 4:
+        return word
+    i = rng.randrange(len(word) - 1)
+    kind = rng.choice(("swap", "drop", "replace"))
+    if kind == "swap":
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if kind == "drop":
+        return word[:i] + word[i + 1:]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def make_queries(names: list, n: int, rng: random.Random) -> list:
+    queries = []
+    for name in rng.sample(names, n):
+        words = tokens(name)
+        kind = rng.choice(("typo", "order", "word"))
+        if kind == "typo":
+            j = max(range(len(words)), key=lambda k: len(words[k]))
+            words[j] = typo(words[j], rng)
+        elif kind == "order" and len(words) > 1:
+            words.reverse()
+        elif kind == "word":
+            words = [max(words, key=len)]
+        queries.append((" ".join(words), name))
+    return queries
+
+
+def run(size: int, n_queries: int, n_difflib: int, rng: random.Random):
+    names = make_names(size, rng)
+    queries = make_queries(names, n_queries, rng)
+
+    t0 = time.perf_counter()
+    fuzzy = FuzzyIndex(names)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    ours = [[n for n, _ in fuzzy.search(q, k=5, cutoff=0.6)] for q, _ in queries]
+    ours_ms = (time.perf_counter() - t0) * 1000 / len(queries)
+
+    sub = queries[:n_difflib]
+    t0 = time.perf_counter()
+    ref = [get_close_matches(q, list(names), n=5, cutoff=0.6) for q, _ in sub]
+    ref_ms = (time.perf_counter() - t0) * 1000 / len(sub)
+
+    def rate(results, qs, top):
+        return sum(want in r[:top] for r, (_, want) in zip(results, qs)) / len(qs)
+
+    found = [(o, r[0]) for o, r in zip(ours, ref) if r]
+    agree = sum(best in o for o, best in found) / len(found) if found else float("nan")
+    print(f"{size:>7}  build {build_ms:8.1f} ms | "
+          f"difflib {ref_ms:8.2f} ms/q  hit@1 {rate(ref, sub, 1):4.0%}  recall@5 {rate(ref, sub, 5):4.0%} | "
+          f"fuzzy {ours_ms:6.3f} ms/q  hit@1 {rate(ours, queries, 1):4.0%}  recall@5 {rate(ours, queries, 5):4.0%}  "
+          f"agree {agree:4.0%}  ({ref_ms / ours_ms:6.0f}x)")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--queries", type=int, default=300)
+    ap.add_argument("--difflib-queries", type=int, default=40, help="difflib is slow at 100k; it gets the first N queries")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        run(size, args.queries, min(args.difflib_queries, args.queries), rng)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
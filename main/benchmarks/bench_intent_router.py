@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+bench_intent_router.py
+
+Hit rate and latency of the IntentRouter fast path over a corpus of
+utterances. Routes are built exactly as Delta.py builds them (tool docstrings
++ config/commands.json), but tools are stubbed so nothing is launched or
+killed, and the exact-name checks for "open X" / "kill X" use the stand-in
+lists INSTALLED_APPS and RUNNING_PROCESSES. Docstrings are read from tools/*.py with ast, so LangChain is not
+needed to run this.
+
+End-to-end latency per utterance = router time for routed phrases, router
+time + --agent-ms for phrases that fall through (measure your agent turn
+time from the [Turn] lines Delta prints and pass it in).
+
+Usage:
+    python benchmarks/bench_intent_router.py
+    python benchmarks/bench_intent_router.py --corpus utterances.txt --agent-ms 2300
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import glob
+import argparse
+import statistics
+
+from bench_paths import MAIN_DIR
+from parts.intent_router import IntentRouter
+
+DEFAULT_CORPUS = [
+    "open chrome", "open vs code", "please open spotify", "open microsoft word",
+    "open file explorer", "open cmd", "hey delta open discord", "list processes",
+    "kill 1234", "kill process chrome", "kill notepad", "could you open excel",
+    "what's the weather like", "tell me a joke", "summarize the last meeting",
+    "open a new file in vs code and write hello world", "how much memory is chrome using",
+    "ask opencode to refactor the parser", "what time is it", "list processes by memory",
+    "open it", "kill the music",
+]
+
+INSTALLED_APPS = {"chrome", "vs code", "spotify", "microsoft word", "discord", "excel", "file explorer"}
+RUNNING_PROCESSES = {"chrome", "notepad", "spotify"}
+
+
+def is_known_process(name: str) -> bool:
+    return name.split()[-1] in RUNNING_PROCESSES if name.startswith("process ") else name in RUNNING_PROCESSES
+
+
+class StubTool:
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+
+    def invoke(self, text):
+        return f"{self.name}: {text}"
+
+
+def tools_from_source():
+    """Find @tool("name") functions in tools/*.py and return stubs carrying their docstrings."""
+    stubs = []
+    for path in glob.glob(os.path.join(MAIN_DIR, "tools", "*.py")):
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            for deco in node.decorator_list:
+                if (isinstance(deco, ast.Call) and getattr(deco.func, "id", "") == "tool"
+                        and deco.args and isinstance(deco.args[0], ast.Constant)):
+                    stubs.append(StubTool(deco.args[0].value, ast.get_docstring(node) or ""))
+    return stubs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", help="text file, one utterance per line")
+    ap.add_argument("--agent-ms", type=float, default=2000.0,
+                    help="agent turn latency assumed for phrases the router passes on")
+    ap.add_argument("--repeat", type=int, default=1000)
+    args = ap.parse_args()
+
+    corpus = DEFAULT_CORPUS
+    if args.corpus:
+        with open(args.corpus, "r", encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+
+    known = {"AppLauncher": INSTALLED_APPS.__contains__, "kill_process": is_known_process}
+    router = IntentRouter()
+    for stub in tools_from_source():
+        router.add_tool(stub, known=known.get(stub.name))
+    # commands.json routes would spawn shells; time them with a no-op handler instead
+    with open(os.path.join(MAIN_DIR, "config", "commands.json"), "r", encoding="utf-8") as f:
+        for phrase in json.load(f):
+            router.add_route(phrase, f"command:{phrase}", lambda text: "ok")
+
+    routed, e2e = 0, []
+    for utt in corpus:
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            found = router.match(utt)
+        match_us = (time.perf_counter() - t0) / args.repeat * 1e6
+        t0 = time.perf_counter()
+        reply = router.dispatch(utt)
+        dispatch_ms = (time.perf_counter() - t0) * 1000
+        if reply is not None:
+            routed += 1
+            e2e.append(dispatch_ms)
+        else:
+            e2e.append(dispatch_ms + args.agent_ms)
+        print(f"  {utt!r:52} -> {found[0].name if found else 'agent':22} match {match_us:6.1f} us")
+
+    all_agent = args.agent_ms * len(corpus)
+    print(f"\nrouter hit rate: {routed}/{len(corpus)} = {100 * routed / len(corpus):.0f}%")
+    print(f"mean end-to-end: {statistics.mean(e2e):.1f} ms with router vs "
+          f"{all_agent / len(corpus):.1f} ms agent-only (agent = {args.agent_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+bench_job_runner.py
+
+The manager's script runs, old and new, with a 10 ms QTimer standing in
+for the GUI: its longest gap is how long the window was frozen. Each
+stand-in script prints --lines lines over --seconds.
+
+    legacy       – subprocess.run(capture_output=True) per script on the GUI
+                   thread, as Terminal.run_chain did (serial, output at the end)
+    sequential   – JobRunner.run_chain(sequential=True)
+    dag          – a→(b, c, d)→e with max_parallel 2, then 3
+    cancel       – a long job cancelled after 0.3 s; a job killed by its timeout
+
+Usage:
+    python benchmarks/bench_job_runner.py
+    python benchmarks/bench_job_runner.py --scripts 6 --seconds 0.3
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from manager_parts.job_runner import JobRunner, Job
+
+SCRIPT = ("import time, sys\n"
+          "n, secs = int(sys.argv[1]), float(sys.argv[2])\n"
+          "for i in range(n):\n"
+          "    print(f'line {i}', flush=True)\n"
+          "    time.sleep(secs / n)\n")
+
+
+def job(name, lines, seconds, **kwargs) -> Job:
+    return Job(name, sys.executable, ["-c", SCRIPT, str(lines), f"{seconds:g}"], **kwargs)
+
+
+class Ticker:
+    """10 ms timer recording its longest gap (a frozen GUI shows up here)."""
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(10)
+        self.timer.timeout.connect(self.tick)
+        self.last = None
+        self.max_gap = 0.0
+
+    def start(self):
+        self.last = time.perf_counter()
+        self.max_gap = 0.0
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self.last)
+        self.last = now
+
+    def stop(self) -> float:
+        self.tick()
+        self.timer.stop()
+        return self.max_gap
+
+
+def run_until(app, predicate, timeout: float = 60.0):
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < deadline:
+        QTimer.singleShot(5, loop.quit)
+        loop.exec_()
+
+
+def run_group(app, runner, jobs, sequential=False):
+    """Returns (wall s, first output s, lines, summary, longest GUI gap s)."""
+    ticker, first, lines, done = Ticker(), [], [], []
+
+    def on_output(name, text, is_err):
+        first.append(time.perf_counter())
+        lines.extend(text.splitlines())
+
+    runner.output.connect(on_output)
+    runner.chain_finished.connect(lambda group, summary: done.append(summary))
+    ticker.start()
+    t0 = time.perf_counter()
+    runner.run_chain(jobs, sequential=sequential)
+    run_until(app, lambda: done)
+    wall = time.perf_counter() - t0
+    gap = ticker.stop()
+    runner.output.disconnect(on_output)
+    runner.chain_finished.disconnect()
+    return wall, (first[0] - t0) if first else float("nan"), lines, done[0], gap
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scripts", type=int, default=4)
+    ap.add_argument("--seconds", type=float, default=0.5, help="run time of each stand-in script")
+    ap.add_argument("--lines", type=int, default=5)
+    args = ap.parse_args()
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    n, secs, lines = args.scripts, args.seconds, args.lines
+    argv = [sys.executable, "-c", SCRIPT, str(lines), f"{secs:g}"]
+
+    ticker = Ticker()
+    ticker.start()
+    t0 = time.perf_counter()
+    first = None
+    for _ in range(n):
+        subprocess.run(argv, capture_output=True, text=True)
+        first = first or time.perf_counter() - t0
+    wall = time.perf_counter() - t0
+    print(f"legacy       {wall:6.2f} s wall, first output after {first:5.2f} s, "
+          f"GUI frozen up to {ticker.stop() * 1000:6.0f} ms")
+
+    runner = JobRunner(max_parallel=2)
+    wall, first, out, summary, gap = run_group(app, runner, [job(f"s{i}", lines, secs) for i in range(n)],
+                                               sequential=True)
+    print(f"sequential   {wall:6.2f} s wall, first output after {first:5.2f} s, "
+          f"GUI frozen up to {gap * 1000:6.0f} ms, {len(out)}/{n * lines} lines")
+
+    for cap in (2, 3):
+        runner.max_parallel = cap
+        dag = [job("a", lines, secs), job("b", lines, secs, deps=["a"]), job("c", lines, secs, deps=["a"]),
+               job("d", lines, secs, deps=["a"]), job("e", lines, secs, deps=["b", "c", "d"])]
+        wall, first, out, summary, gap = run_group(app, runner, dag)
+        ideal = secs * (3 if cap >= 3 else 4)
+        print(f"dag cap {cap}    {wall:6.2f} s wall (critical path {ideal:.1f} s + startup), "
+              f"GUI frozen up to {gap * 1000:4.0f} ms, all done: {all(s[0] == 'done' for s in summary.values())}")
+    print("timings     ", [(name, state, waited, ran) for name, state, _, waited, ran in runner.timings()[-5:]])
+
+    ended = []
+    runner.finished.connect(lambda name, state, code, seconds: ended.append((name, state, time.perf_counter())))
+    runner.submit(job("long", 100, 10.0))
+    runner.submit(job("after-long", 1, 0.1, deps=["long"]))
+    run_until(app, lambda: False, timeout=0.3)
+    t0 = time.perf_counter()
+    runner.cancel_all()
+    run_until(app, lambda: len(ended) >= 2, timeout=5)
+    print(f"cancel       {[(n, s) for n, s, _ in ended]} in {(ended[-1][2] - t0) * 1000:.0f} ms")
+
+    ended.clear()
+    t0 = time.perf_counter()
+    runner.submit(job("hang", 100, 10.0, timeout=0.5))
+    run_until(app, lambda: ended, timeout=5)
+    print(f"timeout      {ended[0][1]} after {(ended[0][2] - t0):.2f} s (timeout 0.5 s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
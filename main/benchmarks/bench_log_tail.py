@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+bench_log_tail.py
+
+The manager's Delta log pane against a large Delta_log_cache.txt (500 MB
+by default, written to a temp dir):
+
+    legacy read    – what the 2 s timer did each tick: read + decode the
+                     whole file (setPlainText timed separately on
+                     --view-mb, since 500 MB of text would not fit a view)
+    tail open      – LogTail's first poll: only the last initial_bytes
+    follow         – bursts of appended lines: poll + appendPlainText into a
+                     QPlainTextEdit capped at 5000 blocks, per burst
+    notify         – LogFollower on QFileSystemWatcher: time from a write
+                     to the lines reaching the view
+    rotate/truncate– the file renamed away and recreated, then truncated:
+                     no lines lost or repeated
+
+Usage:
+    python benchmarks/bench_log_tail.py
+    python benchmarks/bench_log_tail.py --size-mb 100 --bursts 200
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit, QTextEdit
+
+from manager_parts.log_tail import LogTail, LogFollower
+
+LINE = "[{:09d}] You said: open chrome and play some music — Delta: Opening chrome ✓\n"
+
+
+def write_log(path: str, size_mb: int) -> int:
+    """Fill `path` with numbered lines up to size_mb; returns the line count."""
+    target = size_mb * 1024 * 1024
+    n, written = 0, 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            block = "".join(LINE.format(n + i) for i in range(10000))
+            f.write(block)
+            written += len(block.encode("utf-8"))
+            n += 10000
+    return n
+
+
+def append_lines(path: str, start: int, count: int) -> int:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(LINE.format(start + i) for i in range(count)))
+    return start + count
+
+
+def numbers(text: str) -> list:
+    return [int(line[1:10]) for line in text.splitlines() if line.startswith("[")]
+
+
+def wait_for(app, predicate, timeout: float = 5.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    loop = QEventLoop()
+    while not predicate() and time.perf_counter() < deadline:
+        QTimer.singleShot(1, loop.quit)
+        loop.exec_()
+    return predicate()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size-mb", type=int, default=500)
+    ap.add_argument("--view-mb", type=int, default=20, help="size for the setPlainText timing")
+    ap.add_argument("--bursts", type=int, default=100)
+    ap.add_argument("--lines", type=int, default=200, help="lines per burst")
+    args = ap.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tmp = tempfile.mkdtemp(prefix="delta_log_")
+    path = os.path.join(tmp, "Delta_log_cache.txt")
+    try:
+        t0 = time.perf_counter()
+        next_n = write_log(path, args.size_mb)
+        print(f"log            {os.path.getsize(path) / 2**20:.0f} MB, {next_n} lines "
+              f"(written in {time.perf_counter() - t0:.1f} s)")
+
+        t0 = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        read_ms = (time.perf_counter() - t0) * 1000
+        del text
+        print(f"legacy read    {read_ms:8.0f} ms per 2 s tick (whole file, every tick)")
+
+        small = os.path.join(tmp, "small.txt")
+        write_log(small, args.view_mb)
+        with open(small, "r", encoding="utf-8") as f:
+            text = f.read()
+        view = QTextEdit()
+        view.setReadOnly(True)
+        t0 = time.perf_counter()
+        view.setPlainText(text)
+        app.processEvents()
+        print(f"legacy view    {(time.perf_counter() - t0) * 1000:8.0f} ms setPlainText of {args.view_mb} MB "
+              f"(grows with the file)")
+        del text, view
+        os.remove(small)
+
+        tail = LogTail(path)
+        t0 = time.perf_counter()
+        text, reset = tail.poll()
+        open_ms = (time.perf_counter() - t0) * 1000
+        print(f"tail open      {open_ms:8.2f} ms, {tail.bytes_read / 1024:.0f} KB read, "
+              f"{len(text.splitlines())} lines shown")
+
+        pane = QPlainTextEdit()
+        pane.setReadOnly(True)
+        pane.setMaximumBlockCount(5000)
+        pane.appendPlainText(text)
+        before = tail.bytes_read
+        times, got = [], []
+        for _ in range(args.bursts):
+            start = next_n
+            next_n = append_lines(path, next_n, args.lines)
+            t0 = time.perf_counter()
+            text, _ = tail.poll()
+            pane.appendPlainText(text)
+            times.append(time.perf_counter() - t0)
+            got += numbers(text)
+        app.processEvents()
+        times.sort()
+        ok = got == list(range(next_n - args.bursts * args.lines, next_n))
+        print(f"follow         {1000 * sum(times) / len(times):8.2f} ms avg, {1000 * times[-1]:.2f} ms max per "
+              f"{args.lines}-line burst; {(tail.bytes_read - before) / 1024:.0f} KB read; "
+              f"view {pane.blockCount()} blocks; lines intact: {ok}")
+        tail.close()
+
+        follower = LogFollower(path, debounce_ms=20, fallback_ms=0)
+        seen = []
+        follower.appended.connect(lambda text: seen.extend(numbers(text)))
+        follower.start()
+        latencies = []
+        for _ in range(20):
+            seen.clear()
+            want = next_n + 49
+            t0 = time.perf_counter()
+            next_n = append_lines(path, next_n, 50)
+            if wait_for(app, lambda: seen and seen[-1] == want):
+                latencies.append(time.perf_counter() - t0)
+        latencies.sort()
+        print(f"notify         {1000 * latencies[len(latencies) // 2]:8.1f} ms median write-to-view "
+              f"({len(latencies)}/20 delivered, 20 ms debounce, no polling timer)")
+
+        seen.clear()
+        resets = []
+        follower.reset.connect(lambda: resets.append(1))
+        first = next_n
+        next_n = append_lines(path, next_n, 30)         # written just before rotation
+        os.replace(path, path + ".1")
+        next_n = append_lines(path, next_n, 30)         # the new file
+        wait_for(app, lambda: seen and seen[-1] == next_n - 1)
+        print(f"rotate         lines intact across rotation: {seen == list(range(first, next_n))}")
+
+        seen.clear()
+        with open(path, "w", encoding="utf-8"):
+            pass
+        next_n = append_lines(path, 0, 10)
+        wait_for(app, lambda: resets and seen and seen[-1] == 9)
+        print(f"truncate       view reset: {bool(resets)}, lines after: {seen == list(range(10))}")
+        follower.stop()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+bench_manager_log.py
+
+The manager log, old and new, with --entries log lines (2 million by
+default) from a handful of sources:
+
+    legacy     – list.append + HTML QTextEdit.append per entry, as
+                 append_manager_log did (--legacy entries of it, then
+                 extrapolated)
+    append     – ManagerLog.append on the calling thread, and how long the
+                 writer thread needs to get everything on disk
+    view       – ManagerLogView over all of it: first paint, jumping to
+                 random rows (page fetches), scrolling to the end
+    filter     – query_ids for a rare and a common substring, a source and
+                 a 2-letter text, with the trigram index and without (a
+                 second store with fts=False, --scan-entries rows)
+
+Usage:
+    python benchmarks/bench_manager_log.py
+    python benchmarks/bench_manager_log.py --entries 500000 --scan-entries 200000
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QTextEdit
+
+from manager_parts.manager_log import ManagerLog, ManagerLogView
+
+SOURCES = ["manager", "voice", "terminal", "notifier", "tools"]
+MESSAGES = [
+    "[Voice][stdout] heard: open {app}",
+    "Started voice activation",
+    "Dispatched voice activation to terminal",
+    "[Voice][stdout] wake word score 0.{n:04d}",
+    "Refreshed Delta logs",
+    "[Tools] AppLauncher took {n} ms",
+    "Saved commands.json",
+    "[Voice][stderr] ALSA underrun on device {n}",
+]
+APPS = ["chrome", "spotify", "discord", "notepad", "steam", "vscode"]
+
+
+def message(i: int, rng: random.Random) -> tuple:
+    text = MESSAGES[i % len(MESSAGES)].format(app=APPS[i % len(APPS)], n=rng.randrange(10000))
+    if i % 250_000 == 17:
+        text += " needle-7f3a"                      # the rare term
+    level = "error" if "stderr" in text else "info"
+    return text, SOURCES[i % len(SOURCES)], level
+
+
+def spin(app, seconds: float):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--entries", type=int, default=2_000_000)
+    ap.add_argument("--scan-entries", type=int, default=500_000, help="rows in the no-FTS store")
+    ap.add_argument("--legacy", type=int, default=20_000)
+    args = ap.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(7)
+    tmp = tempfile.mkdtemp(prefix="manager_log_")
+    try:
+        # legacy: unbounded list + HTML append
+        view, kept = QTextEdit(), []
+        view.setReadOnly(True)
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        for i in range(args.legacy):
+            text, _, level = message(i, rng)
+            entry = f"[2026-10-17 12:00:00] {text}"
+            kept.append(entry)
+            view.append(f'<span style="color:{"red" if level == "error" else "white"}">{entry}</span>')
+        secs = time.perf_counter() - t0
+        mem = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        per_m = secs / args.legacy * 1e6
+        print(f"legacy     {secs / args.legacy * 1e6:7.1f} us/entry, {args.legacy:,} entries in {secs:.1f} s "
+              f"(~{per_m / 60:.0f} min of GUI time per million); list alone {mem / args.legacy:.0f} B/entry, "
+              f"never freed")
+        del view, kept
+
+        # new: ring + batched SQLite writer
+        path = os.path.join(tmp, "manager_log.sqlite")
+        log = ManagerLog(path, echo=False)
+        rows = [message(i, rng) for i in range(args.entries)]
+        t0 = time.perf_counter()
+        for text, source, level in rows:
+            log.append(text, source, level)
+        append_s = time.perf_counter() - t0
+        log.flush(timeout=600)
+        written_s = time.perf_counter() - t0
+        print(f"append     {append_s / args.entries * 1e6:7.2f} us/entry on the caller, {args.entries:,} on disk "
+              f"after {written_s:.1f} s, db {os.path.getsize(path) / 2**20:.0f} MB, ring holds {log.capacity:,}")
+        del rows
+
+        # view over everything
+        t0 = time.perf_counter()
+        lv = ManagerLogView(log)
+        lv.resize(900, 600)
+        lv.show()
+        app.processEvents()
+        first_ms = (time.perf_counter() - t0) * 1000
+        model = lv.model
+        jumps = []
+        for _ in range(50):
+            row = rng.randrange(model.rowCount())
+            t0 = time.perf_counter()
+            lv.list.scrollTo(model.index(row))
+            app.processEvents()
+            jumps.append(time.perf_counter() - t0)
+        jumps.sort()
+        t0 = time.perf_counter()
+        lv.list.scrollToBottom()
+        app.processEvents()
+        bottom_ms = (time.perf_counter() - t0) * 1000
+        print(f"view       {model.rowCount():,} rows, first paint {first_ms:.0f} ms, random jump median "
+              f"{jumps[len(jumps) // 2] * 1000:.1f} ms / max {jumps[-1] * 1000:.1f} ms, to bottom {bottom_ms:.1f} ms")
+
+        # live appends reach the view
+        before = model.rowCount()
+        for i in range(1000):
+            log.append(f"live entry {i}", "manager")
+        spin(app, 0.4)
+        print(f"live       +{model.rowCount() - before} rows after a 200 ms tick")
+
+        # filters (trigram index)
+        cases = [("rare text", dict(text="needle-7f3a")), ("common text", dict(text="discord")),
+                 ("source", dict(source="voice")), ("2 letters", dict(text="zz")),
+                 ("text+level", dict(text="underrun", level="error"))]
+        for name, kw in cases:
+            t0 = time.perf_counter()
+            ids = log.query_ids(**kw)
+            print(f"filter     {name:<11} {len(ids):>9,} matches in {(time.perf_counter() - t0) * 1000:7.1f} ms (trigram)")
+
+        done = []
+        model.filtered.connect(lambda n, s: done.append((n, s)))
+        t0 = time.perf_counter()
+        model.set_filter("needle-7f3a")
+        while not done:
+            app.processEvents()
+        print(f"view       filtered to {done[0][0]} rows in {(time.perf_counter() - t0) * 1000:.0f} ms end to end")
+        lv.close()
+        log.close()
+
+        # the same filters scanning, on a smaller store without the index
+        scan = ManagerLog(os.path.join(tmp, "scan.sqlite"), echo=False, fts=False)
+        for i in range(args.scan_entries):
+            scan.append(*message(i, rng))
+        scan.flush(timeout=600)
+        for name, kw in cases:
+            t0 = time.perf_counter()
+            ids = scan.query_ids(**kw)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"scan       {name:<11} {len(ids):>9,} matches in {ms:7.1f} ms over {args.scan_entries:,} rows "
+                  f"(~{ms * args.entries / args.scan_entries:.0f} ms at {args.entries:,})")
+        scan.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
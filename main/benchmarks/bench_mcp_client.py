@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+bench_mcp_client.py
+
+docker_mcp call throughput against local stub servers (mcp_stub.py):
+
+    legacy       – requests.post per call, new TCP connection each time
+    pooled       – McpClient, one thread
+    pooled x N   – McpClient shared by N threads
+    async x N    – AsyncMcpClient, N calls in flight
+
+then two failure cases on two stubs: one answering 503 at --fail-rate,
+and one going down (and being health-checked back) mid-run.
+
+Usage:
+    python benchmarks/bench_mcp_client.py
+    python benchmarks/bench_mcp_client.py --calls 2000 --concurrency 16 --delay-ms 2
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from mcp_stub import start_stub
+from tools.mcp_client import McpClient, AsyncMcpClient, McpError
+
+
+def report(label, calls, seconds, stubs, errors=0):
+    conns = sum(s.connections for s in stubs)
+    print(f"{label:24} {calls / seconds:8.0f} calls/s   {seconds * 1000 / calls:6.2f} ms/call   "
+          f"{conns:5} connections   {errors} errors")
+    for s in stubs:
+        s.reset_counts()
+
+
+def legacy(url, calls):
+    for i in range(calls):
+        r = requests.post(f"{url}/invoke", json={"query": f"q{i}"}, timeout=60)
+        r.raise_for_status()
+        r.json()
+
+
+def threaded(client, calls, workers):
+    errors = 0
+    with ThreadPoolExecutor(workers) as pool:
+        for f in [pool.submit(client.invoke, f"q{i}") for i in range(calls)]:
+            try:
+                f.result()
+            except McpError:
+                errors += 1
+    return errors
+
+
+async def run_async(urls, calls, workers):
+    sem = asyncio.Semaphore(workers)
+    errors = 0
+
+    async with AsyncMcpClient(urls, pool_size=workers) as client:
+        async def one(i):
+            nonlocal errors
+            async with sem:
+                try:
+                    await client.invoke(f"q{i}")
+                except McpError:
+                    errors += 1
+        await asyncio.gather(*(one(i) for i in range(calls)))
+    return errors
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=1000)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--delay-ms", type=float, default=1.0, help="server-side work per call")
+    ap.add_argument("--fail-rate", type=float, default=0.2)
+    args = ap.parse_args()
+    n, w = args.calls, args.concurrency
+
+    stub = start_stub(delay_ms=args.delay_ms)
+    dt, _ = timed(lambda: legacy(stub.url, n))
+    report("legacy requests.post", n, dt, [stub])
+
+    client = McpClient(stub.url, pool_size=w)
+    dt, _ = timed(lambda: [client.invoke(f"q{i}") for i in range(n)])
+    report("pooled", n, dt, [stub])
+    dt, errors = timed(lambda: threaded(client, n, w))
+    report(f"pooled x {w} threads", n, dt, [stub], errors)
+    client.close()
+
+    dt, errors = timed(lambda: asyncio.run(run_async(stub.url, n, w)))
+    report(f"async x {w}", n, dt, [stub], errors)
+
+    flaky = start_stub(delay_ms=args.delay_ms, fail_rate=args.fail_rate)
+    urls = [stub.url, flaky.url]
+    client = McpClient(urls, pool_size=w, backoff=0.01, cooldown=0.5)
+    dt, errors = timed(lambda: threaded(client, n, w))
+    report(f"2 stubs, {args.fail_rate:.0%} 503 on one", n, dt, [stub, flaky], errors)
+
+    def outage():
+        with ThreadPoolExecutor(w) as pool:
+            futures = [pool.submit(client.invoke, f"q{i}") for i in range(n // 2)]
+            flaky.set_unhealthy(True)
+            flaky.server.fail_rate = 0.0
+            futures += [pool.submit(client.invoke, f"q{i}") for i in range(n // 2)]
+            errs = 0
+            for f in futures:
+                try:
+                    f.result()
+                except McpError:
+                    errs += 1
+        return errs
+    dt, errors = timed(outage)
+    parked = [e.url for e in client.endpoints if not e.available(time.monotonic())]
+    report("2 stubs, one goes down", n, dt, [stub, flaky], errors)
+    flaky.set_unhealthy(False)
+    health = client.check_health()
+    print(f"{'':24} parked after outage: {len(parked)}   health check -> {sum(health.values())}/{len(health)} up")
+
+    client.close()
+    stub.stop()
+    flaky.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
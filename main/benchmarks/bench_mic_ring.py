@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+bench_mic_ring.py
+
+Capture-path throughput and allocations: the old fan-out (callback bytes ->
+queue.Queue -> consumers, phrases rebuilt with b"".join) against MicSystem's
+ring buffer with one zero-copy reader per consumer.
+
+Runs headless: a fake PyAudio stream replays WAV files (or generated audio)
+through MicSystem's stream callback, paced at --speed times real time like a
+sped-up sound card. Three consumers per path: a VAD-style phrase collector
+(3 s phrases), a wake-word style frame scan and a level meter.
+
+Reported per path: CPU time spent per second of audio (the number that
+matters for an always-on mic), wall-clock throughput, peak traced memory
+and reader overruns.
+
+Usage:
+    python benchmarks/bench_mic_ring.py                      # 120 s synthetic audio
+    python benchmarks/bench_mic_ring.py rec1.wav rec2.wav
+    python benchmarks/bench_mic_ring.py --chunk 480 --speed 50
+"""
+
+import sys
+import time
+import queue
+import types
+import argparse
+import threading
+import tracemalloc
+
+import numpy as np
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from wav_utils import load_wav, iter_chunks, synth_speech
+
+try:
+    import pyaudio  # noqa: F401
+except ImportError:
+    # only the constants MicSystem touches; the stream itself is faked below
+    sys.modules["pyaudio"] = types.SimpleNamespace(paInt16=8, paContinue=0, PyAudio=None)
+
+from parts.mic_system import MicSystem
+
+PHRASE_SECONDS = 3.0
+
+
+class FakeStream:
+    def __init__(self, chunks, callback, frames, interval):
+        self.chunks = chunks
+        self.callback = callback
+        self.frames = frames
+        self.interval = interval
+        self.finished = threading.Event()
+        self._thread = None
+
+    def start_stream(self):
+        def pump():
+            pace(self.chunks, lambda chunk: self.callback(chunk, self.frames, {}, 0), self.interval)
+            self.finished.set()
+        self._thread = threading.Thread(target=pump, daemon=True)
+        self._thread.start()
+
+    def stop_stream(self):
+        self.finished.wait()
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    """PyAudio stand-in whose input stream replays fixed chunks (as PortAudio would hand us bytes)."""
+    def __init__(self, chunks, interval):
+        self.chunks = chunks
+        self.interval = interval
+
+    def open(self, frames_per_buffer=1024, stream_callback=None, **kwargs):
+        return FakeStream(self.chunks, stream_callback, frames_per_buffer, self.interval)
+
+
+def pace(chunks, deliver, interval):
+    t_next = time.perf_counter()
+    for chunk in chunks:
+        deliver(chunk)
+        t_next += interval
+        delay = t_next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _scan(chunk):
+    return int(np.frombuffer(chunk, dtype=np.int16)[::160].sum())
+
+
+def _level(chunk):
+    s = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+    return float(np.sqrt(np.mean(s * s))) if s.size else 0.0
+
+
+def run_legacy(chunks, rate, interval):
+    q = queue.Queue()
+    phrase_chunks = int(PHRASE_SECONDS * rate * 2 / len(chunks[0]))
+    done = threading.Event()
+    phrases = [0]
+
+    def consumer():
+        buf = []
+        for _ in range(len(chunks)):
+            chunk = q.get()
+            buf.append(chunk)
+            if len(buf) >= phrase_chunks:
+                phrase = b"".join(buf)
+                phrases[0] += len(phrase) > 0
+                buf = []
+            _scan(chunk)
+            _level(chunk)
+        done.set()
+
+    t = threading.Thread(target=consumer, daemon=True)
+    t.start()
+    t0 = time.perf_counter()
+    pace(chunks, q.put, interval)   # q.put is what ChatAI._audio_callback used to do
+    done.wait()
+    return time.perf_counter() - t0, phrases[0], 0
+
+
+def run_ring(chunks, rate, interval):
+    mic = MicSystem(rate=rate, chunk_size=len(chunks[0]) // 2, pa=FakePyAudio(chunks, interval))
+    n = len(chunks[0])
+    total = n * len(chunks)
+    phrase_bytes = int(PHRASE_SECONDS * rate) * 2
+    readers = [mic.reader() for _ in range(3)]
+    phrases = [0]
+
+    def vad_consumer(reader):
+        start = reader.pos
+        while reader.pos < total:
+            if reader.read(n, timeout=2) is None:
+                break
+            if reader.pos - start >= phrase_bytes:
+                phrase = mic.ring.view(start, reader.pos - start)   # whole phrase, no join
+                phrases[0] += len(phrase) > 0
+                start = reader.pos
+
+    def scan_consumer(reader, fn):
+        while reader.pos < total:
+            chunk = reader.read(n, timeout=2)
+            if chunk is None:
+                break
+            fn(chunk)
+
+    threads = [threading.Thread(target=vad_consumer, args=(readers[0],), daemon=True),
+               threading.Thread(target=scan_consumer, args=(readers[1], _scan), daemon=True),
+               threading.Thread(target=scan_consumer, args=(readers[2], _level), daemon=True)]
+    for t in threads:
+        t.start()
+    t0 = time.perf_counter()
+    mic.start_stream()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    mic.stop_stream()
+    return elapsed, phrases[0], sum(r.overruns for r in readers)
+
+
+def measure(name, fn, chunks, rate, interval):
+    cpu0 = time.process_time()
+    wall, phrases, overruns = fn(chunks, rate, interval)
+    cpu = time.process_time() - cpu0
+    tracemalloc.start()
+    fn(chunks, rate, interval)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    mb = len(chunks) * len(chunks[0]) / 1e6
+    audio_s = mb * 1e6 / 2 / rate
+    print(f"{name:6} CPU {cpu / audio_s * 1000:6.2f} ms per audio second  {mb / wall:6.1f} MB/s  "
+          f"peak traced {peak / 1024:7.1f} KiB  phrases {phrases}  overruns {overruns}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("wavs", nargs="*")
+    ap.add_argument("--synthetic", type=float, default=0.0, help="seconds of generated audio")
+    ap.add_argument("--chunk", type=int, default=1024, help="frames per PortAudio buffer")
+    ap.add_argument("--speed", type=float, default=100.0, help="replay speed, x real time")
+    args = ap.parse_args()
+
+    inputs = [load_wav(p) for p in args.wavs]
+    if args.synthetic or not inputs:
+        inputs.append((synth_speech(args.synthetic or 120.0), 16000))
+
+    for pcm, rate in inputs:
+        # PortAudio hands over a new bytes object per buffer; do the same
+        chunks = [bytes(c) for c in iter_chunks(pcm, args.chunk)]
+        interval = args.chunk / rate / args.speed
+        print(f"\n{len(pcm) / 2 / rate:.1f} s @ {rate} Hz, {args.chunk}-frame buffers, "
+              f"x{args.speed:g} real time, 3 consumers")
+        measure("queue", run_legacy, chunks, rate, interval)
+        measure("ring", run_ring, chunks, rate, interval)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+bench_opencode_client.py
+
+OpenCodeClient against opencode_fake.py:
+
+    attach     – a fake server is already running: turns over one session
+                 and kept-alive connections versus a new session + new
+                 connection per turn; time to first streamed part vs the
+                 full reply
+    restart    – the server forgets its sessions; the next turn recreates one
+    spawn      – the fake as the `opencode` binary: time until serve is
+                 ready (its "listening on" line, port 0)
+    fallback   – serve fails to start; the prompt goes through `run`
+
+Usage:
+    python benchmarks/bench_opencode_client.py
+    python benchmarks/bench_opencode_client.py --turns 20 --word-ms 5
+"""
+
+import os
+import sys
+import stat
+import time
+import shutil
+import argparse
+import tempfile
+
+import requests
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from opencode_fake import start_fake
+from tools.opencode_module import OpenCodeClient
+
+PROMPT = "rename the helper in manager.py and update its callers"
+
+
+def fake_binary(tmp: str) -> str:
+    """Executable that runs opencode_fake.py with this interpreter."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opencode_fake.py")
+    if os.name == "nt":
+        path = os.path.join(tmp, "opencode.cmd")
+        with open(path, "w") as f:
+            f.write(f'@"{sys.executable}" "{script}" %*\n')
+    else:
+        path = os.path.join(tmp, "opencode")
+        with open(path, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def one_shot(url: str, prompt: str) -> str:
+    """New session and new connection per turn."""
+    sid = requests.post(f"{url}/session", json={}, timeout=5).json()["id"]
+    r = requests.post(f"{url}/session/{sid}/message", json={"parts": [{"type": "text", "text": prompt}]}, timeout=60)
+    return OpenCodeClient._message_text(r.json())
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--turns", type=int, default=10)
+    ap.add_argument("--word-ms", type=float, default=10.0, help="fake generation time per word")
+    args = ap.parse_args()
+
+    fake = start_fake(word_ms=args.word_ms)
+    expected = f"OK: {PROMPT}"
+
+    t0 = time.perf_counter()
+    for _ in range(args.turns):
+        assert one_shot(fake.url, PROMPT) == expected
+    old_ms = (time.perf_counter() - t0) * 1000 / args.turns
+    print(f"one-shot       {old_ms:7.1f} ms/turn   {fake.sessions} sessions, {fake.connections} connections")
+
+    s0, c0 = fake.sessions, fake.connections
+    client = OpenCodeClient(host=fake.host, port=fake.port)
+    firsts, totals, pieces = [], [], []
+    for _ in range(args.turns):
+        t0 = time.perf_counter()
+        first = []
+        reply = client.ask(PROMPT, on_part=lambda text: (first.append(time.perf_counter()), pieces.append(text)))
+        totals.append(time.perf_counter() - t0)
+        firsts.append((first[0] if first else time.perf_counter()) - t0)
+        assert reply == expected, reply
+    streamed = "".join(pieces[-len(expected.split()):]) if pieces else ""
+    print(f"attached       {sum(totals) * 1000 / args.turns:7.1f} ms/turn   {fake.sessions - s0} session, "
+          f"{fake.connections - c0} connections (requests + one event stream)")
+    print(f"               first part after {sum(firsts) * 1000 / args.turns:5.1f} ms   "
+          f"streamed text intact: {streamed.replace(' ', '') == expected.replace(' ', '')}")
+
+    fake.restart()
+    reply = client.ask(PROMPT)
+    print(f"restart        reply ok: {reply == expected}   session recreated: {client.session_id}")
+    client.close()
+    fake.stop()
+
+    tmp = tempfile.mkdtemp(prefix="opencode_fake_")
+    try:
+        binary = fake_binary(tmp)
+        spawned = OpenCodeClient(binary=binary, port=0)
+        t0 = time.perf_counter()
+        spawned.ensure_server()
+        ready_ms = (time.perf_counter() - t0) * 1000
+        reply = spawned.ask(PROMPT)
+        print(f"spawn          ready after {ready_ms:6.1f} ms at {spawned.base_url}   reply ok: {reply == expected}")
+        spawned.close()
+
+        os.environ["OPENCODE_FAKE_NO_SERVE"] = "1"
+        fallback = OpenCodeClient(binary=binary, port=0)
+        t0 = time.perf_counter()
+        reply = fallback.ask(PROMPT)
+        print(f"fallback       run mode reply ok: {reply == expected}   ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+        fallback.close()
+    finally:
+        os.environ.pop("OPENCODE_FAKE_NO_SERVE", None)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
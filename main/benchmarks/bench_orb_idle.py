@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+bench_orb_idle.py
+
+Orb render cost while silent versus while speaking, using the widget's own
+render_stats() counters. The orb is shown on the offscreen platform (no
+display needed) and runs its normal timer: first at level 0, then with
+random speech levels every 200 ms like the mouth.py demo.
+
+Usage:
+    python benchmarks/bench_orb_idle.py
+    python benchmarks/bench_orb_idle.py --nodes 200 --seconds 5
+"""
+
+import os
+import sys
+import random
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+
+from parts.mouth import ReactiveWireframe2DCircle
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, default=50)
+    ap.add_argument("--seconds", type=float, default=4.0, help="per phase")
+    args = ap.parse_args()
+
+    app = QApplication(sys.argv)
+    orb = ReactiveWireframe2DCircle(n_nodes=args.nodes, diameter=300)
+    orb.show()
+    ms = int(args.seconds * 1000)
+
+    speech = QTimer()
+    speech.timeout.connect(lambda: orb.setLevel(random.uniform(0.3, 1.0)))
+
+    def report(phase):
+        s = orb.render_stats()
+        print(f"{phase:8} timer {s['timer_fps']:>2} fps  rendered {s['render_fps']:5.1f} fps  "
+              f"{s['avg_render_ms']:6.2f} ms/frame  GUI-thread CPU {s['cpu_percent']:5.1f}%")
+        orb.reset_render_stats()
+
+    def start_speaking():
+        report("silent")
+        speech.start(200)
+
+    QTimer.singleShot(0, orb.reset_render_stats)
+    QTimer.singleShot(ms, start_speaking)
+    QTimer.singleShot(2 * ms, lambda: (speech.stop(), report("speaking"), app.quit()))
+    app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
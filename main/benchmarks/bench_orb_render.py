@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+bench_orb_render.py
+
+Orb frame time against node count, rendered offscreen (no window, no
+display needed). Each frame is a full paintEvent into a QImage via
+QWidget.render(). The old per-pair loop is timed next to it up to
+--legacy-max nodes; it is quadratic in Python and takes minutes beyond that.
+
+Usage:
+    python benchmarks/bench_orb_render.py
+    python benchmarks/bench_orb_render.py --nodes 50 200 1000 --threshold 0.3
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QImage, QPainter, QPen, QColor
+
+from parts.mouth import ReactiveWireframe2DCircle
+
+
+def legacy_paint(orb, image):
+    """paintEvent as it was before edge_pairs(): np.linalg.norm twice per pair, one drawLine per edge."""
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    w, h = orb.width(), orb.height()
+    center = np.array([w/2, h/2])
+    disp = orb.positions * (w/2 * 0.9) * orb.scale + center
+    pen = QPen(orb.edge_color)
+    pen.setWidth(1)
+    painter.setPen(pen)
+    for i in range(orb.n_nodes):
+        xi, yi = disp[i]
+        for j in range(i+1, orb.n_nodes):
+            xj, yj = disp[j]
+            if np.linalg.norm(orb.positions[i] - orb.positions[j]) < orb.threshold:
+                alpha = int(255 * (1 - np.linalg.norm(orb.positions[i] - orb.positions[j]) / orb.threshold))
+                pen.setColor(QColor(255, 255, 255, alpha))
+                painter.setPen(pen)
+                painter.drawLine(int(xi), int(yi), int(xj), int(yj))
+    pen = QPen(orb.node_color)
+    pen.setWidth(2)
+    painter.setPen(pen)
+    for x, y in disp:
+        painter.drawEllipse(int(x - orb.node_radius), int(y - orb.node_radius),
+                            orb.node_radius*2, orb.node_radius*2)
+    painter.end()
+
+
+def time_frames(render, frames):
+    times = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        render()
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, nargs="*", default=[50, 100, 250, 500, 1000, 2000])
+    ap.add_argument("--threshold", type=float, default=0.6)
+    ap.add_argument("--diameter", type=int, default=600)
+    ap.add_argument("--frames", type=int, default=10)
+    ap.add_argument("--legacy-max", type=int, default=250)
+    args = ap.parse_args()
+
+    app = QApplication(sys.argv)  # noqa: F841
+    np.random.seed(0)
+    print(f"threshold {args.threshold}, {args.diameter}px, median of {args.frames} frames")
+    print(f"{'nodes':>6} {'edges':>8} {'frame ms':>9} {'legacy ms':>10}")
+    for n in args.nodes:
+        orb = ReactiveWireframe2DCircle(n_nodes=n, threshold=args.threshold, diameter=args.diameter)
+        orb.timer.stop()
+        image = QImage(orb.size(), QImage.Format_ARGB32_Premultiplied)
+
+        def render():
+            image.fill(0)
+            orb.invalidate()    # force a full re-render rather than the cached frame
+            orb.render(image)
+
+        new = time_frames(render, args.frames)
+        d = np.linalg.norm(orb.positions[:, None] - orb.positions[None], axis=2)
+        edges = int(np.triu(d < orb.threshold, 1).sum())
+        legacy = "-"
+        if n <= args.legacy_max:
+            def render_legacy():
+                image.fill(0)
+                legacy_paint(orb, image)
+            legacy = f"{time_frames(render_legacy, max(1, args.frames // 3)):.1f}"
+        print(f"{n:6d} {edges:8d} {new:9.1f} {legacy:>10}")
+        orb.deleteLater()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_orb_step.py
+
+Orb physics step time against node count, headless (no widget, no Qt
+event loop). Compares the old per-node loop (np.linalg.norm + np.dot per
+node) with the vectorized step_nodes(), and reports how many nodes fit in
+a 60 fps frame budget.
+
+Usage:
+    python benchmarks/bench_orb_step.py
+    python benchmarks/bench_orb_step.py --nodes 100 1000 10000 --steps 500
+"""
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from parts.mouth import step_nodes
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def legacy_step(positions, velocities):
+    positions += velocities
+    for i, pos in enumerate(positions):
+        r = np.linalg.norm(pos)
+        if r > 1.0:
+            normal = pos / r
+            v = velocities[i]
+            velocities[i] = v - 2 * np.dot(v, normal) * normal
+            positions[i] = normal * 1.0
+
+
+def init_nodes(n, seed=0):
+    # same distribution as ReactiveWireframe2DCircle.__init__
+    rng = np.random.default_rng(seed)
+    angles = rng.uniform(0, 2*np.pi, n)
+    radii = np.sqrt(rng.uniform(0, 1, n))
+    positions = np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+    ang_vels = rng.uniform(0, 2*np.pi, n)
+    speeds = rng.uniform(0.002, 0.01, n)
+    velocities = np.column_stack((np.cos(ang_vels), np.sin(ang_vels))) * speeds[:, None]
+    return positions, velocities
+
+
+def time_steps(step, n, steps):
+    positions, velocities = init_nodes(n)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        step(positions, velocities)
+    return (time.perf_counter() - t0) / steps * 1000, positions, velocities
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, nargs="*", default=[50, 200, 1000, 5000, 20000])
+    ap.add_argument("--steps", type=int, default=300)
+    ap.add_argument("--legacy-max", type=int, default=5000)
+    args = ap.parse_args()
+
+    print(f"{'nodes':>7} {'step ms':>9} {'legacy ms':>10} {'speedup':>8}  same result")
+    for n in args.nodes:
+        new, pos_new, vel_new = time_steps(step_nodes, n, args.steps)
+        row = f"{n:7d} {new:9.3f}"
+        if n <= args.legacy_max:
+            old, pos_old, vel_old = time_steps(legacy_step, n, max(1, args.steps // 10))
+            # both paths must produce the same trajectory
+            pos_chk, vel_chk = init_nodes(n)
+            for _ in range(max(1, args.steps // 10)):
+                step_nodes(pos_chk, vel_chk)
+            same = np.allclose(pos_chk, pos_old) and np.allclose(vel_chk, vel_old)
+            row += f" {old:10.3f} {old / new:7.1f}x  {same}"
+        print(row)
+    fit = max((n for n in args.nodes if time_steps(step_nodes, n, 50)[0] < FRAME_BUDGET_MS), default=0)
+    print(f"largest tested node count stepping within a 60 fps frame ({FRAME_BUDGET_MS:.1f} ms): {fit}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
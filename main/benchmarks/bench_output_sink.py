@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+bench_output_sink.py
+
+Stress test for the terminal panes at 100 MB/s of child output, with a
+10 ms QTimer standing in for the GUI (its longest gap = longest freeze).
+
+    legacy       – the old readyRead handler on each 64 KB chunk:
+                   decode, rstrip, appendPlainText into an uncapped pane
+                   (--legacy-mb of it; it cannot keep up with 100 MB/s)
+    sink         – OutputSink fed the same chunks, paced at --rate MB/s
+                   for --seconds, inside the event loop
+    child        – a real child process writing --rate MB/s through
+                   QProcess into OutputSink, the way the terminals do
+
+Each line reports throughput, the longest GUI gap, the pane's block
+count and the scrollback size on disk.
+
+Usage:
+    python benchmarks/bench_output_sink.py
+    python benchmarks/bench_output_sink.py --rate 200 --seconds 5
+"""
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtCore import QEventLoop, QProcess, QTimer
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+
+from manager_parts.output_sink import OutputSink, SCROLLBACK_DIR
+
+CHUNK = 64 * 1024
+LINE = "[{:08d}] step 42/100  loss=0.0317  lr=3.0e-4  ▮▮▮▮▮▮▯▯▯▯  tokens/s=18234  eta 00:12:31\n"
+
+CHILD = r"""
+import sys, time
+rate, seconds = float(sys.argv[1]) * 1024 * 1024, float(sys.argv[2])
+line = "{:08d} child output line, some text to make it realistic: lorem ipsum dolor sit amet ✓\n"
+block = "".join(line.format(i) for i in range(1000)).encode()
+out = sys.stdout.buffer
+sent, t0 = 0, time.perf_counter()
+while time.perf_counter() - t0 < seconds:
+    out.write(block)
+    sent += len(block)
+    ahead = sent / rate - (time.perf_counter() - t0)
+    if ahead > 0:
+        time.sleep(ahead)
+out.write(b"END\n")
+out.flush()
+"""
+
+
+def make_chunks(total_mb: float) -> list:
+    text = "".join(LINE.format(i) for i in range(20000)).encode()
+    chunks, n = [], int(total_mb * 1024 * 1024 / CHUNK)
+    for i in range(n):
+        start = (i * CHUNK) % (len(text) - CHUNK)
+        chunks.append(text[start:start + CHUNK])     # cuts lines and UTF-8 characters anywhere
+    return chunks
+
+
+class Ticker:
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(10)
+        self.timer.timeout.connect(self.tick)
+        self.last, self.max_gap = None, 0.0
+
+    def start(self):
+        self.last, self.max_gap = time.perf_counter(), 0.0
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self.last)
+        self.last = now
+
+    def stop(self) -> float:
+        self.tick()
+        self.timer.stop()
+        return self.max_gap
+
+
+def pane() -> QPlainTextEdit:
+    view = QPlainTextEdit()
+    view.setReadOnly(True)
+    view.resize(900, 500)
+    view.show()
+    return view
+
+
+def spin(app, predicate, timeout: float):
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < deadline:
+        QTimer.singleShot(1, loop.quit)
+        loop.exec_()
+
+
+def scrollback_mb(sink) -> float:
+    path = sink.scrollback_file()
+    size = os.path.getsize(path) if path and os.path.exists(path) else 0
+    if path and os.path.exists(path + ".1"):
+        size += os.path.getsize(path + ".1")
+    return size / 2**20
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rate", type=float, default=100.0, help="MB/s of output")
+    ap.add_argument("--seconds", type=float, default=3.0)
+    ap.add_argument("--legacy-mb", type=float, default=10.0)
+    args = ap.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # legacy: append every chunk as it arrives
+    view = pane()
+    chunks = make_chunks(args.legacy_mb)
+    t0 = time.perf_counter()
+    for chunk in chunks:
+        view.appendPlainText(bytes(chunk).decode(errors="replace").rstrip())
+        app.processEvents()
+    secs = time.perf_counter() - t0
+    print(f"legacy   {args.legacy_mb / secs:7.1f} MB/s max, {args.legacy_mb:.0f} MB took {secs:5.2f} s "
+          f"({args.rate * secs / args.legacy_mb:.1f} s of GUI time per second at {args.rate:.0f} MB/s), "
+          f"pane holds {view.blockCount()} blocks (uncapped)")
+    view.close()
+
+    # sink, fed in-process at the target rate
+    view = pane()
+    sink = OutputSink(view=view, name="bench_sink")
+    chunks = make_chunks(min(args.rate, 64))         # reused round-robin
+    rate = args.rate * 1024 * 1024
+    state = {"sent": 0, "i": 0}
+    t0 = time.perf_counter()
+
+    def produce():
+        due = min(rate * (time.perf_counter() - t0), rate * args.seconds)
+        while state["sent"] < due:
+            sink.feed(chunks[state["i"] % len(chunks)])
+            state["i"] += 1
+            state["sent"] += CHUNK
+
+    producer = QTimer()
+    producer.timeout.connect(produce)
+    producer.start(1)
+    ticker = Ticker()
+    ticker.start()
+    spin(app, lambda: state["sent"] >= rate * args.seconds, args.seconds * 20)
+    producer.stop()
+    sink.flush()
+    elapsed = time.perf_counter() - t0
+    print(f"sink     {state['sent'] / 2**20 / elapsed:7.1f} MB/s ({state['sent'] / 2**20:.0f} MB in {elapsed:.2f} s), "
+          f"GUI gap up to {ticker.stop() * 1000:4.0f} ms, {sink.frames} appends, pane {view.blockCount()} blocks, "
+          f"scrollback {scrollback_mb(sink):.0f} MB")
+    sink.close()
+    view.close()
+
+    # real child process through QProcess
+    view = pane()
+    sink = OutputSink(view=view, name="bench_child")
+    proc = QProcess()
+    proc.readyReadStandardOutput.connect(lambda: sink.feed(bytes(proc.readAllStandardOutput()), proc))
+    done = []
+    proc.finished.connect(lambda *a: (sink.end(proc), done.append(time.perf_counter())))
+    ticker.start()
+    t0 = time.perf_counter()
+    proc.start(sys.executable, ["-c", CHILD, str(args.rate), str(args.seconds)])
+    spin(app, lambda: done, args.seconds * 20 + 10)
+    sink.flush()
+    elapsed = (done[0] if done else time.perf_counter()) - t0
+    last = view.document().lastBlock().text()
+    print(f"child    {sink.bytes_in / 2**20 / elapsed:7.1f} MB/s ({sink.bytes_in / 2**20:.0f} MB in {elapsed:.2f} s), "
+          f"GUI gap up to {ticker.stop() * 1000:4.0f} ms, pane {view.blockCount()} blocks ending {last!r}, "
+          f"scrollback {scrollback_mb(sink):.0f} MB")
+    sink.close()
+    for name in ("bench_sink", "bench_child"):
+        for suffix in ("", ".1"):
+            path = os.path.join(SCROLLBACK_DIR, f"{name}.log{suffix}")
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""
+bench_paths.py
+
+Import path setup for the benchmark scripts, which run as plain files
+(python benchmarks/bench_x.py) rather than as modules. Importing it puts
+main/ (parts/, tools/) and the repository root (manager_parts/) on
+sys.path.
+
+Usage:
+    import bench_paths  # noqa: F401
+    from parts.vad_engine import VadEngine
+"""
+
+import os
+import sys
+
+# benchmarks live next to parts/ and tools/
+MAIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if MAIN_DIR not in sys.path:
+    sys.path.insert(0, MAIN_DIR)
+# ...and manager_parts/ sits next to manager.py, one level up
+REPO_DIR = os.path.dirname(MAIN_DIR)
+if REPO_DIR not in sys.path:
+    sys.path.append(REPO_DIR)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+bench_process_table.py
+
+kill_process_tool work with a fake psutil of 5k processes, old code path
+versus ProcessTable:
+
+    list        – "list processes" ten times in a row (old: full
+                  process_iter + format every process each time)
+    list by mem – sorted listing (old code could not sort; shown for cost)
+    find        – "kill process <name>" lookup only, ten times
+    kill        – terminate -> wait -> kill for 20 processes, half of which
+                  ignore terminate(): one at a time versus wait_procs
+
+Each fake per-process call sleeps for --call-us microseconds to stand in
+for the /proc read or Win32 call behind it.
+
+Usage:
+    python benchmarks/bench_process_table.py
+    python benchmarks/bench_process_table.py --procs 10000 --call-us 20
+"""
+
+import sys
+import time
+import random
+import argparse
+from contextlib import contextmanager
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from tools.process_table import ProcessTable
+
+
+class FakePsutil:
+    class NoSuchProcess(Exception):
+        pass
+
+    class AccessDenied(Exception):
+        pass
+
+    class ZombieProcess(NoSuchProcess):
+        pass
+
+    def __init__(self, n: int, call_us: float, seed: int = 1):
+        rng = random.Random(seed)
+        base = ["chrome", "code", "python", "svchost", "explorer", "discord", "node", "java", "spotify", "steam"]
+        self.call_s = call_us / 1e6
+        self.table = {}                 # pid -> [name, rss, alive, stubborn, t_exit]
+        for i in range(n):
+            name = f"{rng.choice(base)}{rng.randint(0, 400)}.exe"
+            self.table[1000 + i] = [name, rng.randint(1, 2000) << 20, True, False, None]
+        self.calls = 0
+        fake = self
+
+        class Process:
+            def __init__(self, pid):
+                fake._call()
+                if pid not in fake.table or not fake._alive(pid):
+                    raise fake.NoSuchProcess(pid)
+                self.pid = pid
+
+            def name(self):
+                fake._call()
+                return fake.table[self.pid][0]
+
+            def status(self):
+                fake._call()
+                return "running" if fake._alive(self.pid) else "zombie"
+
+            def create_time(self):
+                return 1.7e9 + self.pid
+
+            def cpu_percent(self, interval=None):
+                fake._call()
+                return random.random() * 10
+
+            def memory_info(self):
+                fake._call()
+                return type("mem", (), {"rss": fake.table[self.pid][1]})()
+
+            @contextmanager
+            def oneshot(self):
+                yield
+
+            def terminate(self):
+                fake._call()
+                row = fake.table[self.pid]
+                if not row[3]:
+                    row[4] = time.monotonic() + random.uniform(0.0, 0.05)
+
+            def kill(self):
+                fake._call()
+                fake.table[self.pid][4] = time.monotonic()
+
+            def is_running(self):
+                return fake._alive(self.pid)
+
+        self.Process = Process
+
+    def _call(self):
+        self.calls += 1
+        end = time.perf_counter() + self.call_s
+        while time.perf_counter() < end:
+            pass
+
+    def _alive(self, pid) -> bool:
+        row = self.table.get(pid)
+        if row is None:
+            return False
+        if row[4] is not None and time.monotonic() >= row[4]:
+            row[2] = False
+        return row[2]
+
+    def pids(self):
+        return [pid for pid in self.table if self._alive(pid)]
+
+    def process_iter(self, attrs=None):
+        for pid in self.pids():
+            p = self.Process(pid)
+            p.info = {"pid": pid, "name": p.name(), "status": p.status() if "status" in (attrs or ()) else None}
+            yield p
+
+    def wait_procs(self, procs, timeout=None):
+        deadline = time.monotonic() + (timeout or 0)
+        alive = list(procs)
+        gone = []
+        while alive:
+            still = []
+            for p in alive:
+                (gone if not self._alive(p.pid) else still).append(p)
+            alive = still
+            if not alive or time.monotonic() >= deadline:
+                break
+            time.sleep(0.01)
+        return gone, alive
+
+
+# ---------- the pre-ProcessTable code paths ----------
+def legacy_list(ps) -> str:
+    processes = []
+    for proc in ps.process_iter(attrs=["pid", "name", "status"]):
+        info = proc.info
+        processes.append(f"PID: {info['pid']}, Name: {info.get('name','N/A')}, Status: {info.get('status','N/A')}")
+    return "\n".join(processes[:30])
+
+
+def legacy_find(ps, target: str) -> list:
+    return [p for p in ps.process_iter(attrs=["pid", "name"]) if target in (p.info["name"] or "").lower()]
+
+
+def sequential_kill(ps, pids, timeout: float):
+    for pid in pids:
+        p = ps.Process(pid)
+        p.terminate()
+        gone, alive = ps.wait_procs([p], timeout=timeout)
+        for q in alive:
+            q.kill()
+            ps.wait_procs([q], timeout=timeout)
+
+
+def timed(fn, repeat: int = 1):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) * 1000 / repeat
+
+
+def mark_victims(ps, pids, rng):
+    for pid in pids:
+        row = ps.table[pid]
+        row[2], row[4] = True, None
+        row[3] = rng.random() < 0.5
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--procs", type=int, default=5000)
+    ap.add_argument("--call-us", type=float, default=10.0, help="simulated cost of one per-process call")
+    ap.add_argument("--kill-timeout", type=float, default=0.3)
+    args = ap.parse_args()
+
+    ps = FakePsutil(args.procs, args.call_us)
+    table = ProcessTable(ttl=2.0, provider=ps)
+    rng = random.Random(3)
+
+    old = timed(lambda: legacy_list(ps), 10)
+    first = timed(lambda: table.list())
+    new = timed(lambda: table.list(), 10)
+    print(f"list processes   old {old:8.1f} ms   new first {first:7.1f} ms   cached {new:6.2f} ms")
+
+    table.refreshed_at = 0.0
+    ps.table[999] = ["newcomer.exe", 1 << 20, True, False, None]
+    incr = timed(lambda: table.refresh())
+    print(f"expired TTL      incremental refresh {incr:6.1f} ms (1 new of {len(table.procs)})")
+
+    by_mem = timed(lambda: table.list(sort="memory"))
+    by_mem_cached = timed(lambda: table.list(sort="memory"), 10)
+    print(f"list by memory   first {by_mem:7.1f} ms   cached {by_mem_cached:6.2f} ms")
+
+    target = "spotify12"
+    old = timed(lambda: legacy_find(ps, target), 10)
+    new = timed(lambda: table.find(target), 10)
+    fuzzy = table.find("spotfy12")
+    print(f"find by name     old {old:8.1f} ms   new {new:6.3f} ms   (fuzzy 'spotfy12' -> {len(fuzzy)} pids)")
+
+    victims = rng.sample(list(ps.table), 20)
+    mark_victims(ps, victims, rng)
+    old = timed(lambda: sequential_kill(ps, victims, args.kill_timeout))
+    mark_victims(ps, victims, rng)
+    table.refresh(force=True)
+    result = {}
+    new = timed(lambda: result.update(zip(("ended", "failed"), table.kill(victims, timeout=args.kill_timeout))))
+    print(f"kill 20 (~half stubborn) sequential {old:7.1f} ms   wait_procs {new:6.1f} ms   "
+          f"(ended {len(result['ended'])}, failed {len(result['failed'])})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+bench_speech_gap.py
+
+End-of-speech to mic-reopen gap: how long after the last sentence finishes
+playing does the listener start taking audio again. Compares the old loop
+(sleep 50 ms while speaking, re-check) with waiting on the TtsWorker idle
+event, both driven by the same real worker process.
+
+Usage:
+    python benchmarks/bench_speech_gap.py             # 10 utterances per mode
+    python benchmarks/bench_speech_gap.py -n 30
+"""
+
+import time
+import argparse
+import statistics
+import threading
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from parts.tts_worker import TtsWorker
+
+SENTENCES = [
+    "Opening Chrome.",
+    "Process 1234 terminated.",
+    "Sure, here is what I found about that.",
+]
+
+
+def poll_listener(tts: TtsWorker, reopened: list, stop: threading.Event):
+    # the pre-event ChatAI loop
+    while not stop.is_set():
+        if tts.speaking():
+            while tts.speaking():
+                time.sleep(0.05)
+            reopened.append(time.perf_counter() - tts.t_idle)
+        time.sleep(0.005)   # stands in for reading the next mic chunk
+
+
+def event_listener(tts: TtsWorker, reopened: list, stop: threading.Event):
+    while not stop.is_set():
+        if not tts.idle.is_set():
+            tts.idle.wait()
+            reopened.append(time.perf_counter() - tts.t_idle)
+        time.sleep(0.005)
+
+
+def run(tts: TtsWorker, listener, n: int) -> list:
+    reopened, stop = [], threading.Event()
+    t = threading.Thread(target=listener, args=(tts, reopened, stop), daemon=True)
+    t.start()
+    for i in range(n):
+        expected = len(reopened) + 1
+        tts.say(SENTENCES[i % len(SENTENCES)]).wait(30)
+        deadline = time.monotonic() + 1.0
+        while len(reopened) < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)    # pause between turns
+    stop.set()
+    return [g * 1000 for g in reopened]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=10, help="utterances per mode")
+    args = ap.parse_args()
+
+    tts = TtsWorker()
+    tts.start()
+    tts.say("").wait(30)    # engine warm before timing
+    try:
+        for name, listener in (("poll 50 ms", poll_listener), ("idle event", event_listener)):
+            gaps = run(tts, listener, args.n)
+            if not gaps:
+                print(f"{name:12}  no samples")
+                continue
+            print(f"{name:12}  reopen gap mean {statistics.mean(gaps):6.2f} ms  "
+                  f"median {statistics.median(gaps):6.2f} ms  max {max(gaps):6.2f} ms  ({len(gaps)} turns)")
+    finally:
+        tts.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+
+Startup of the manager's default_commands, old and new, with stand-ins
+for the warm-up commands (a 10 ms QTimer stands in for the GUI):
+
+    ollama    a server that listens on a port after --scale * 1.0 s
+    mcp       a container that logs "Uvicorn running" after 0.8 s
+    index     a one-shot job of 0.6 s
+    opencode  a server on another port after 0.5 s; needs ollama
+    agent     a one-shot job of 0.3 s; needs opencode and mcp
+
+    legacy      – the old runner: one command after another, each started
+                  when the previous exits (the servers stand in as one-shots
+                  here; a real server never exits and the rest never ran)
+    sequential  – default_commands_mode "sequential" with ollama / mcp /
+                  index as one group, then opencode, then agent
+    parallel    – default_commands_mode "parallel": only the deps
+    launcher    – ollama started through a launcher that exits at once
+                  (like `start ollama serve`); its port is probed after exit
+    plain       – legacy string entries, checked to still run one at a time
+
+Each line reports the time until everything is settled and the longest
+GUI gap, then the per-command timing table.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --scale 2
+"""
+
+import os
+import sys
+import time
+import socket
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from manager_parts.startup import StartupScheduler, build_jobs, format_report
+
+STANDIN = r"""
+import os, sys, time, socket, subprocess
+kind, delay = os.environ["KIND"], float(os.environ["DELAY"])
+if kind == "launcher":              # start the real server detached and return at once
+    env = dict(os.environ, KIND="server", LIFETIME="8")
+    subprocess.Popen([sys.executable, __file__], env=env, start_new_session=True,
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    print("launched", flush=True)
+    sys.exit(0)
+print(f"{kind} warming up", flush=True)
+time.sleep(delay)
+if kind == "oneshot":
+    print("done", flush=True)
+    sys.exit(0)
+if kind == "server":
+    s = socket.socket()
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind(("127.0.0.1", int(os.environ["PORT"])))
+    s.listen(16)
+    print(f"listening on {os.environ['PORT']}", flush=True)
+else:
+    print("INFO:     Uvicorn running on http://0.0.0.0:8000", flush=True)
+if os.environ.get("LEGACY"):
+    sys.exit(0)
+time.sleep(float(os.environ.get("LIFETIME", "600")))
+"""
+
+
+class Ticker:
+    """10 ms timer recording its longest gap (a frozen GUI shows up here)."""
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(10)
+        self.timer.timeout.connect(self.tick)
+        self.last, self.max_gap = None, 0.0
+
+    def start(self):
+        self.last, self.max_gap = time.perf_counter(), 0.0
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self.last)
+        self.last = now
+
+    def stop(self) -> float:
+        self.tick()
+        self.timer.stop()
+        return self.max_gap
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def run_until(predicate, timeout: float = 60.0):
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < deadline:
+        QTimer.singleShot(5, loop.quit)
+        loop.exec_()
+
+
+def entries(script: str, scale: float, grouped: bool, launcher: bool = False) -> list:
+    def cmd(name, kind, delay, **extra):
+        env = {"KIND": kind, "DELAY": f"{delay * scale:g}"}
+        env.update(extra.pop("env", {}))
+        return dict(name=name, interpreter="python", command=script, env=env, **extra)
+
+    ollama_port, opencode_port = free_port(), free_port()
+    group = {"group": "warmup"} if grouped else {}
+    ollama = cmd("ollama", "launcher" if launcher else "server", 1.0, env={"PORT": str(ollama_port)},
+                 ready={"port": ollama_port, "timeout": 30}, **group)
+    return [ollama,
+            cmd("mcp", "logger", 0.8, ready={"log": "Uvicorn running", "timeout": 30}, **group),
+            cmd("index", "oneshot", 0.6, **group),
+            cmd("opencode", "server", 0.5, env={"PORT": str(opencode_port)}, deps=["ollama"],
+                ready={"port": opencode_port, "timeout": 30}),
+            cmd("agent", "oneshot", 0.3, deps=["opencode", "mcp"])]
+
+
+def run(label: str, commands: list, mode: str, max_parallel: int = 4):
+    startup = StartupScheduler(max_parallel=max_parallel)
+    settled, ticker = [], Ticker()
+    startup.settled.connect(lambda rows, secs: settled.append((rows, secs)))
+    ticker.start()
+    startup.start(build_jobs(commands, mode, sys.executable))
+    run_until(lambda: settled)
+    gap = ticker.stop()
+    rows, secs = settled[0]
+    print(f"{label:<11} settled in {secs:5.2f} s, GUI gap up to {gap * 1000:3.0f} ms")
+    for line in format_report(rows, secs)[1:]:
+        print("           " + line)
+    startup.shutdown()
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scale", type=float, default=1.0, help="multiplies every warm-up time")
+    args = ap.parse_args()
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    tmp = tempfile.mkdtemp(prefix="startup_bench_")
+    script = os.path.join(tmp, "standin.py")
+    with open(script, "w", encoding="utf-8") as f:
+        f.write(STANDIN)
+
+    try:
+        # legacy: each command runs to its exit before the next starts
+        t0 = time.perf_counter()
+        for entry in entries(script, args.scale, grouped=False):
+            subprocess.run([sys.executable, script], env=dict(os.environ, LEGACY="1", **entry["env"]),
+                           capture_output=True)
+        print(f"legacy      settled in {time.perf_counter() - t0:5.2f} s (one after another)")
+
+        run("sequential", entries(script, args.scale, grouped=True), "sequential")
+        run("parallel", entries(script, args.scale, grouped=False), "parallel")
+        run("launcher", entries(script, args.scale, grouped=False, launcher=True), "parallel")
+
+        # legacy entries carry no names, groups or deps; on Windows they are plain strings run through cmd
+        plain = ["timeout /t 1 /nobreak >nul"] if os.name == "nt" else [dict(interpreter="bash", command="sleep 0.2")]
+        rows = run("plain", plain * 3, "sequential")
+        print(f"plain       waited {', '.join(f'{waited:.2f} s' for _, _, waited, _, _ in rows)} (one at a time)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
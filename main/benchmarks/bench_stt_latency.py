@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+bench_stt_latency.py
+
+End-of-speech -> final-text latency for the STT backends, driven by WAV files.
+
+Audio is pushed through VadEngine in 30 ms chunks exactly like
+start_vad_listener does. "streaming" feeds the backend while the phrase is
+still being spoken; "batch" hands it the whole phrase at PHRASE_END (the old
+recognize_google flow). Latency is measured from the chunk that closes the
+phrase to the moment finish() returns; the VAD hangover
+(SILENCE_CHUNKS_END * 30 ms) is added on top in both modes and printed
+separately.
+
+Usage:
+    python benchmarks/bench_stt_latency.py --backend vosk --model models/vosk-small-en a.wav b.wav
+    python benchmarks/bench_stt_latency.py --backend google --realtime a.wav
+"""
+
+import sys
+import time
+import argparse
+import statistics
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from wav_utils import load_wav, iter_chunks
+from parts.vad_engine import VadEngine
+from parts.stt_backend import create_stt_backend
+
+CHUNK_MS = 30
+SILENCE_CHUNKS_END = 20
+
+
+def run_file(pcm, rate, stt, streaming, realtime):
+    chunk_samples = int(rate * CHUNK_MS / 1000)
+    vad = VadEngine(sample_rate=rate, max_chunk_samples=chunk_samples,
+                    silence_chunks_end=SILENCE_CHUNKS_END)
+    results = []
+    for chunk in iter_chunks(pcm, chunk_samples):
+        if realtime:
+            time.sleep(CHUNK_MS / 1000)
+        event = vad.process(chunk)
+        if streaming:
+            if event == VadEngine.SPEECH_START:
+                stt.start()
+                stt.accept(vad.current_phrase())
+                continue
+            if vad.voiced:
+                stt.accept(chunk)
+        if event != VadEngine.PHRASE_END:
+            continue
+        t0 = time.perf_counter()
+        frames = vad.take_phrase()
+        if not frames:
+            stt.cancel()
+            continue
+        text = stt.finish() if streaming else stt.transcribe(frames, rate)
+        results.append((time.perf_counter() - t0, text))
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("wavs", nargs="+")
+    ap.add_argument("--backend", default="vosk")
+    ap.add_argument("--model", help="model path for local backends")
+    ap.add_argument("--realtime", action="store_true",
+                    help="pace chunks at 30 ms like a live mic")
+    args = ap.parse_args()
+
+    config = {"backend": args.backend}
+    if args.model:
+        config[args.backend] = {"model_path": args.model}
+    stt = create_stt_backend(config)
+    if stt.name != args.backend:
+        print(f"backend '{args.backend}' could not be loaded")
+        return 1
+
+    hangover_ms = SILENCE_CHUNKS_END * CHUNK_MS
+    for mode in ("batch", "streaming"):
+        latencies = []
+        for path in args.wavs:
+            pcm, rate = load_wav(path)
+            for secs, text in run_file(pcm, rate, stt, mode == "streaming", args.realtime):
+                latencies.append(secs * 1000)
+                print(f"  [{mode}] {path}: {secs*1000:7.1f} ms  '{text}'")
+        if latencies:
+            print(f"{mode:<10} phrases {len(latencies):3d}  "
+                  f"median {statistics.median(latencies):7.1f} ms  "
+                  f"max {max(latencies):7.1f} ms  (+{hangover_ms} ms VAD hangover)\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
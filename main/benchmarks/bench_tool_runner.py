@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+bench_tool_runner.py
+
+Wall-clock of one agent step that asks for several tools at once, using
+stub tools that sleep (a "process listing", an "MCP query", an "app
+lookup") and a scripted agent that requests all of them in its first step
+and finishes in the second. No LLM involved.
+
+    sequential   – AgentExecutor.invoke (sync loop: one tool after another)
+    gathered     – AgentExecutor.ainvoke with ToolRunner-wrapped tools
+                   (calls of the step run side by side on the bounded pool)
+    timeout      – same, with one tool hanging past its per-tool timeout
+    starved      – one slot, no room for abandoned calls: the hung tool keeps
+                   the slot and the next call is refused after --queue-timeout
+    run_many     – ToolRunner.run_many on the raw tools, results in order
+
+Usage:
+    python benchmarks/bench_tool_runner.py
+    python benchmarks/bench_tool_runner.py --workers 2 --scale 0.5
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.runnables import RunnableLambda
+from langchain.tools import tool
+
+from parts.tool_runner import ToolRunner
+
+SCALE = 1.0
+
+
+@tool("list_processes")
+def list_processes(cmd: str) -> str:
+    """Stub: a process listing that takes 0.4 s."""
+    time.sleep(0.4 * SCALE)
+    return f"processes({cmd})"
+
+
+@tool("mcp_query")
+def mcp_query(prompt: str) -> str:
+    """Stub: an MCP round-trip that takes 0.6 s."""
+    time.sleep(0.6 * SCALE)
+    return f"mcp({prompt})"
+
+
+@tool("find_app")
+def find_app(query: str) -> str:
+    """Stub: an app lookup that takes 0.2 s."""
+    time.sleep(0.2 * SCALE)
+    return f"app({query})"
+
+
+@tool("hang")
+def hang(query: str) -> str:
+    """Stub: a tool that never answers in time."""
+    time.sleep(5.0)
+    return "too late"
+
+
+def scripted_agent(tool_names):
+    """First step: call every tool; second step: finish with the observations in order."""
+    def plan(inputs):
+        steps = inputs["intermediate_steps"]
+        if not steps:
+            return [AgentAction(tool=name, tool_input=f"q{i}", log="") for i, name in enumerate(tool_names)]
+        return AgentFinish({"output": " | ".join(str(obs) for _, obs in steps)}, log="")
+    return RunnableLambda(plan)
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - t0) * 1000, result
+
+
+def main():
+    global SCALE
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply the stub sleep times")
+    ap.add_argument("--queue-timeout", type=float, default=0.3, help="slot wait before a call is refused")
+    args = ap.parse_args()
+    SCALE = args.scale
+
+    raw = [list_processes, mcp_query, find_app]
+    names = [t.name for t in raw]
+    expected = sum((0.4, 0.6, 0.2)) * SCALE * 1000
+
+    seq = AgentExecutor(agent=scripted_agent(names), tools=raw)
+    ms, out = timed(lambda: seq.invoke({"input": "x"}))
+    print(f"sequential    {ms:7.0f} ms   (tools sum {expected:.0f} ms)   {out['output']}")
+
+    runner = ToolRunner(max_workers=args.workers, timeout=30.0, timeouts={"hang": 0.5})
+    par = AgentExecutor(agent=scripted_agent(names), tools=runner.wrap_all(raw))
+    t0 = time.perf_counter()
+    ms, out = timed(lambda: asyncio.run(par.ainvoke({"input": "x"})))
+    print(f"gathered      {ms:7.0f} ms   {runner.summary(since=t0)}   {out['output']}")
+
+    with_hang = AgentExecutor(agent=scripted_agent(names + ["hang"]), tools=runner.wrap_all(raw + [hang]))
+    ms, out = timed(lambda: asyncio.run(with_hang.ainvoke({"input": "x"})))
+    print(f"timeout       {ms:7.0f} ms   {out['output']}")
+
+    t0 = time.perf_counter()
+    ms, results = timed(lambda: runner.run_many([(t, f"q{i}") for i, t in enumerate(raw)]))
+    print(f"run_many      {ms:7.0f} ms   {results}")
+
+    print("per tool     ", runner.stats())
+    print("peak running ", runner.peak_running)
+    runner.close()
+
+    starving = ToolRunner(max_workers=1, timeout=30.0, timeouts={"hang": 0.5},
+                          queue_timeout=args.queue_timeout, max_abandoned=0)
+    ms, results = timed(lambda: starving.run_many([(hang, "q0"), (find_app, "q1")]))
+    print(f"starved       {ms:7.0f} ms   {results}   {starving.stats()}")
+    starving.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
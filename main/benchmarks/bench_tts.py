@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+bench_tts.py
+
+Time-to-first-audio for the old subprocess-per-utterance TTS versus the
+persistent TtsWorker. "First audio" is pyttsx3's started-utterance callback,
+the closest signal the engine exposes to the first sample reaching the device.
+
+Usage:
+    python benchmarks/bench_tts.py             # 5 utterances each
+    python benchmarks/bench_tts.py -n 10
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from parts.tts_worker import TtsWorker
+
+SENTENCES = [
+    "Opening Chrome.",
+    "Process 1234 terminated.",
+    "Sure, here is what I found about that.",
+    "I couldn't find that application.",
+    "The container responded with three results.",
+]
+
+# the old one-interpreter-per-utterance path, plus a marker line when audio starts
+LEGACY_SCRIPT = (
+    "import base64,pyttsx3,sys\n"
+    "t=base64.b64decode(sys.argv[1]).decode('utf-8')\n"
+    "e=pyttsx3.init()\n"
+    "e.setProperty('rate',180)\n"
+    "e.setProperty('volume',1.0)\n"
+    "e.connect('started-utterance', lambda name: print('START', flush=True))\n"
+    "e.say(t)\n"
+    "e.runAndWait()\n"
+)
+
+
+def legacy_first_audio(text: str):
+    import base64
+    encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
+    t0 = time.perf_counter()
+    p = subprocess.Popen([sys.executable, "-c", LEGACY_SCRIPT, encoded],
+                         stdout=subprocess.PIPE, text=True)
+    first = None
+    for line in p.stdout:
+        if line.startswith("START") and first is None:
+            first = time.perf_counter() - t0
+    p.wait()
+    return first, time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=5)
+    args = ap.parse_args()
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.n)]
+
+    legacy = []
+    for text in texts:
+        first, total = legacy_first_audio(text)
+        if first is not None:
+            legacy.append(first)
+        print(f"  subprocess  first audio {first or float('nan'):6.3f}s  total {total:6.3f}s  '{text}'")
+
+    tts = TtsWorker()
+    tts.start()
+    warm = []
+    for text in texts:
+        utt = tts.say(text)
+        utt.done.wait()
+        if utt.time_to_first_audio is not None:
+            warm.append(utt.time_to_first_audio)
+        print(f"  worker      first audio {utt.time_to_first_audio or float('nan'):6.3f}s  "
+              f"total {utt.t_done - utt.t_submit:6.3f}s  '{text}'")
+    print("  (the first worker utterance includes process spawn + engine init)")
+    tts.close()
+
+    if legacy and len(warm) > 1:
+        print(f"\nmedian time-to-first-audio: subprocess {statistics.median(legacy)*1000:.0f} ms, "
+              f"warm worker {statistics.median(warm[1:])*1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+bench_vad.py
+
+Frames/sec per core for VadEngine versus the old per-sample Python RMS.
+
+Usage:
+    python benchmarks/bench_vad.py recording1.wav recording2.wav
+    python benchmarks/bench_vad.py --synthetic 60     # 60 s of generated audio
+"""
+
+import sys
+import time
+import array
+import argparse
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from wav_utils import load_wav, iter_chunks, synth_speech
+from parts.vad_engine import VadEngine
+
+
+def legacy_rms(chunk):
+    # the rms() that used to live in ChatAI.start_continuous_listening
+    samples = array.array('h', chunk)
+    if not samples:
+        return 0
+    mean_square = sum(s * s for s in samples) / len(samples)
+    return mean_square ** 0.5
+
+
+def run(label, fn, chunks):
+    t0, c0 = time.perf_counter(), time.process_time()
+    for chunk in chunks:
+        fn(chunk)
+    wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+    fps = len(chunks) / cpu if cpu > 0 else float("inf")
+    print(f"{label:<10} {len(chunks):>8} frames  wall {wall*1000:8.1f} ms  "
+          f"cpu {cpu*1000:8.1f} ms  {fps:12,.0f} frames/s/core")
+    return fps
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("wavs", nargs="*")
+    ap.add_argument("--synthetic", type=float, default=0.0, help="seconds of generated audio")
+    ap.add_argument("--chunk-ms", type=int, default=30)
+    args = ap.parse_args()
+
+    inputs = [load_wav(p) for p in args.wavs]
+    if args.synthetic or not inputs:
+        inputs.append((synth_speech(args.synthetic or 30.0), 16000))
+
+    for pcm, rate in inputs:
+        chunk_samples = int(rate * args.chunk_ms / 1000)
+        # materialize as bytes so neither side pays for slicing
+        chunks = [bytes(c) for c in iter_chunks(pcm, chunk_samples)]
+        print(f"\n{len(pcm) / 2 / rate:.1f} s @ {rate} Hz, {args.chunk_ms} ms frames")
+
+        vad = VadEngine(sample_rate=rate, max_chunk_samples=chunk_samples)
+        phrases = 0
+
+        def engine_step(chunk):
+            nonlocal phrases
+            if vad.process(chunk) == VadEngine.PHRASE_END:
+                phrases += len(vad.take_phrase()) > 0
+
+        old = run("legacy", legacy_rms, chunks)
+        new = run("VadEngine", engine_step, chunks)
+        print(f"speedup x{new / old:.1f}, phrases detected: {phrases}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
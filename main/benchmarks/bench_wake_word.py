@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+bench_wake_word.py
+
+False-accept / false-reject rates and CPU cost of WakeWordDetector over a
+directory of labelled WAVs:
+
+    data/
+        positive/*.wav    each contains the wake word
+        negative/*.wav    speech / noise without it
+
+Usage:
+    python benchmarks/bench_wake_word.py ../config/wake_word data/
+    python benchmarks/bench_wake_word.py ../config/wake_word data/ --sweep 1.0 3.0 0.2
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+import numpy as np
+
+import bench_paths  # noqa: F401  (puts main/ and the repo root on sys.path)
+from wav_utils import load_wav, iter_chunks
+from parts.wake_word import WakeWordDetector
+
+CHUNK_MS = 30
+
+
+def scan(det, pcm, rate):
+    """Stream one file; returns (hits, best score). threshold=-inf never fires, giving the raw minimum."""
+    det.reset()
+    hits, best = 0, float("inf")
+    for chunk in iter_chunks(pcm, int(rate * CHUNK_MS / 1000)):
+        hits += det.process(chunk)
+        best = min(best, det.score)
+    return hits, best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("templates")
+    ap.add_argument("data")
+    ap.add_argument("--threshold", type=float, default=None)
+    ap.add_argument("--sweep", type=float, nargs=3, metavar=("LO", "HI", "STEP"))
+    args = ap.parse_args()
+
+    kwargs = {} if args.threshold is None else {"threshold": args.threshold}
+    det = WakeWordDetector.from_directory(args.templates, **kwargs)
+    if not det.templates:
+        print("no templates found")
+        return 1
+
+    results = {"positive": [], "negative": []}
+    audio_secs = cpu_secs = 0.0
+    for label in results:
+        for path in sorted(glob.glob(os.path.join(args.data, label, "*.wav"))):
+            pcm, rate = load_wav(path)
+            if rate != det.sample_rate:
+                print(f"skipping {path}: {rate} Hz")
+                continue
+            c0 = time.process_time()
+            hits, best = scan(det, pcm, rate)
+            cpu_secs += time.process_time() - c0
+            secs = len(pcm) / 2 / rate
+            audio_secs += secs
+            results[label].append((path, hits, best, secs))
+
+    pos, neg = results["positive"], results["negative"]
+    print(f"{len(det.templates)} templates, {len(pos)} positive / {len(neg)} negative files, "
+          f"{audio_secs:.0f} s audio")
+    print(f"CPU: {cpu_secs:.2f} s for {audio_secs:.1f} s audio = {100 * cpu_secs / max(audio_secs, 1e-9):.2f}% of one core")
+
+    fr = sum(1 for _, h, _, _ in pos if not h)
+    fa = sum(h for _, h, _, _ in neg)
+    neg_hours = sum(s for *_, s in neg) / 3600
+    print(f"threshold {det.threshold}: FRR {fr}/{len(pos)} = {100 * fr / max(len(pos), 1):.1f}%  "
+          f"FA {fa} ({fa / max(neg_hours, 1e-9):.1f}/hour)")
+    for label, rows in results.items():
+        for path, hits, best, _ in rows:
+            print(f"  {label[:3]} hits={hits} best={best:6.2f}  {path}")
+
+    if args.sweep:
+        # rescan without firing so every file reports its true minimum distance
+        det.threshold = -np.inf
+        pos_best = [scan(det, *load_wav(p))[1] for p, *_ in pos]
+        neg_best = [scan(det, *load_wav(p))[1] for p, *_ in neg]
+        print("\nthreshold   FRR%    FAR% (files)")
+        for t in np.arange(args.sweep[0], args.sweep[1] + 1e-9, args.sweep[2]):
+            frr = 100 * sum(b >= t for b in pos_best) / max(len(pos_best), 1)
+            far = 100 * sum(b < t for b in neg_best) / max(len(neg_best), 1)
+            print(f"{t:9.2f} {frr:7.1f} {far:7.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
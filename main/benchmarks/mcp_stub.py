@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+mcp_stub.py
+
+Minimal stand-in for an MCP container: HTTP/1.1 with keep-alive,
+
+    POST /invoke  {"query": ...}  -> {"result": "echo: ..."}
+    GET  /health                  -> {"ok": true}
+
+with an optional per-request delay and a rate of 503 answers, so the MCP
+client can be exercised without Docker. Counts accepted connections and
+requests, which is how bench_mcp_client.py shows connection reuse.
+
+Usage:
+    python benchmarks/mcp_stub.py --port 7100
+    python benchmarks/mcp_stub.py --port 7101 --delay-ms 20 --fail-rate 0.1
+
+    from mcp_stub import start_stub
+    stub = start_stub(delay_ms=5)       # stub.url, stub.connections, stub.stop()
+"""
+
+import sys
+import json
+import socket
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # headers and body go out as separate writes; without this Nagle + delayed ACK add ~40 ms per kept-alive call
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200 if not self.server.unhealthy else 503, {"ok": not self.server.unhealthy})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if self.path != "/invoke":
+            self._reply(404, {"error": "not found"})
+        elif self.server.unhealthy or random.random() < self.server.fail_rate:
+            self._reply(503, {"error": "busy"})
+        else:
+            self._reply(200, {"result": f"echo: {body.get('query', '')}"})
+
+
+class Stub:
+    def __init__(self, port: int = 0, delay_ms: float = 0.0, fail_rate: float = 0.0):
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.delay = delay_ms / 1000.0
+        self.server.fail_rate = fail_rate
+        self.server.unhealthy = False
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def connections(self) -> int:
+        return self.server.connections
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    def set_unhealthy(self, unhealthy: bool = True):
+        self.server.unhealthy = unhealthy
+
+    def reset_counts(self):
+        with self.server.lock:
+            self.server.connections = self.server.requests = 0
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_stub(port: int = 0, delay_ms: float = 0.0, fail_rate: float = 0.0) -> Stub:
+    return Stub(port, delay_ms, fail_rate)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--port", type=int, default=7100)
+    ap.add_argument("--delay-ms", type=float, default=0.0)
+    ap.add_argument("--fail-rate", type=float, default=0.0)
+    args = ap.parse_args()
+    stub = start_stub(args.port, args.delay_ms, args.fail_rate)
+    print(f"[MCP stub] listening on {stub.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+opencode_fake.py
+
+Stand-in for the `opencode` binary and its serve API, enough for
+OpenCodeClient:
+
+    GET  /app                     -> {}
+    POST /session                 -> {"id": "ses_N"}
+    POST /session/<id>/message    -> {"info": ..., "parts": [{"type": "text", ...}]}
+                                     (404 for an unknown session)
+    GET  /event                   -> SSE: message.part.updated per word of
+                                     the reply, then session.idle
+
+The reply is the prompt echoed back word by word, --word-ms apart, so
+streaming is visible. As a binary:
+
+    python benchmarks/opencode_fake.py serve --port 0 --hostname 127.0.0.1
+    python benchmarks/opencode_fake.py run "hello there"
+
+(with OPENCODE_FAKE_NO_SERVE=1, `serve` exits at once, to test the run
+fallback.)
+
+Usage from Python:
+    fake = start_fake(port=0, word_ms=20)   # fake.url, fake.sessions, fake.restart(), fake.stop()
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def reply_for(prompt: str) -> str:
+    return f"OK: {prompt}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/app":
+            self._reply(200, {"path": {"cwd": os.getcwd()}})
+        elif self.path == "/event":
+            self._events()
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.close_connection = True
+        q = queue.Queue()
+        with self.server.lock:
+            self.server.subscribers.append(q)
+        try:
+            self._chunk({"type": "server.connected", "properties": {}})
+            while True:
+                event = q.get()
+                if event is None:
+                    self.wfile.write(b"0\r\n\r\n")
+                    return
+                self._chunk(event)
+        except OSError:
+            pass
+        finally:
+            with self.server.lock:
+                self.server.subscribers.remove(q)
+
+    def _chunk(self, event: dict):
+        data = f"data: {json.dumps(event)}\n\n".encode()
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _publish(self, event: dict):
+        with self.server.lock:
+            subscribers = list(self.server.subscribers)
+        for q in subscribers:
+            q.put(event)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        parts = self.path.strip("/").split("/")
+        if parts == ["session"]:
+            with self.server.lock:
+                self.server.session_count += 1
+                sid = f"ses_{self.server.session_count}"
+                self.server.session_ids.add(sid)
+            self._reply(200, {"id": sid})
+        elif len(parts) == 3 and parts[0] == "session" and parts[2] == "message":
+            sid = parts[1]
+            if sid not in self.server.session_ids:
+                self._reply(404, {"error": f"session {sid} not found"})
+                return
+            prompt = " ".join(p.get("text", "") for p in body.get("parts", []) if p.get("type") == "text")
+            words = reply_for(prompt).split()
+            part_id = f"prt_{time.monotonic_ns()}"
+            text = ""
+            for word in words:
+                time.sleep(self.server.word_delay)
+                text = f"{text} {word}".strip()
+                self._publish({"type": "message.part.updated", "properties": {
+                    "part": {"id": part_id, "sessionID": sid, "type": "text", "text": text}}})
+            self._publish({"type": "session.idle", "properties": {"sessionID": sid}})
+            self._reply(200, {"info": {"id": f"msg_{part_id}", "sessionID": sid},
+                              "parts": [{"id": part_id, "type": "text", "text": text}]})
+        else:
+            self._reply(404, {"error": "not found"})
+
+
+class Fake:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, word_ms: float = 10.0):
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.subscribers = []
+        self.server.session_ids = set()
+        self.server.session_count = 0
+        self.server.connections = 0
+        self.server.word_delay = word_ms / 1000.0
+        self.host, self.port = self.server.server_address[:2]
+        self.url = f"http://{self.host}:{self.port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def sessions(self) -> int:
+        return self.server.session_count
+
+    @property
+    def connections(self) -> int:
+        return self.server.connections
+
+    def restart(self):
+        """Forget every session, as a restarted server would."""
+        with self.server.lock:
+            self.server.session_ids.clear()
+
+    def stop(self):
+        with self.server.lock:
+            for q in self.server.subscribers:
+                q.put(None)
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def start_fake(host: str = "127.0.0.1", port: int = 0, word_ms: float = 10.0) -> Fake:
+    return Fake(host, port, word_ms)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    serve = sub.add_parser("serve")
+    serve.add_argument("--port", type=int, default=4096)
+    serve.add_argument("--hostname", default="127.0.0.1")
+    serve.add_argument("--word-ms", type=float, default=10.0)
+    run = sub.add_parser("run")
+    run.add_argument("prompt")
+    run.add_argument("--model")
+    args = ap.parse_args()
+
+    if args.cmd == "run":
+        print(reply_for(args.prompt))
+        return 0
+    if os.environ.get("OPENCODE_FAKE_NO_SERVE"):
+        print("serve is disabled", file=sys.stderr)
+        return 1
+    fake = start_fake(args.hostname, args.port, args.word_ms)
+    print(f"opencode server listening on {fake.url}", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        fake.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+wav_utils.py
+
+Helpers shared by the benchmark scripts: load WAV files as 16-bit mono PCM,
+split them into fixed-size chunks, and synthesize test audio when no
+recordings are at hand.
+"""
+
+import wave
+import numpy as np
+
+
+def load_wav(path: str) -> tuple:
+    """Return (pcm_bytes, sample_rate) as 16-bit mono (first channel if stereo)."""
+    with wave.open(path, "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported")
+        rate = wf.getframerate()
+        channels = wf.getnchannels()
+        raw = wf.readframes(wf.getnframes())
+    if channels > 1:
+        raw = np.frombuffer(raw, dtype=np.int16)[::channels].tobytes()
+    return raw, rate
+
+
+def iter_chunks(pcm: bytes, chunk_samples: int):
+    """Yield consecutive chunk_samples-long slices (bytes) of 16-bit PCM."""
+    step = chunk_samples * 2
+    view = memoryview(pcm)
+    for i in range(0, len(pcm) - step + 1, step):
+        yield view[i:i + step]
+
+
+def synth_speech(seconds: float = 10.0, rate: int = 16000, seed: int = 0) -> bytes:
+    """
+    Crude speech-like test signal: bursts of harmonic tones with a syllable-rate
+    envelope, separated by low-level noise. Good enough to exercise VAD paths.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(seconds * rate)
+    t = np.arange(n) / rate
+    out = rng.normal(0, 60, n)
+    pos = 0
+    while pos < n:
+        gap = int(rng.uniform(0.4, 1.2) * rate)
+        burst = int(rng.uniform(0.5, 2.0) * rate)
+        s, e = pos + gap, min(n, pos + gap + burst)
+        if s >= n:
+            break
+        f0 = rng.uniform(100, 220)
+        seg = t[s:e]
+        voice = sum(np.sin(2 * np.pi * f0 * k * seg) / k for k in range(1, 6))
+        env = 0.5 * (1 - np.cos(2 * np.pi * 4 * (seg - seg[0])))
+        out[s:e] += 3000 * voice * env
+        pos = e
+    return np.clip(out, -32768, 32767).astype(np.int16).tobytes()
+
+
+def write_wav(path: str, pcm: bytes, rate: int = 16000):
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
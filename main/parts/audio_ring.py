@@ -0,0 +1,156 @@
+"""
+audio_ring.py
+
+Preallocated capture ring for 16-bit PCM: one producer (the PortAudio
+callback) and any number of independent readers (VAD, STT, wake word,
+level meter), each with its own position.
+
+The buffer is mirrored: every write lands at pos % capacity and again at
+pos % capacity + capacity, so any span up to `capacity` bytes is contiguous
+and readers get memoryview slices of it without copying. The producer
+never waits for readers; a reader that falls more than a full buffer behind
+skips ahead to the oldest data still held and counts the loss as an
+overrun.
+
+A slice stays valid until the producer laps it, i.e. for roughly
+`seconds` of audio after it was written. Call bytes(view) to keep data
+longer than that.
+
+Usage:
+    ring = AudioRing(seconds=10, rate=16000)
+    ring.write(in_data)                   # producer (PortAudio callback)
+
+    reader = ring.reader()                # each consumer
+    view = reader.read(960, timeout=0.5)  # 30 ms at 16 kHz, zero-copy
+    level_view = ring.latest(1600)        # last 50 ms, does not consume
+"""
+
+import threading
+
+
+class RingReader:
+    def __init__(self, ring: "AudioRing", pos: int):
+        self.ring = ring
+        self.pos = pos          # absolute byte offset of the next read
+        self.overruns = 0       # times this reader was lapped
+        self.dropped = 0        # bytes lost to overruns
+
+    @property
+    def available(self) -> int:
+        return self.ring.write_pos - self.pos
+
+    def _catch_up(self):
+        oldest = self.ring.write_pos - self.ring.capacity
+        if self.pos < oldest:
+            self.overruns += 1
+            self.dropped += oldest - self.pos
+            self.pos = oldest
+
+    def read(self, nbytes: int, timeout: float = None):
+        """
+        Next nbytes as a memoryview, blocking until they are captured.
+        Returns None on timeout (or when the ring is closed).
+        """
+        if nbytes > self.ring.capacity:
+            raise ValueError("read larger than the ring capacity")
+        if self.available < nbytes and not self.ring.wait_for(self.pos + nbytes, timeout):
+            return None
+        self._catch_up()
+        view = self.ring.view(self.pos, nbytes)
+        self.pos += nbytes
+        return view
+
+    def read_available(self, max_bytes: int = None):
+        """Everything captured since the last read (up to max_bytes), without blocking."""
+        self._catch_up()
+        n = self.available
+        if max_bytes is not None:
+            n = min(n, max_bytes)
+        n -= n % self.ring.frame_bytes
+        view = self.ring.view(self.pos, n)
+        self.pos += n
+        return view
+
+    def seek_to_end(self):
+        """Drop everything not yet read (e.g. audio captured while we were speaking)."""
+        self.pos = self.ring.write_pos
+
+
+class AudioRing:
+    def __init__(self,
+                    seconds: float = 10.0,
+                    rate: int = 16000,
+                    sample_width: int = 2,
+                    channels: int = 1):
+        """
+        :param seconds:      audio kept; also the longest span a single read may return
+        :param rate:         sampling rate (Hz)
+        :param sample_width: bytes per sample (2 = 16-bit)
+        :param channels:     mono=1, stereo=2
+        """
+        self.rate = rate
+        self.frame_bytes = sample_width * channels
+        self.capacity = int(seconds * rate) * self.frame_bytes
+        self._buf = bytearray(2 * self.capacity)
+        self._view = memoryview(self._buf)
+        self.write_pos = 0                  # absolute bytes written, only the producer advances it
+        self._cond = threading.Condition()
+        self._waiters = 0
+        self.closed = False
+
+    # ---------- producer ----------
+    def write(self, data):
+        data = memoryview(data)
+        if data.format != "B":
+            data = data.cast("B")
+        n = len(data)
+        if n > self.capacity:
+            data = data[n - self.capacity:]
+            self.write_pos += n - self.capacity
+            n = self.capacity
+        cap = self.capacity
+        start = self.write_pos % cap
+        first = min(n, cap - start)
+        view = self._view
+        # primary copy, then the mirror half
+        view[start:start + first] = data[:first]
+        view[start + cap:start + cap + first] = data[:first]
+        if first < n:
+            rest = n - first
+            view[0:rest] = data[first:]
+            view[cap:cap + rest] = data[first:]
+        self.write_pos += n
+        if self._waiters:
+            with self._cond:
+                self._cond.notify_all()
+
+    def close(self):
+        self.closed = True
+        with self._cond:
+            self._cond.notify_all()
+
+    # ---------- consumers ----------
+    def reader(self, from_now: bool = True) -> RingReader:
+        """New independent reader; from_now=False starts at the oldest data held."""
+        pos = self.write_pos if from_now else max(0, self.write_pos - self.capacity)
+        return RingReader(self, pos)
+
+    def view(self, pos: int, nbytes: int):
+        start = pos % self.capacity
+        return self._view[start:start + nbytes]
+
+    def latest(self, nbytes: int):
+        """The most recent nbytes (fewer at startup), without consuming anything."""
+        nbytes = min(nbytes, self.write_pos, self.capacity)
+        nbytes -= nbytes % self.frame_bytes
+        return self.view(self.write_pos - nbytes, nbytes)
+
+    def wait_for(self, pos: int, timeout: float = None) -> bool:
+        """Block until write_pos reaches pos; False on timeout or close."""
+        with self._cond:
+            self._waiters += 1
+            try:
+                return self._cond.wait_for(lambda: self.write_pos >= pos or self.closed, timeout) \
+                    and self.write_pos >= pos
+            finally:
+                self._waiters -= 1
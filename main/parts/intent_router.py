@@ -0,0 +1,218 @@
+"""
+intent_router.py
+
+Deterministic fast path in front of the LLM agent. Utterances that map
+one-to-one onto a tool ("open chrome", "kill 1234", "list processes") are
+matched on a word trie and dispatched straight to the tool; everything else
+returns None and goes to the agent as before.
+
+Routes come from two places:
+    • config/commands.json – exact phrases mapped to shell commands. The
+      command gets `command_settle` seconds: if it exits non-zero in that
+      time (e.g. a Windows-only "start chrome" on Linux) the phrase goes to
+      the agent instead of being reported as done
+    • tool docstrings – the quoted lines under "Examples" in each @tool. A
+      leading verb shared by several examples ("open ...") or followed by a
+      number ("kill 1234") becomes a prefix route; other examples are exact.
+
+A prefix route only fires for arguments the tool can take without
+interpretation: numbers when an example took one ("kill 1234"), or an
+exact name the tool knows ("open chrome" when Chrome is installed, "kill
+notepad" when notepad is running), checked by the `known` callable given
+with the tool. "kill the music" or "open it" goes to the agent.
+
+Usage:
+    router = IntentRouter()
+    router.add_tool(AppLauncher, known=is_known_app)
+    router.add_commands({"open cmd": "cmd.exe /k start cmd"})
+    reply = router.dispatch("please open chrome")   # None -> ask the agent
+"""
+
+import re
+import time
+import subprocess
+
+COMMAND_SETTLE_SECONDS = 0.5
+from collections import defaultdict
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_LEADING_FILLER = ("hey delta", "delta", "please", "can you", "could you", "would you")
+_EXAMPLE = re.compile(r'^\s*-\s*"([^"]+)"\s*$')
+
+
+def normalize(text: str) -> str:
+    text = " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+    stripped = True
+    while stripped:
+        stripped = False
+        for filler in _LEADING_FILLER:
+            if text == filler or text.startswith(filler + " "):
+                text = text[len(filler):].lstrip()
+                stripped = True
+    if text.endswith(" please"):
+        text = text[:-7]
+    return text
+
+
+def docstring_examples(doc: str) -> list:
+    """Quoted bullet examples from a tool docstring, e.g.  - "open chrome"."""
+    return [m.group(1) for m in map(_EXAMPLE.match, (doc or "").splitlines()) if m]
+
+
+class Route:
+    def __init__(self, name: str, handler, prefix: bool, accepts=None):
+        self.name = name          # tool / command name, for logging and stats
+        self.handler = handler    # handler(normalized_text) -> str
+        self.prefix = prefix      # True: phrase followed by arguments
+        self.accepts = accepts    # accepts(arguments) -> bool for prefix routes; None takes any
+
+
+class _Node:
+    __slots__ = ("children", "route")
+
+    def __init__(self):
+        self.children = {}
+        self.route = None
+
+
+class IntentRouter:
+    def __init__(self, max_arg_words: int = 4):
+        """
+        :param max_arg_words: prefix routes only fire when at most this many words
+                              follow the prefix; longer requests go to the agent
+        """
+        self.max_arg_words = max_arg_words
+        self._root = _Node()
+        self.hits = defaultdict(int)
+        self.misses = 0
+
+    # ---------- building ----------
+    def add_route(self, phrase: str, name: str, handler, prefix: bool = False, accepts=None):
+        node = self._root
+        for word in normalize(phrase).split():
+            node = node.children.setdefault(word, _Node())
+        node.route = Route(name, handler, prefix, accepts)
+
+    def add_tool(self, tool, known=None):
+        """
+        Derive routes from a LangChain tool's description (its docstring examples).
+        `known(arguments) -> bool` says whether the words after a prefix verb are an
+        exact name the tool knows; without it only numeric arguments are routed.
+        """
+        examples = [normalize(e) for e in docstring_examples(getattr(tool, "description", ""))]
+        by_verb = defaultdict(list)
+        for ex in examples:
+            if ex:
+                by_verb[ex.split()[0]].append(ex)
+        handler = lambda text, _tool=tool: str(_tool.invoke(text))
+        for verb, group in by_verb.items():
+            numeric = any(w.isdigit() for ex in group for w in ex.split()[1:])
+            if len(group) > 1 or numeric:
+                def accepts(args, _numeric=numeric):
+                    if _numeric and all(w.isdigit() for w in args.split()):
+                        return True
+                    return known is not None and bool(known(args))
+                self.add_route(verb, tool.name, handler, prefix=True, accepts=accepts)
+            else:
+                self.add_route(group[0], tool.name, handler)
+
+    def add_commands(self, commands: dict, settle: float = COMMAND_SETTLE_SECONDS):
+        """
+        Exact phrases -> shell commands (config/commands.json). A command that exits
+        non-zero within `settle` seconds returns None, so the agent gets the phrase;
+        one still running by then (a launcher, "cmd /k") counts as started.
+        """
+        for phrase, command in (commands or {}).items():
+            def run(text, _phrase=phrase, _command=command):
+                try:
+                    proc = subprocess.Popen(_command, shell=True)
+                    code = proc.wait(settle)
+                except subprocess.TimeoutExpired:
+                    return f"Running {_phrase}."
+                except OSError as e:
+                    print(f"[Router] {_command!r} failed to start: {e}")
+                    return None
+                if code != 0:
+                    print(f"[Router] {_command!r} exited with {code}; asking the agent")
+                    return None
+                return f"Running {_phrase}."
+            self.add_route(phrase, f"command:{phrase}", run)
+
+    # ---------- matching ----------
+    def match(self, text: str):
+        """Return (route, normalized_text) or None."""
+        norm = normalize(text)
+        words = norm.split()
+        node, best = self._root, None
+        for i, word in enumerate(words):
+            node = node.children.get(word)
+            if node is None:
+                break
+            route = node.route
+            if route is None:
+                continue
+            rest = len(words) - i - 1
+            if rest == 0 and not route.prefix:
+                best = route
+            elif (route.prefix and 0 < rest <= self.max_arg_words
+                  and (route.accepts is None or route.accepts(" ".join(words[i + 1:])))):
+                best = route
+        return (best, norm) if best else None
+
+    def dispatch(self, text: str):
+        """Run the matching handler and return its reply; None when the agent should handle it
+        (no route, or the handler gave up and returned None)."""
+        found = self.match(text)
+        reply = None
+        if found is not None:
+            route, norm = found
+            reply = route.handler(norm)
+        if reply is None:
+            self.misses += 1
+            return None
+        self.hits[route.name] += 1
+        return reply
+
+    def stats(self) -> dict:
+        total_hits = sum(self.hits.values())
+        total = total_hits + self.misses
+        return {
+            "routed": total_hits,
+            "to_agent": self.misses,
+            "hit_rate": total_hits / total if total else 0.0,
+            "by_route": dict(self.hits),
+        }
+
+
+def build_intent_router(tools, commands: dict = None, max_arg_words: int = 4, known: dict = None) -> IntentRouter:
+    """`known` maps a tool name to its exact-name check (see IntentRouter.add_tool)."""
+    router = IntentRouter(max_arg_words=max_arg_words)
+    for tool in tools:
+        router.add_tool(tool, known=(known or {}).get(tool.name))
+    # explicit config phrases win over docstring-derived routes
+    router.add_commands(commands)
+    return router
+
+
+if __name__ == "__main__":
+    # quick check of what a phrase would route to:  python intent_router.py "open chrome"
+    import sys
+
+    class _Echo:
+        def __init__(self, name, description):
+            self.name, self.description = name, description
+
+        def invoke(self, text):
+            return f"<{self.name}({text!r})>"
+
+    router = build_intent_router([
+        _Echo("AppLauncher", '- "open chrome"\n- "open vs code"'),
+        _Echo("kill_process", '- "list processes"\n- "kill 1234"\n- "kill process chrome"'),
+    ], known={"AppLauncher": {"chrome", "vs code"}.__contains__,
+              "kill_process": {"chrome", "process chrome"}.__contains__})
+    for phrase in sys.argv[1:] or ["open chrome", "kill 1234", "list processes", "open it",
+                                   "kill the music", "what time is it"]:
+        t0 = time.perf_counter()
+        found = router.match(phrase)
+        dt = (time.perf_counter() - t0) * 1e6
+        print(f"{phrase!r:30} -> {found[0].name if found else 'agent':15} ({dt:.1f} us)")
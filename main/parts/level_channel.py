@@ -0,0 +1,67 @@
+"""
+level_channel.py
+
+Latest-value-wins audio level shared between the TTS side and the orb.
+
+The producer either sets a constant level or hands over a whole RMS
+envelope with the time playback started; the orb's own timer pulls the
+value for "now" on each tick. Nothing is queued: however often the
+producer writes, the GUI thread sees one read per frame and there are no
+per-sample signals. The state is a single tuple swapped atomically, so no
+lock is needed.
+
+on_wake(level) is called (from the producer's thread) only when the level
+goes from silent to non-zero, so an idle orb can be bumped back to full
+frame rate with one signal per utterance.
+
+Usage:
+    channel = LevelChannel(on_wake=lambda level: bridge.setLevelRequested.emit(level))
+    orb.level_source = channel.read
+    channel.play(envelope, fps=30)      # when audio starts
+    channel.set(0.0)                    # when it ends
+"""
+
+import time
+
+
+class LevelChannel:
+    def __init__(self, on_wake=None):
+        """
+        :param on_wake: on_wake(level), called when the level leaves zero
+        """
+        self.on_wake = on_wake
+        self._state = (0.0, None, 0.0, 0.0)     # (constant, envelope, fps, t_start)
+        self.writes = 0
+
+    def _swap(self, state, first_level: float):
+        silent = self.read() == 0.0
+        self._state = state
+        self.writes += 1
+        if silent and first_level > 0.0 and self.on_wake is not None:
+            self.on_wake(first_level)
+
+    def set(self, level: float):
+        """Constant level until the next write."""
+        level = max(0.0, min(1.0, level))
+        self._swap((level, None, 0.0, 0.0), level)
+
+    def play(self, envelope, fps: float, t_start: float = None, tail: float = 0.0):
+        """
+        Follow envelope (values in [0, 1], one per 1/fps s) from t_start
+        (perf_counter, default now); `tail` is returned once it runs out.
+        """
+        envelope = tuple(envelope)
+        if not envelope:
+            self.set(tail)
+            return
+        t_start = time.perf_counter() if t_start is None else t_start
+        self._swap((tail, envelope, float(fps), t_start), max(envelope) or tail)
+
+    def read(self, now: float = None) -> float:
+        constant, envelope, fps, t_start = self._state
+        if envelope is None:
+            return constant
+        i = int(((time.perf_counter() if now is None else now) - t_start) * fps)
+        if i < 0:
+            return envelope[0]
+        return envelope[i] if i < len(envelope) else constant
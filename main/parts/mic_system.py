@@ -4,11 +4,16 @@ mic_system.py
 
 A simple microphone system for:
     1) streaming audio chunks via a callback
-    2) recording a fixed-duration WAV file
+    2) reading captured audio from a shared ring buffer (see audio_ring.py)
+    3) recording a fixed-duration WAV file
+
+Captured buffers are written once into a preallocated AudioRing; the
+callback and every reader get memoryview slices of it instead of fresh
+bytes objects.
 
 Usage:
     • Stream in real time:
-        def process(chunk: bytes):
+        def process(chunk: memoryview):
             # e.g. send to ASR, compute levels, etc.
             print(f"Chunk size: {len(chunk)}")
 
@@ -17,6 +22,11 @@ Usage:
       input("Streaming... press Enter to stop\n")
       mic.stop_stream()
 
+    • Several consumers, each at its own pace:
+        vad_reader = mic.reader()
+        chunk = vad_reader.read(960, timeout=0.5)   # zero-copy, None on timeout
+        level = mic.ring.latest(1600)               # peek at the last 50 ms
+
     • Record to file:
         MicSystem.record_to_file("output.wav", duration=5)
 """
@@ -26,44 +36,72 @@ import threading
 import pyaudio
 from typing import Callable
 
+try:
+    from parts.audio_ring import AudioRing, RingReader
+except ImportError:     # run as a script: python parts/mic_system.py / parts/wake_word.py
+    from audio_ring import AudioRing, RingReader
+
 class MicSystem:
     def __init__(self,
                     rate: int = 16000,
                     channels: int = 1,
                     chunk_size: int = 1024,
-                    callback: Callable[[bytes], None] = None):
+                    callback: Callable[[memoryview], None] = None,
+                    buffer_seconds: float = 10.0,
+                    pa=None,
+                    device_index: int = None):
         """
-        :param rate:         sampling rate (Hz)
-        :param channels:     mono=1, stereo=2
-        :param chunk_size:   frames per buffer
-        :param callback:     function(chunk_bytes), called on each captured chunk
+        :param rate:           sampling rate (Hz)
+        :param channels:       mono=1, stereo=2
+        :param chunk_size:     frames per buffer
+        :param callback:       function(chunk_view), called on each captured chunk;
+                               the view points into the ring, bytes(chunk) to keep it
+        :param buffer_seconds: audio kept in the ring for readers
+        :param pa:             PyAudio instance to use (default: a new one)
+        :param device_index:   PyAudio input device (default: the system default)
         """
         self.rate = rate
         self.channels = channels
         self.chunk = chunk_size
         self.callback = callback
+        self.device_index = device_index
+        self.ring = AudioRing(buffer_seconds, rate, 2, channels)
         self._stream = None
-        self._pyaudio = pyaudio.PyAudio()
+        self._pyaudio = pa or pyaudio.PyAudio()
         self._running = False
 
+    def reader(self, from_now: bool = True) -> RingReader:
+        """Independent read position on the capture ring (VAD, STT, wake word, meters)."""
+        return self.ring.reader(from_now)
+
+    def _capture(self, data):
+        pos = self.ring.write_pos
+        self.ring.write(data)
+        if self.callback:
+            self.callback(self.ring.view(pos, len(data)))
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        self._capture(in_data)
+        return None, pyaudio.paContinue
+
     def _stream_loop(self):
         while self._running:
-            data = self._stream.read(self.chunk, exception_on_overflow=False)
-            if self.callback:
-                self.callback(data)
+            self._capture(self._stream.read(self.chunk, exception_on_overflow=False))
 
     def start_stream(self):
         """Begin streaming audio and feeding it to the callback."""
         if self._stream is not None:
             return
         self._running = True
+        self.ring.closed = False
         self._stream = self._pyaudio.open(
             format=pyaudio.paInt16,
             channels=self.channels,
             rate=self.rate,
             input=True,
+            input_device_index=self.device_index,
             frames_per_buffer=self.chunk,
-            stream_callback=lambda in_data, frame_count, time_info, status: (self.callback(in_data), pyaudio.paContinue) if self.callback else (None, pyaudio.paContinue)
+            stream_callback=self._on_audio
         )
         self._stream.start_stream()
         print("[MicSystem] Stream started.")
@@ -75,6 +113,7 @@ class MicSystem:
             self._stream.stop_stream()
             self._stream.close()
             self._stream = None
+        self.ring.close()   # wake blocked readers
         print("[MicSystem] Stream stopped.")
 
     @staticmethod
@@ -4,14 +4,109 @@ reactive_wireframe_2d_circle.py
 A PyQt5 widget that displays a 2D “donut‑node” wireframe network whose
 nodes move and bounce inside a circle, and which expands/contracts
 based on an audio “level” (e.g. your AI TTS amplitude). 
-Call `orb.setLevel(v)` with v in [0.0,1.0] to pulse.
+Call `orb.setLevel(v)` with v in [0.0,1.0] to pulse, or set
+`orb.level_source` to a callable the timer polls once per frame
+(e.g. LevelChannel.read from level_channel.py).
+
+Node motion is one vectorized step (masked reflection off the rim); with
+fixed_timestep=True the physics advances in fixed ticks from an accumulator,
+so timer jitter does not change the animation speed.
+
+Edges are found with one vectorized distance kernel (a uniform-grid cell
+list once the node count makes all-pairs wasteful) and drawn with a single
+QPainter.drawLines call per alpha bucket.
+
+Rendering is adaptive: each tick only invalidates a cached QPixmap, which is
+redrawn on the next paint (so a hidden orb renders nothing), and once the
+level is 0 and the pulse has settled the timer drops to idle_fps. setLevel()
+with a non-zero level switches straight back to full fps. render_stats()
+reports frames, render time and GUI-thread CPU to confirm the saving.
 """
 
 import sys
+import time
 import numpy as np
 from PyQt5.QtWidgets import QApplication, QWidget
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPainter, QPen, QColor
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF, QPixmap
+
+PAIRWISE_MAX_NODES = 400    # above this, neighbours come from the cell grid
+ALPHA_BUCKETS = 16          # distinct edge alphas -> drawLines calls per frame
+
+# half of the 3x3 neighbourhood, so each cell pair is visited once
+_HALF_SHELL = ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _grid_pairs(positions, threshold):
+    """Cell-list neighbour search: only nodes in the same or adjacent threshold-sized cells are compared."""
+    n = len(positions)
+    cells = np.floor(positions / threshold).astype(np.int64)
+    cells -= cells.min(axis=0)
+    # one spare row/column of empty cells so dy=±1 and dx=+1 never alias a real cell
+    ny = int(cells[:, 1].max()) + 2
+    ncells = (int(cells[:, 0].max()) + 2) * ny
+    keys = cells[:, 0] * ny + cells[:, 1]
+    order = np.argsort(keys, kind="stable")
+    sk, sp = keys[order], positions[order]
+    counts = np.bincount(sk, minlength=ncells)
+    starts = np.cumsum(counts) - counts
+    idx = np.arange(n)
+
+    ii, jj = [], []
+    for dx, dy in _HALF_SHELL:
+        nk = sk + dx * ny + dy
+        c, s = counts[nk], starts[nk]
+        if dx == 0 and dy == 0:
+            # same cell: members are contiguous after sorting, take the ones after i
+            c, s = s + c - idx - 1, idx + 1
+        total = int(c.sum())
+        if not total:
+            continue
+        ii.append(np.repeat(idx, c))
+        jj.append(np.repeat(s, c) + np.arange(total) - np.repeat(np.cumsum(c) - c, c))
+    if not ii:
+        return np.empty(0, np.intp), np.empty(0, np.intp), np.empty(0)
+    ii, jj = np.concatenate(ii), np.concatenate(jj)
+    delta = sp[ii] - sp[jj]
+    d = np.hypot(delta[:, 0], delta[:, 1])
+    keep = d < threshold
+    return order[ii[keep]], order[jj[keep]], d[keep]
+
+
+def edge_pairs(positions, threshold):
+    """Index arrays (i, j) of node pairs closer than threshold, and their distances."""
+    n = len(positions)
+    if n < 2:
+        return np.empty(0, np.intp), np.empty(0, np.intp), np.empty(0)
+    if n > PAIRWISE_MAX_NODES:
+        return _grid_pairs(positions, threshold)
+    delta = positions[:, None, :] - positions[None, :, :]
+    d2 = np.einsum("ijk,ijk->ij", delta, delta)
+    i, j = np.nonzero(np.triu(d2 < threshold * threshold, 1))
+    return i, j, np.sqrt(d2[i, j])
+
+
+def step_nodes(positions, velocities):
+    """Advance every node one tick and bounce the ones that left the unit circle, in place."""
+    positions += velocities
+    r = np.hypot(positions[:, 0], positions[:, 1])
+    out = r > 1.0
+    if out.any():
+        # project outward normal; reflect velocity: v' = v - 2 (v·n) n; push back onto the rim
+        normal = positions[out] / r[out, None]
+        v = velocities[out]
+        velocities[out] = v - 2 * np.einsum("ij,ij->i", v, normal)[:, None] * normal
+        positions[out] = normal
+
+
+def _polygon(points):
+    """QPolygonF filled straight from an (n, 2) float array, no per-point Python objects."""
+    poly = QPolygonF(len(points))
+    buf = poly.data()
+    buf.setsize(points.size * 8)
+    np.frombuffer(buf, dtype=np.float64).reshape(-1, 2)[:] = points
+    return poly
+
 
 class ReactiveWireframe2DCircle(QWidget):
     def __init__(self,
@@ -22,7 +117,11 @@ class ReactiveWireframe2DCircle(QWidget):
                     max_pulse=0.4,
                     damping=0.2,
                     x=None,
-                    y=None):
+                    y=None,
+                    fixed_timestep=False,
+                    max_catchup_steps=5,
+                    idle_fps=5,
+                    level_source=None):
         super().__init__()
         self.setFixedSize(diameter, diameter)
         
@@ -55,6 +154,7 @@ class ReactiveWireframe2DCircle(QWidget):
         self.velocities = np.column_stack((np.cos(ang_vels), np.sin(ang_vels))) * speeds[:, None]
 
         # Audio‑reactive scaling
+        self.level_source = level_source   # optional callable polled each tick
         self.level     = 0.0
         self.scale     = 1.0
         self.max_pulse = max_pulse
@@ -66,6 +166,22 @@ class ReactiveWireframe2DCircle(QWidget):
         self.node_color = QColor(255, 255, 255)
         self.node_radius = 3
 
+        # Physics: one step per timer tick, or fixed 1/fps ticks from an accumulator
+        self.fixed_timestep = fixed_timestep
+        self.step_seconds = 1.0 / fps
+        self.max_catchup_steps = max_catchup_steps
+        self._accumulator = 0.0
+        self._last_tick = None
+
+        # Adaptive frame rate and cached frame
+        self.active_fps = fps
+        self.idle_fps = min(idle_fps, fps)
+        self.current_fps = fps
+        self._frame = None          # QPixmap of the last rendered state, None = stale
+
+        # Counters for render_stats()
+        self.reset_render_stats()
+
         # Timer for animation
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._on_timer)
@@ -78,32 +194,103 @@ class ReactiveWireframe2DCircle(QWidget):
     def setLevel(self, lvl: float):
         """Clamp and set audio level in [0.0, 1.0]."""
         self.level = max(0.0, min(1.0, lvl))
+        if self.level > 0.0 and self.current_fps != self.active_fps:
+            self._set_fps(self.active_fps)
+
+    def _set_fps(self, fps: int):
+        self.current_fps = fps
+        self.timer.setInterval(int(1000 / fps))
+
+    def invalidate(self):
+        """Drop the cached frame; the next paint re-renders the network."""
+        self._frame = None
+        self.update()
+
+    def reset_render_stats(self):
+        self._stats_t0 = time.perf_counter()
+        self.ticks = 0
+        self.frames_rendered = 0
+        self.paints = 0
+        self._render_seconds = 0.0
+        self._cpu_seconds = 0.0
+
+    def render_stats(self) -> dict:
+        """Counters since the last reset_render_stats(); CPU is GUI-thread time spent in ticks and paints."""
+        wall = max(time.perf_counter() - self._stats_t0, 1e-9)
+        return {
+            "mode": "idle" if self.current_fps != self.active_fps else "active",
+            "timer_fps": self.current_fps,
+            "ticks": self.ticks,
+            "frames_rendered": self.frames_rendered,
+            "paints": self.paints,
+            "render_fps": round(self.frames_rendered / wall, 1),
+            "avg_render_ms": round(1000 * self._render_seconds / self.frames_rendered, 2) if self.frames_rendered else 0.0,
+            "cpu_percent": round(100 * self._cpu_seconds / wall, 2),
+        }
+
+    def _steps_due(self) -> int:
+        if not self.fixed_timestep:
+            return 1
+        now = time.perf_counter()
+        if self._last_tick is None:
+            self._last_tick = now
+            return 1
+        self._accumulator += now - self._last_tick
+        self._last_tick = now
+        steps = int(self._accumulator / self.step_seconds)
+        self._accumulator -= steps * self.step_seconds
+        if steps > self.max_catchup_steps:
+            # after a long stall (window hidden, debugger) skip ahead instead of fast-forwarding
+            steps, self._accumulator = self.max_catchup_steps, 0.0
+        return steps
 
     def _on_timer(self):
-        # Smoothly interpolate scale toward target
-        target = 1.0 + self.level * self.max_pulse
-        self.scale += (target - self.scale) * self.damping
-
-        # Move nodes
-        self.positions += self.velocities
-
-        # Bounce inside unit circle
-        for i, pos in enumerate(self.positions):
-            r = np.linalg.norm(pos)
-            if r > 1.0:
-                # project outward normal
-                normal = pos / r
-                # reflect velocity: v' = v - 2 (v·n) n
-                v = self.velocities[i]
-                self.velocities[i] = v - 2 * np.dot(v, normal) * normal
-                # push back inside
-                self.positions[i] = normal * 1.0
+        cpu0 = time.thread_time()
+        self.ticks += 1
+        if self.level_source is not None:
+            self.setLevel(self.level_source())
+        steps = self._steps_due()
+        for _ in range(steps):
+            # Smoothly interpolate scale toward target
+            target = 1.0 + self.level * self.max_pulse
+            self.scale += (target - self.scale) * self.damping
+
+            # Move nodes, bounce inside unit circle
+            step_nodes(self.positions, self.velocities)
+
+        # Silent and settled: keep drifting, but at the idle frame rate
+        settled = self.level == 0.0 and abs(self.scale - 1.0) < 1e-3
+        if settled and self.current_fps != self.idle_fps:
+            self._set_fps(self.idle_fps)
 
         # Trigger repaint
-        self.update()
+        if steps:
+            self.invalidate()
+        self._cpu_seconds += time.thread_time() - cpu0
+
+    def _render_frame(self) -> QPixmap:
+        t0, cpu0 = time.perf_counter(), time.thread_time()
+        ratio = self.devicePixelRatioF()
+        frame = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        frame.setDevicePixelRatio(ratio)
+        frame.fill(Qt.transparent)
+        painter = QPainter(frame)
+        self._draw(painter)
+        painter.end()
+        self.frames_rendered += 1
+        self._render_seconds += time.perf_counter() - t0
+        self._cpu_seconds += time.thread_time() - cpu0
+        return frame
 
     def paintEvent(self, event):
+        self.paints += 1
+        if self._frame is None:
+            self._frame = self._render_frame()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._frame)
+        painter.end()
+
+    def _draw(self, painter):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Compute display positions
@@ -112,21 +299,28 @@ class ReactiveWireframe2DCircle(QWidget):
         # Scale normalized positions by radius*0.9 and audio scale
         disp = self.positions * (w/2 * 0.9) * self.scale + center
 
-        # Draw edges
+        # Draw edges: threshold test in unscaled unit-circle coords,
+        # alpha fades with distance and is quantized so each bucket is one drawLines call
         pen = QPen(self.edge_color)
         pen.setWidth(1)
-        painter.setPen(pen)
-        for i in range(self.n_nodes):
-            xi, yi = disp[i]
-            for j in range(i+1, self.n_nodes):
-                xj, yj = disp[j]
-                # Use unscaled positions for threshold test in unit circle coords
-                if np.linalg.norm(self.positions[i] - self.positions[j]) < self.threshold:
-                    alpha = int(255 * (1 - np.linalg.norm(self.positions[i] - self.positions[j]) / self.threshold))
-                    color = QColor(255, 255, 255, alpha)
-                    pen.setColor(color)
-                    painter.setPen(pen)
-                    painter.drawLine(int(xi), int(yi), int(xj), int(yj))
+        i, j, dist = edge_pairs(self.positions, self.threshold)
+        strength = 1.0 - dist / self.threshold
+        buckets = np.minimum((strength * ALPHA_BUCKETS).astype(np.intp), ALPHA_BUCKETS - 1)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(ALPHA_BUCKETS + 1))
+        # endpoints interleaved: p_i0, p_j0, p_i1, p_j1, ... as drawLines expects
+        ends = np.empty((len(order), 2, 2))
+        ends[:, 0] = disp[i[order]]
+        ends[:, 1] = disp[j[order]]
+        ends = ends.reshape(-1, 2)
+        for b in range(ALPHA_BUCKETS):
+            lo, hi = bounds[b], bounds[b + 1]
+            if lo == hi:
+                continue
+            alpha = int(255 * (b + 0.5) / ALPHA_BUCKETS)
+            pen.setColor(QColor(self.edge_color.red(), self.edge_color.green(), self.edge_color.blue(), alpha))
+            painter.setPen(pen)
+            painter.drawLines(_polygon(ends[2 * lo:2 * hi]))
 
         # Draw nodes (hollow circles)
         pen = QPen(self.node_color)
@@ -136,8 +330,6 @@ class ReactiveWireframe2DCircle(QWidget):
             painter.drawEllipse(int(x - self.node_radius), int(y - self.node_radius),
                                 self.node_radius*2, self.node_radius*2)
 
-        painter.end()
-
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
@@ -169,4 +361,12 @@ if __name__ == "__main__":
     demo_timer.start(200)  # random level every 200 ms
     QTimer.singleShot(6000, lambda: (demo_timer.stop(), quiet()))
 
+    # render counters every 2 s: watch render_fps / cpu_percent drop once it goes idle
+    def report():
+        print(orb.render_stats())
+        orb.reset_render_stats()
+    stats_timer = QTimer()
+    stats_timer.timeout.connect(report)
+    stats_timer.start(2000)
+
     sys.exit(app.exec_())
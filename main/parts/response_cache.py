@@ -0,0 +1,252 @@
+"""
+response_cache.py
+
+Cache in front of the agent for commands that repeat ("open chrome",
+"list processes").
+
+Two kinds of entries:
+    tool    – the agent answered by calling a single tool; a hit replays that
+              tool call directly (fresh result, no LLM round-trip)
+    answer  – plain chat reply; a hit returns the stored text
+
+Lookup is exact on normalized text first, then by cosine similarity of a
+cheap hashed character-trigram embedding. A fuzzy hit must carry the same
+numbers, and for tool plans every word of the cached tool input must appear
+in the new phrase, so "kill 1234" never reuses the plan for "kill 1243" and
+"kill chrome" never replays for "kill chromium". Entries expire by TTL,
+the least recently used are evicted past max_entries, and the table is
+persisted as JSON so it survives restarts.
+
+Usage:
+    cache = ResponseCache("cache/response_cache.json")
+    hit = cache.lookup(text)
+    if hit is None:
+        ... run agent ...
+        cache.store(text, output, tool_calls=[("AppLauncher", {"query": "chrome"})], latency=2.4)
+"""
+
+import os
+import re
+import json
+import time
+import zlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+EMBED_DIM = 512
+_FILLER = re.compile(r"\b(please|hey delta|delta|can you|could you|would you|for me|now|just)\b")
+_NON_WORD = re.compile(r"[^\w\s]")
+_NUMBER = re.compile(r"\d+")
+
+
+def normalize(text: str) -> str:
+    text = _NON_WORD.sub(" ", (text or "").lower())
+    text = _FILLER.sub(" ", text)
+    return " ".join(text.split())
+
+
+def embed(norm: str) -> np.ndarray:
+    """Hashed character-trigram bag, L2-normalized. crc32 keeps it stable across runs."""
+    vec = np.zeros(EMBED_DIM, dtype=np.float32)
+    padded = f"  {norm} "
+    for i in range(len(padded) - 2):
+        vec[zlib.crc32(padded[i:i + 3].encode("utf-8")) % EMBED_DIM] += 1.0
+    n = np.linalg.norm(vec)
+    return vec / n if n else vec
+
+
+def _arguments_present(tool_input, key: str) -> bool:
+    """True when every word of the cached tool input also occurs in key."""
+    if isinstance(tool_input, dict):
+        values = [v for v in tool_input.values() if isinstance(v, str)]
+    else:
+        values = [str(tool_input or "")]
+    words = set(key.split())
+    return all(w in words for v in values for w in normalize(v).split())
+
+
+class CacheEntry:
+    def __init__(self, key, kind, payload, latency, created=None, hits=0):
+        self.key = key
+        self.kind = kind          # "tool" | "answer"
+        self.payload = payload    # {"tool": name, "input": ...} or {"output": text}
+        self.latency = latency    # seconds the original agent call took
+        self.created = created or time.time()
+        self.hits = hits
+        self.numbers = tuple(_NUMBER.findall(key))
+        self.vector = embed(key)
+
+    def to_json(self) -> dict:
+        return {"key": self.key, "kind": self.kind, "payload": self.payload,
+                "latency": self.latency, "created": self.created, "hits": self.hits}
+
+
+class ResponseCache:
+    def __init__(self,
+                    path: str = None,
+                    max_entries: int = 500,
+                    ttl_tool: float = 7 * 24 * 3600,
+                    ttl_answer: float = 600,
+                    similarity: float = 0.9):
+        """
+        :param path:        JSON file to persist to (None = memory only)
+        :param max_entries: LRU bound
+        :param ttl_tool:    seconds a cached tool plan stays valid
+        :param ttl_answer:  seconds a cached chat answer stays valid
+        :param similarity:  minimum cosine similarity for a fuzzy hit
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = {"tool": ttl_tool, "answer": ttl_answer}
+        self.similarity = similarity
+        self._entries = OrderedDict()   # key -> CacheEntry, oldest first
+        self._matrix = None             # stacked vectors, rebuilt lazily
+        self._keys = []
+        self._lock = threading.Lock()
+
+        # counters
+        self.lookups = 0
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.saved_seconds = 0.0
+
+        self._load()
+
+    # ---------- lookup / store ----------
+    def lookup(self, text: str):
+        """Return a CacheEntry for text, or None."""
+        key = normalize(text)
+        if not key:
+            return None
+        with self._lock:
+            self.lookups += 1
+            self._expire()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.exact_hits += 1
+            else:
+                entry = self._nearest(key)
+                if entry is not None:
+                    self.fuzzy_hits += 1
+            if entry is None:
+                return None
+            entry.hits += 1
+            self._entries.move_to_end(entry.key)
+            return entry
+
+    def _nearest(self, key: str):
+        if not self._entries:
+            return None
+        if self._matrix is None:
+            self._keys = list(self._entries.keys())
+            self._matrix = np.stack([self._entries[k].vector for k in self._keys])
+        sims = self._matrix @ embed(key)
+        order = np.argsort(sims)[::-1]
+        numbers = tuple(_NUMBER.findall(key))
+        for i in order[:5]:
+            if sims[i] < self.similarity:
+                break
+            entry = self._entries.get(self._keys[i])
+            if entry is None or entry.numbers != numbers:
+                continue
+            if entry.kind == "tool" and not _arguments_present(entry.payload.get("input"), key):
+                continue
+            return entry
+        return None
+
+    def store(self, text: str, output: str, tool_calls=(), latency: float = 0.0):
+        """
+        Record the outcome of an agent turn. Turns with exactly one tool call are
+        stored as replayable tool plans; turns without tools as answers; anything
+        else (multi-tool plans, errors) is not cached.
+        """
+        key = normalize(text)
+        if not key:
+            return
+        tool_calls = list(tool_calls)
+        if len(tool_calls) == 1:
+            name, tool_input = tool_calls[0]
+            entry = CacheEntry(key, "tool", {"tool": name, "input": tool_input}, latency)
+        elif not tool_calls and output:
+            entry = CacheEntry(key, "answer", {"output": output}, latency)
+        else:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._matrix = None
+        self._save()
+
+    def record_saving(self, seconds: float):
+        with self._lock:
+            self.saved_seconds += max(0.0, seconds)
+
+    def invalidate(self, text: str):
+        with self._lock:
+            if self._entries.pop(normalize(text), None) is not None:
+                self._matrix = None
+        self._save()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.exact_hits + self.fuzzy_hits
+            return {
+                "entries": len(self._entries),
+                "lookups": self.lookups,
+                "hits": hits,
+                "exact_hits": self.exact_hits,
+                "fuzzy_hits": self.fuzzy_hits,
+                "hit_rate": hits / self.lookups if self.lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
+
+    # ---------- eviction / persistence ----------
+    def _expire(self):
+        now = time.time()
+        dead = [k for k, e in self._entries.items() if now - e.created > self.ttl.get(e.kind, 0)]
+        for k in dead:
+            del self._entries[k]
+        if dead:
+            self._matrix = None
+
+    def _load(self):
+        if not self.path or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+            for row in rows:
+                entry = CacheEntry(row["key"], row["kind"], row["payload"], row.get("latency", 0.0),
+                                   row.get("created"), row.get("hits", 0))
+                self._entries[entry.key] = entry
+            self._expire()
+        except Exception as e:
+            print("[ResponseCache] could not load cache:", e)
+            self._entries.clear()
+
+    def _save(self):
+        if not self.path:
+            return
+        with self._lock:
+            rows = [e.to_json() for e in self._entries.values()]
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(rows, f, indent=1)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print("[ResponseCache] could not save cache:", e)
+
+
+def create_response_cache(config: dict = None) -> ResponseCache:
+    """Build from settings {"path": ..., "max_entries": ..., ...}; a relative path is under main/."""
+    config = dict(config or {})
+    path = config.pop("path", os.path.join("cache", "response_cache.json"))
+    if path and not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), path)
+    return ResponseCache(path, **config)
@@ -0,0 +1,62 @@
+"""
+sentence_stream.py
+
+Incremental sentence splitter for streamed LLM output, so each sentence can be
+handed to TTS as soon as it is complete instead of waiting for the full reply.
+
+Usage:
+    splitter = SentenceSplitter()
+    for token in llm_tokens:
+        for sentence in splitter.feed(token):
+            tts.say(sentence)
+    rest = splitter.flush()
+    if rest:
+        tts.say(rest)
+"""
+
+import re
+
+# end punctuation (plus closing quotes/brackets) followed by whitespace, or a line break
+_BOUNDARY = re.compile(r'[.!?…]+["\')\]]*\s+|\n+')
+_ABBREVIATIONS = ("e.g.", "i.e.", "etc.", "mr.", "mrs.", "ms.", "dr.", "vs.", "st.")
+
+
+class SentenceSplitter:
+    def __init__(self, min_chars: int = 12, max_chars: int = 220):
+        """
+        :param min_chars: shorter pieces ("Sure.") are merged into the next sentence
+        :param max_chars: run-on text is cut at a comma/space once it gets this long
+        """
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buf = ""
+
+    def feed(self, text: str) -> list:
+        """Add streamed text; returns the sentences it completed (possibly none)."""
+        self._buf += text
+        out = []
+        start = 0
+        for m in _BOUNDARY.finditer(self._buf):
+            piece = self._buf[start:m.end()].strip()
+            if len(piece) < self.min_chars:
+                continue
+            if piece.lower().endswith(_ABBREVIATIONS):
+                continue
+            out.append(piece)
+            start = m.end()
+        self._buf = self._buf[start:]
+
+        while len(self._buf) > self.max_chars:
+            cut = self._buf.rfind(", ", 0, self.max_chars)
+            if cut < self.min_chars:
+                cut = self._buf.rfind(" ", 0, self.max_chars)
+            if cut < self.min_chars:
+                cut = self.max_chars
+            out.append(self._buf[:cut + 1].strip())
+            self._buf = self._buf[cut + 1:]
+        return out
+
+    def flush(self) -> str:
+        """Whatever is left once the stream ends ("" if nothing)."""
+        rest, self._buf = self._buf.strip(), ""
+        return rest
@@ -0,0 +1,188 @@
+"""
+stt_backend.py
+
+Pluggable speech-to-text backends.
+
+Every backend speaks the same streaming protocol so the VAD loop can hand it
+audio while the user is still talking:
+
+    stt = create_stt_backend({"backend": "vosk", "vosk": {"model_path": "models/vosk-small-en"}})
+    stt.start(on_partial=lambda text: print("...", text))
+    for chunk in voiced_chunks:          # 16-bit mono PCM, ~30 ms each
+        stt.accept(chunk)
+    text = stt.finish()                  # final hypothesis ("" if nothing)
+
+Backends:
+    google  – speech_recognition's recognize_google; buffers, recognizes on finish()
+    vosk    – local Kaldi model; decodes each chunk as it arrives, emits partials
+"""
+
+import json
+from typing import Callable, Optional
+
+import speech_recognition as sr
+
+
+class SttBackend:
+    """Base class; subclasses override _accept/_finish (and optionally _start)."""
+    name = "base"
+    streaming = False   # True when accept() decodes incrementally
+
+    def __init__(self, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        self._on_partial: Optional[Callable[[str], None]] = None
+        self._active = False
+        self._last_partial = ""
+
+    def start(self, on_partial: Callable[[str], None] = None):
+        """Begin a new utterance; on_partial(text) is called whenever the hypothesis changes."""
+        self._on_partial = on_partial
+        self._last_partial = ""
+        self._active = True
+        self._start()
+
+    def accept(self, chunk):
+        if not self._active:
+            self.start()
+        partial = self._accept(chunk)
+        if partial and partial != self._last_partial:
+            self._last_partial = partial
+            if self._on_partial:
+                try:
+                    self._on_partial(partial)
+                except Exception as e:
+                    print("STT partial callback failed:", e)
+
+    def finish(self) -> str:
+        """End the utterance and return the final text ("" when nothing was understood)."""
+        if not self._active:
+            return ""
+        self._active = False
+        return (self._finish() or "").strip()
+
+    def cancel(self):
+        """Drop the current utterance without decoding it."""
+        self._active = False
+        self._cancel()
+
+    def transcribe(self, frames: bytes, rate: int = None) -> str:
+        """One-shot helper for already-buffered audio."""
+        if rate and rate != self.sample_rate:
+            frames = sr.AudioData(frames, rate, 2).get_raw_data(convert_rate=self.sample_rate)
+        self.start()
+        self.accept(frames)
+        return self.finish()
+
+    # ---------- hooks ----------
+    def _start(self):
+        pass
+
+    def _accept(self, chunk) -> Optional[str]:
+        raise NotImplementedError
+
+    def _finish(self) -> str:
+        raise NotImplementedError
+
+    def _cancel(self):
+        pass
+
+
+class GoogleSttBackend(SttBackend):
+    """The original cloud path: collect the phrase, then one blocking request."""
+    name = "google"
+
+    def __init__(self, sample_rate: int = 16000, language: str = "en-US"):
+        super().__init__(sample_rate)
+        self.language = language
+        self.recognizer = sr.Recognizer()
+        self._buffer = bytearray()
+
+    def _start(self):
+        self._buffer.clear()
+
+    def _accept(self, chunk):
+        self._buffer.extend(chunk)
+        return None
+
+    def _finish(self) -> str:
+        audio = sr.AudioData(bytes(self._buffer), self.sample_rate, 2)
+        self._buffer.clear()
+        try:
+            return self.recognizer.recognize_google(audio, language=self.language)
+        except sr.UnknownValueError:
+            return ""
+        except sr.RequestError as e:
+            print("STT error (google):", e)
+            return ""
+
+    def _cancel(self):
+        self._buffer.clear()
+
+
+class VoskSttBackend(SttBackend):
+    """Offline streaming recognizer; models are loaded once per path and shared."""
+    name = "vosk"
+    streaming = True
+    _models = {}
+
+    def __init__(self, model_path: str, sample_rate: int = 16000):
+        super().__init__(sample_rate)
+        import vosk  # optional dependency, only needed when this backend is selected
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        model = VoskSttBackend._models.get(model_path)
+        if model is None:
+            model = VoskSttBackend._models[model_path] = vosk.Model(model_path)
+        self.model = model
+        self._rec = None
+        self._committed = []   # segments vosk already finalized mid-utterance
+
+    def _start(self):
+        self._rec = self._vosk.KaldiRecognizer(self.model, self.sample_rate)
+        self._committed = []
+
+    def _accept(self, chunk):
+        if self._rec.AcceptWaveform(bytes(chunk)):
+            # vosk hit an internal endpoint; keep that segment and carry on
+            seg = json.loads(self._rec.Result()).get("text", "")
+            if seg:
+                self._committed.append(seg)
+            return " ".join(self._committed)
+        partial = json.loads(self._rec.PartialResult()).get("partial", "")
+        return " ".join(self._committed + ([partial] if partial else []))
+
+    def _finish(self) -> str:
+        tail = json.loads(self._rec.FinalResult()).get("text", "")
+        self._rec = None
+        return " ".join(self._committed + ([tail] if tail else []))
+
+    def _cancel(self):
+        self._rec = None
+        self._committed = []
+
+
+BACKENDS = {
+    "google": GoogleSttBackend,
+    "vosk": VoskSttBackend,
+}
+
+
+def create_stt_backend(config: dict = None, sample_rate: int = 16000) -> SttBackend:
+    """
+    Build the backend named in config["backend"] (default "google"); its keyword
+    arguments come from config[<backend name>]. Falls back to google when a local
+    engine cannot be loaded.
+    """
+    config = config or {}
+    name = config.get("backend", "google").lower()
+    cls = BACKENDS.get(name)
+    if cls is None:
+        print(f"Unknown STT backend '{name}', using google.")
+        return GoogleSttBackend(sample_rate=sample_rate)
+    try:
+        return cls(sample_rate=sample_rate, **config.get(name, {}))
+    except Exception as e:
+        if cls is GoogleSttBackend:
+            raise
+        print(f"STT backend '{name}' unavailable ({e}); using google.")
+        return GoogleSttBackend(sample_rate=sample_rate)
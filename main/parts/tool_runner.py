@@ -0,0 +1,311 @@
+"""
+tool_runner.py
+
+Bounded, timed execution of the agent's tools.
+
+AgentExecutor's async loop (the one Delta streams from) already gathers
+every tool call of one step, but the sync @tools it wraps then land on
+the event loop's default executor: no bound, no timeout, no numbers.
+ToolRunner.wrap(tool) returns a stand-in with the same name, description,
+schema and return_direct whose calls go through one shared pool:
+
+    • at most `max_workers` tool calls run at once; further calls wait in
+      a queue for a slot
+    • each call has its own timeout (per tool name, else the default),
+      counted from when it starts running, not from when it was queued. A
+      call that runs over returns "<tool> timed out after N s" as its
+      observation so the agent can carry on. The thread itself cannot be
+      killed; it finishes in the background and gives its slot back
+      right away, so a hung tool does not shrink the pool. Up to
+      `max_abandoned` such calls get extra threads; past that a timed-out
+      call keeps its slot until it ends
+    • a call that waits `queue_timeout` seconds without getting a slot is
+      not started and returns "<tool> not started: ..." (starvation,
+      counted apart from timeouts)
+    • per-tool latency / error / timeout / starved counters, and
+      summary(since) gives the wall-clock time of the calls since a moment
+      next to their sum, i.e. what running them side by side saved
+
+run_many() does the same for a list of (tool, input) outside the agent,
+results in call order.
+
+Usage:
+    runner = ToolRunner(max_workers=4, timeouts={"OpenCodeModule": 330})
+    tools = runner.wrap_all([AppLauncher, kill_process_tool])
+    executor = AgentExecutor(agent=agent, tools=tools)
+    ...
+    print(runner.summary(since=t0), runner.stats())
+"""
+
+import time
+import asyncio
+import threading
+from typing import Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from langchain_core.tools import BaseTool
+
+
+class _ToolStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.timeouts = 0
+        self.starved = 0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(1000 * self.total / self.count, 1) if self.count else 0.0,
+            "max_ms": round(1000 * self.max, 1),
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "starved": self.starved,
+        }
+
+
+class _Call:
+    """One queued tool call; `started` resolves to its start time, `done` to the tool's result."""
+    __slots__ = ("tool", "payload", "queued", "started", "done", "slot")
+
+    def __init__(self, tool, payload):
+        self.tool = tool
+        self.payload = payload
+        self.queued = time.perf_counter()
+        self.started = Future()
+        self.done = Future()
+        self.slot = False       # holds one of the max_workers slots
+
+
+class TimedTool(BaseTool):
+    """A tool that forwards to `inner` through a ToolRunner."""
+    inner: Any = None
+    runner: Any = None
+
+    def _payload(self, args, kwargs):
+        if kwargs:
+            return kwargs
+        return args[0] if len(args) == 1 else list(args)
+
+    def _run(self, *args, **kwargs):
+        kwargs.pop("run_manager", None)
+        return self.runner.call(self.inner, self._payload(args, kwargs))
+
+    async def _arun(self, *args, **kwargs):
+        kwargs.pop("run_manager", None)
+        return await self.runner.acall(self.inner, self._payload(args, kwargs))
+
+
+class ToolRunner:
+    def __init__(self, max_workers: int = 4, timeout: float = 30.0, timeouts: dict = None,
+                 queue_timeout: float = 30.0, max_abandoned: int = 4):
+        """
+        :param max_workers:   tool calls allowed to run at the same time
+        :param timeout:       seconds a call may run before it is given up on
+        :param timeouts:      tool name -> seconds, overriding `timeout`
+        :param queue_timeout: seconds a call may wait for a free slot before it is refused
+        :param max_abandoned: timed-out calls still running that may give their slot back
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.queue_timeout = queue_timeout
+        self.max_abandoned = max_abandoned
+        # slot holders plus abandoned calls never exceed this, so a call starts as soon as it gets a slot
+        self._pool = ThreadPoolExecutor(max_workers=max_workers + max_abandoned, thread_name_prefix="tool")
+        self._lock = threading.Lock()
+        self._pending = deque()         # _Calls waiting for a slot
+        self._stats = {}
+        self._calls = []                # (tool name, t_start, t_end), most recent last
+        self.busy = 0                   # calls holding a slot
+        self.abandoned = 0              # timed-out calls still running without a slot
+        self.running = 0
+        self.peak_running = 0
+
+    # ---------- wrapping ----------
+    def wrap(self, tool: BaseTool) -> TimedTool:
+        return TimedTool(name=tool.name, description=tool.description, args_schema=tool.args_schema,
+                         return_direct=tool.return_direct, inner=tool, runner=self)
+
+    def wrap_all(self, tools) -> list:
+        return [self.wrap(t) for t in tools]
+
+    def timeout_for(self, name: str) -> float:
+        return self.timeouts.get(name, self.timeout)
+
+    # ---------- scheduling ----------
+    def _submit(self, tool, payload) -> _Call:
+        call = _Call(tool, payload)
+        with self._lock:
+            self._pending.append(call)
+            self._dispatch()
+        return call
+
+    def _dispatch(self):
+        """Start queued calls while slots are free (lock held)."""
+        while self._pending and self.busy < self.max_workers:
+            call = self._pending.popleft()
+            call.slot = True
+            self.busy += 1
+            self._pool.submit(self._invoke, call)
+
+    def _unqueue(self, call: _Call) -> bool:
+        """Drop a call that has not started; False if it already got a slot."""
+        with self._lock:
+            try:
+                self._pending.remove(call)
+                return True
+            except ValueError:
+                return False
+
+    def _invoke(self, call: _Call):
+        tool = call.tool
+        with self._lock:
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        t0 = time.perf_counter()
+        call.started.set_result(t0)
+        ok = False
+        try:
+            call.done.set_result(tool.invoke(call.payload))
+            ok = True
+        except BaseException as e:
+            call.done.set_exception(e)
+        finally:
+            t1 = time.perf_counter()
+            with self._lock:
+                self.running -= 1
+                if call.slot:
+                    self.busy -= 1
+                else:
+                    self.abandoned -= 1
+                stats = self._stats.setdefault(tool.name, _ToolStats())
+                stats.add(t1 - t0)
+                if not ok:
+                    stats.errors += 1
+                self._calls.append((tool.name, t0, t1))
+                del self._calls[:-256]
+                self._dispatch()
+
+    def _timed_out(self, call: _Call) -> str:
+        tool = call.tool
+        with self._lock:
+            self._stats.setdefault(tool.name, _ToolStats()).timeouts += 1
+            # the thread runs on; its slot goes to the queue unless too many are already abandoned
+            if call.slot and not call.done.done() and self.abandoned < self.max_abandoned:
+                call.slot = False
+                self.busy -= 1
+                self.abandoned += 1
+                self._dispatch()
+        seconds = self.timeout_for(tool.name)
+        print(f"[Tools] {tool.name} timed out after {seconds:g} s")
+        return f"{tool.name} timed out after {seconds:g} s"
+
+    def _starved(self, call: _Call) -> str:
+        tool = call.tool
+        with self._lock:
+            self._stats.setdefault(tool.name, _ToolStats()).starved += 1
+            busy, abandoned = self.busy, self.abandoned
+        print(f"[Tools] {tool.name} not started: no free slot in {self.queue_timeout:g} s "
+              f"({busy} busy, {abandoned} abandoned)")
+        return f"{tool.name} not started: all {self.max_workers} tool slots busy for {self.queue_timeout:g} s"
+
+    def _queue_left(self, call: _Call):
+        if self.queue_timeout is None:
+            return None
+        return max(0.0, call.queued + self.queue_timeout - time.perf_counter())
+
+    def _remaining(self, call: _Call, t0: float) -> float:
+        return max(0.0, t0 + self.timeout_for(call.tool.name) - time.perf_counter())
+
+    # ---------- calls ----------
+    def _wait(self, call: _Call):
+        """Result of a submitted call (tool exceptions are raised), or the timeout / starvation message."""
+        try:
+            t0 = call.started.result(self._queue_left(call))
+        except FutureTimeout:
+            if self._unqueue(call):
+                return self._starved(call)
+            t0 = call.started.result()
+        try:
+            return call.done.result(self._remaining(call, t0))
+        except FutureTimeout:
+            return self._timed_out(call)
+
+    def call(self, tool, payload):
+        return self._wait(self._submit(tool, payload))
+
+    async def acall(self, tool, payload):
+        call = self._submit(tool, payload)
+        try:
+            # shield: wait_for would otherwise cancel the underlying futures on timeout
+            try:
+                t0 = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(call.started)),
+                                            self._queue_left(call))
+            except asyncio.TimeoutError:
+                if self._unqueue(call):
+                    return self._starved(call)
+                t0 = await asyncio.wrap_future(call.started)
+            try:
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(call.done)),
+                                              self._remaining(call, t0))
+            except asyncio.TimeoutError:
+                return self._timed_out(call)
+        except asyncio.CancelledError:
+            self._unqueue(call)
+            raise
+
+    def run_many(self, calls) -> list:
+        """[(tool, input), ...] side by side; results (or exceptions) in the same order."""
+        submitted = [self._submit(tool, payload) for tool, payload in calls]
+        results = []
+        for call in submitted:
+            try:
+                results.append(self._wait(call))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    # ---------- numbers ----------
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: s.as_dict() for name, s in self._stats.items()}
+
+    def summary(self, since: float) -> dict:
+        """Calls started at/after `since` (perf_counter): count, summed latency and actual wall-clock."""
+        with self._lock:
+            spans = sorted((t0, t1) for _, t0, t1 in self._calls if t0 >= since)
+        if not spans:
+            return {"calls": 0, "sum_ms": 0.0, "wall_ms": 0.0, "saved_ms": 0.0}
+        wall, (cur0, cur1) = 0.0, spans[0]
+        for t0, t1 in spans[1:]:
+            if t0 > cur1:
+                wall += cur1 - cur0
+                cur0, cur1 = t0, t1
+            else:
+                cur1 = max(cur1, t1)
+        wall += cur1 - cur0
+        total = sum(t1 - t0 for t0, t1 in spans)
+        return {"calls": len(spans), "sum_ms": round(total * 1000, 1), "wall_ms": round(wall * 1000, 1),
+                "saved_ms": round((total - wall) * 1000, 1)}
+
+    def close(self):
+        with self._lock:
+            pending, self._pending = list(self._pending), deque()
+        for call in pending:
+            call.started.set_exception(RuntimeError("tool runner closed"))
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def create_tool_runner(config: dict = None) -> ToolRunner:
+    """Build from settings {"max_workers": ..., "timeout": ..., "timeouts": {tool: seconds},
+    "queue_timeout": ..., "max_abandoned": ...}."""
+    return ToolRunner(**(config or {}))
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+tts_worker.py
+
+Long-lived pyttsx3 worker so replies do not pay interpreter + engine startup.
+
+The engine runs in its own process (pyttsx3's runAndWait blocks and does not
+play well with the Qt thread), started once and fed over stdin/stdout with
+one JSON message per line:
+
+    parent -> worker   {"cmd": "say", "id": 3, "text": "..."}
+                       {"cmd": "stop"}                      # barge-in
+    worker -> parent   {"event": "ready"}
+                       {"event": "start", "id": 3}          # audio begins
+                       {"event": "done", "id": 3, "cancelled": false}
+
+With envelope_fps set, the worker renders each sentence to a WAV
+(save_to_file), computes its RMS envelope at that rate and plays the PCM
+itself through PyAudio; the "start" event then carries
+{"fps": 30, "envelope": [0.0, 0.41, ...]} and the parent feeds it to a
+LevelChannel so the orb follows the actual speech. If rendering to a file
+or PyAudio is unavailable the worker falls back to plain runAndWait and
+the channel gets a constant speaking level instead.
+
+A warm spare process is kept next to the active one. cancel() first asks the
+worker to stop; if audio does not stop promptly the worker is killed and the
+spare takes over, so barge-in never waits on a wedged engine.
+
+Usage:
+    tts = TtsWorker()
+    utt = tts.say("Hello there")
+    utt.wait()                      # or: await utt  /  utt.add_done_callback(fn)
+    tts.add_idle_callback(lambda t_idle: ...)   # fires when the last queued utterance ends
+    tts = TtsWorker(envelope_fps=30, level_channel=LevelChannel())   # orb-driving envelope
+    tts.cancel()      # stop speaking now, drop anything queued
+    tts.close()
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import itertools
+import platform
+import threading
+import tempfile
+import subprocess
+import concurrent.futures
+
+
+def rms_envelope(pcm: bytes, rate: int, fps: float, channels: int = 1) -> list:
+    """
+    16-bit PCM -> one RMS value per 1/fps seconds, scaled so loud speech
+    reaches ~1.0 (95th percentile of the frames) and clipped to [0, 1].
+    """
+    import numpy as np
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    hop = max(1, int(round(rate / fps)))
+    frames = len(samples) // hop
+    if frames == 0:
+        return []
+    blocks = samples[:frames * hop].astype(np.float32).reshape(frames, hop)
+    rms = np.sqrt(np.mean(blocks * blocks, axis=1))
+    ref = np.percentile(rms, 95)
+    if ref <= 0:
+        return [0.0] * frames
+    return np.round(np.clip(rms / ref, 0.0, 1.0), 3).tolist()
+
+
+class Utterance:
+    """
+    Handle for one say() call; events fire from the worker's reader thread.
+    Completion is also exposed as a future: wait(), add_done_callback(fn) and
+    `await utt` all resolve when the audio has ended (or was cancelled).
+    """
+    def __init__(self, uid: int, text: str):
+        self.id = uid
+        self.text = text
+        self.started = threading.Event()
+        self.done = threading.Event()
+        self.future = concurrent.futures.Future()
+        self.envelope = None        # RMS per 1/envelope_fps s, when the worker renders PCM
+        self.envelope_fps = None
+        self.cancelled = False
+        self.t_submit = time.perf_counter()
+        self.t_start = None
+        self.t_done = None
+
+    def wait(self, timeout: float = None) -> bool:
+        return self.done.wait(timeout)
+
+    def add_done_callback(self, fn):
+        """fn(utterance), called on the reader thread (or right away if already done)."""
+        self.future.add_done_callback(lambda _f: fn(self))
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+    @property
+    def time_to_first_audio(self):
+        return None if self.t_start is None else self.t_start - self.t_submit
+
+    def _mark_started(self):
+        if self.t_start is None:
+            self.t_start = time.perf_counter()
+        self.started.set()
+
+    def _mark_done(self, cancelled: bool = False):
+        if self.done.is_set():
+            return
+        self.cancelled = self.cancelled or cancelled
+        self.t_done = time.perf_counter()
+        self.started.set()
+        self.done.set()
+        self.future.set_result(self)
+
+
+class _WorkerProcess:
+    def __init__(self, rate: int, volume: float, envelope_fps: float = None, on_start=None):
+        flags = 0
+        if platform.system() == "Windows":
+            flags = subprocess.CREATE_NO_WINDOW
+        args = [sys.executable, "-u", os.path.abspath(__file__), "--serve",
+                "--rate", str(rate), "--volume", str(volume)]
+        if envelope_fps:
+            args += ["--envelope-fps", str(envelope_fps)]
+        self.on_start = on_start
+        self.proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            text=True, encoding="utf-8", bufsize=1,
+            creationflags=flags,
+        )
+        self.ready = threading.Event()
+        self.pending = {}            # id -> Utterance
+        self.lock = threading.Lock()
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    def _read_loop(self):
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            event = msg.get("event")
+            if event == "ready":
+                self.ready.set()
+                continue
+            with self.lock:
+                utt = self.pending.get(msg.get("id"))
+                if event == "done":
+                    self.pending.pop(msg.get("id"), None)
+            if utt is None:
+                continue
+            if event == "start":
+                if msg.get("envelope") is not None:
+                    utt.envelope, utt.envelope_fps = msg["envelope"], msg.get("fps")
+                utt._mark_started()
+                if self.on_start is not None:
+                    self.on_start(utt)
+            elif event == "done":
+                utt._mark_done(bool(msg.get("cancelled")))
+        # process exited (or was killed): nothing pending will ever finish
+        self.ready.set()
+        with self.lock:
+            orphans, self.pending = list(self.pending.values()), {}
+        for utt in orphans:
+            utt._mark_done(cancelled=True)
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def send(self, msg: dict):
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+
+    def submit(self, utt: Utterance):
+        with self.lock:
+            self.pending[utt.id] = utt
+        self.send({"cmd": "say", "id": utt.id, "text": utt.text})
+
+    def busy(self) -> bool:
+        with self.lock:
+            return bool(self.pending)
+
+    def kill(self):
+        try:
+            self.proc.kill()
+        except Exception:
+            pass
+
+
+class TtsWorker:
+    def __init__(self,
+                    rate: int = 180,
+                    volume: float = 1.0,
+                    spares: int = 1,
+                    stop_grace: float = 0.3,
+                    envelope_fps: float = None,
+                    level_channel=None,
+                    speaking_level: float = 0.3):
+        """
+        :param rate:           pyttsx3 words per minute
+        :param volume:         0.0 - 1.0
+        :param spares:         warm standby processes kept for instant barge-in recovery
+        :param stop_grace:     seconds cancel() waits for a soft stop before killing the worker
+        :param envelope_fps:   render PCM and report an RMS envelope at this rate (None = plain say)
+        :param level_channel:  LevelChannel fed with the envelope while audio plays, 0.0 when idle
+        :param speaking_level: constant level sent to the channel when no envelope is available
+        """
+        self.rate = rate
+        self.volume = volume
+        self.spares = spares
+        self.stop_grace = stop_grace
+        self.envelope_fps = envelope_fps
+        self.level_channel = level_channel
+        self.speaking_level = speaking_level
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._active = None
+        self._standby = []
+
+        # speaking state, driven by utterance completion rather than polled
+        self.idle = threading.Event()
+        self.idle.set()
+        self.t_idle = time.perf_counter()
+        self._outstanding = 0
+        self._idle_callbacks = []
+        if level_channel is not None:
+            self._idle_callbacks.append(lambda t_idle: level_channel.set(0.0))
+
+    def _spawn(self) -> _WorkerProcess:
+        return _WorkerProcess(self.rate, self.volume, self.envelope_fps, self._utterance_started)
+
+    def _utterance_started(self, utt: Utterance):
+        channel = self.level_channel
+        if channel is None:
+            return
+        if utt.envelope:
+            channel.play(utt.envelope, utt.envelope_fps, utt.t_start)
+        else:
+            channel.set(self.speaking_level)
+
+    def start(self):
+        """Spawn the worker(s) now so the first reply does not pay for it."""
+        with self._lock:
+            self._ensure_active()
+        self._refill_spares()
+
+    def _ensure_active(self):
+        if self._active is None or not self._active.alive():
+            while self._standby:
+                proc = self._standby.pop(0)
+                if proc.alive():
+                    self._active = proc
+                    return
+            self._active = self._spawn()
+
+    def _refill_spares(self):
+        def refill():
+            with self._lock:
+                self._standby = [p for p in self._standby if p.alive()]
+                missing = self.spares - len(self._standby)
+            for _ in range(max(0, missing)):
+                proc = self._spawn()
+                with self._lock:
+                    self._standby.append(proc)
+        threading.Thread(target=refill, daemon=True).start()
+
+    def _track(self, utt: Utterance):
+        with self._lock:
+            self._outstanding += 1
+            self.idle.clear()
+        utt.add_done_callback(self._untrack)
+
+    def _untrack(self, utt: Utterance):
+        with self._lock:
+            self._outstanding -= 1
+            if self._outstanding:
+                return
+            self.t_idle = time.perf_counter()
+            self.idle.set()
+            callbacks = list(self._idle_callbacks)
+        for fn in callbacks:
+            try:
+                fn(self.t_idle)
+            except Exception as e:
+                print("TTS idle callback failed:", e)
+
+    def add_idle_callback(self, fn):
+        """fn(t_idle) runs each time the last outstanding utterance finishes."""
+        with self._lock:
+            self._idle_callbacks.append(fn)
+
+    async def wait_idle(self):
+        if not self.idle.is_set():
+            await asyncio.get_running_loop().run_in_executor(None, self.idle.wait)
+
+    def say(self, text: str) -> Utterance:
+        """Queue text on the warm engine; returns immediately."""
+        utt = Utterance(next(self._ids), text)
+        self._track(utt)
+        for _ in range(2):
+            with self._lock:
+                self._ensure_active()
+                proc = self._active
+            try:
+                proc.submit(utt)
+                return utt
+            except (OSError, ValueError):
+                # worker died between calls; retry once on a fresh one
+                proc.kill()
+        utt._mark_done(cancelled=True)
+        return utt
+
+    def cancel(self):
+        """Barge-in: stop the current utterance and drop queued ones."""
+        with self._lock:
+            proc = self._active
+        if proc is None or not proc.busy():
+            return
+        try:
+            proc.send({"cmd": "stop"})
+        except (OSError, ValueError):
+            pass
+        deadline = time.monotonic() + self.stop_grace
+        while proc.busy() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if proc.busy():
+            proc.kill()
+            with self._lock:
+                if self._active is proc:
+                    self._active = None
+                    self._ensure_active()
+            self._refill_spares()
+
+    def speaking(self) -> bool:
+        return not self.idle.is_set()
+
+    def close(self):
+        with self._lock:
+            procs = ([self._active] if self._active else []) + self._standby
+            self._active, self._standby = None, []
+        for proc in procs:
+            try:
+                proc.proc.stdin.close()
+                proc.proc.wait(timeout=1)
+            except Exception:
+                proc.kill()
+
+
+def _serve(rate: int, volume: float, envelope_fps: float = None):
+    """Worker side: one warm engine, commands on stdin, events on stdout."""
+    import queue
+    import wave
+    import pyttsx3
+
+    engine = pyttsx3.init()
+    try:
+        engine.setProperty("rate", rate)
+        engine.setProperty("volume", volume)
+    except Exception:
+        pass
+
+    out_lock = threading.Lock()
+
+    def emit(**msg):
+        with out_lock:
+            sys.stdout.write(json.dumps(msg) + "\n")
+            sys.stdout.flush()
+
+    jobs = queue.Queue()
+    current = {"id": None, "stopped": False, "rendering": False}
+
+    # while rendering to a file the engine also reports started-utterance; that is not audio yet
+    engine.connect("started-utterance",
+                   lambda name: None if current["rendering"] else emit(event="start", id=current["id"]))
+
+    pa, tmpdir = None, None
+    if envelope_fps:
+        try:
+            import pyaudio
+            pa = pyaudio.PyAudio()
+            tmpdir = tempfile.mkdtemp(prefix="delta_tts_")
+        except Exception as e:
+            sys.stderr.write(f"TTS worker: no envelope playback ({e}), using plain say\n")
+
+    def speak_with_envelope(job) -> bool:
+        """Render to WAV, report the envelope, play it; False if rendering or playback failed."""
+        path = os.path.join(tmpdir, f"utt_{job['id']}.wav")
+        current["rendering"] = True
+        try:
+            engine.save_to_file(job["text"], path)
+            engine.runAndWait()
+        except Exception as e:
+            sys.stderr.write(f"TTS worker: render to file failed ({e}), using plain say\n")
+            return False
+        finally:
+            current["rendering"] = False
+        if current["stopped"]:
+            return True
+        try:
+            with wave.open(path, "rb") as wf:
+                width, channels, wav_rate = wf.getsampwidth(), wf.getnchannels(), wf.getframerate()
+                pcm = wf.readframes(wf.getnframes())
+        except Exception:
+            return False
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        envelope = rms_envelope(pcm, wav_rate, envelope_fps, channels) if width == 2 else []
+        stream = None
+        try:
+            stream = pa.open(format=pa.get_format_from_width(width), channels=channels,
+                             rate=wav_rate, output=True)
+            emit(event="start", id=job["id"], fps=envelope_fps, envelope=envelope)
+            # ~50 ms writes so a stop command cuts the audio quickly
+            step = max(1, wav_rate // 20) * width * channels
+            for off in range(0, len(pcm), step):
+                if current["stopped"]:
+                    break
+                stream.write(pcm[off:off + step])
+        except Exception as e:
+            # output device gone or busy: let the caller speak it through the engine instead
+            sys.stderr.write(f"TTS worker: envelope playback failed ({e}), using plain say\n")
+            return current["stopped"]
+        finally:
+            if stream is not None:
+                try:
+                    stream.stop_stream()
+                    stream.close()
+                except Exception:
+                    pass
+        return True
+
+    def reader():
+        for line in sys.stdin:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            if msg.get("cmd") == "say":
+                jobs.put(msg)
+            elif msg.get("cmd") == "stop":
+                # drop everything queued, then cut the utterance in progress
+                while True:
+                    try:
+                        dropped = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if dropped is not None:
+                        emit(event="done", id=dropped["id"], cancelled=True)
+                if current["id"] is not None:
+                    current["stopped"] = True
+                    engine.stop()
+        jobs.put(None)   # stdin closed: parent is gone
+
+    threading.Thread(target=reader, daemon=True).start()
+    emit(event="ready")
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        current["id"], current["stopped"] = job["id"], False
+        try:
+            if pa is None or not speak_with_envelope(job):
+                engine.say(job["text"])
+                engine.runAndWait()
+        except Exception as e:
+            sys.stderr.write(f"TTS worker error: {e}\n")
+        emit(event="done", id=job["id"], cancelled=current["stopped"])
+        current["id"] = None
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--serve", action="store_true")
+    ap.add_argument("--rate", type=int, default=180)
+    ap.add_argument("--volume", type=float, default=1.0)
+    ap.add_argument("--envelope-fps", type=float, default=None)
+    ap.add_argument("text", nargs="*")
+    args = ap.parse_args()
+
+    if args.serve:
+        _serve(args.rate, args.volume, args.envelope_fps)
+    else:
+        # demo: python tts_worker.py "first sentence" "second sentence"
+        tts = TtsWorker(rate=args.rate, volume=args.volume)
+        tts.start()
+        for sentence in args.text or ["Hello, this is the persistent speech worker."]:
+            utt = tts.say(sentence)
+            utt.wait()
+            print(f"[TTS] first audio after {utt.time_to_first_audio or 0:.3f}s: {sentence}")
+        tts.close()
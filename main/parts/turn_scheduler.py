@@ -0,0 +1,204 @@
+"""
+turn_scheduler.py
+
+Bounded scheduler for recognized phrases ("turns").
+
+    • a fixed pool of worker threads runs handler(turn), so overlapping
+      utterances never pile concurrent requests onto one small Ollama model
+    • the pending queue is bounded; when it is full the oldest pending turn
+      is dropped (backpressure)
+    • a new phrase supersedes older turns: queued ones are cancelled before
+      they start, running ones are cancelled too; the handler checks
+      turn.cancelled between its stages (and while it waits on the agent)
+      and stops there, so a worker is not held by a turn nobody will hear
+    • speech is ordered: a turn waits in acquire_speech() until every earlier
+      turn has finished or been cancelled
+    • per-stage counters: queue depth, queue wait, handle time, speech wait
+
+Usage:
+    def handle(turn):
+        reply = compute(turn.text, stop=lambda: turn.cancelled)
+        if turn.cancelled:
+            return
+        if scheduler.acquire_speech(turn):      # False if superseded
+            speak(reply)
+
+    scheduler = TurnScheduler(handle, workers=1, max_pending=3)
+    scheduler.submit("open chrome")
+"""
+
+import time
+import itertools
+import threading
+from collections import deque
+
+
+class Turn:
+    def __init__(self, seq: int, text: str):
+        self.seq = seq
+        self.text = text
+        self._cancelled = threading.Event()
+        self.done = threading.Event()
+        self.t_submit = time.perf_counter()
+        self.t_start = None
+        self.t_speak = None
+        self.t_done = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+class _StageStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(1000 * self.total / self.count, 1) if self.count else 0.0,
+            "max_ms": round(1000 * self.max, 1),
+        }
+
+
+class TurnScheduler:
+    def __init__(self,
+                    handler,
+                    workers: int = 1,
+                    max_pending: int = 3,
+                    supersede: bool = True):
+        """
+        :param handler:     handler(turn), called on a worker thread
+        :param workers:     concurrent turns being processed
+        :param max_pending: queued (not yet started) turns kept before dropping the oldest
+        :param supersede:   cancel earlier turns when a new phrase arrives
+        """
+        self.handler = handler
+        self.max_pending = max_pending
+        self.supersede = supersede
+        self._seq = itertools.count(1)
+        self._pending = deque()
+        self._running = {}              # seq -> Turn
+        self._finished = set()          # seqs done but not yet passed by the speech cursor
+        self._next_speaker = 1
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # metrics
+        self.submitted = 0
+        self.dropped = 0
+        self.superseded = 0
+        self.max_depth = 0
+        self.queue_wait = _StageStats()
+        self.handle_time = _StageStats()
+        self.speech_wait = _StageStats()
+
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(max(1, workers))]
+        for t in self._threads:
+            t.start()
+
+    # ---------- producer side ----------
+    def submit(self, text: str) -> Turn:
+        with self._cond:
+            turn = Turn(next(self._seq), text)
+            self.submitted += 1
+            if self.supersede:
+                for old in list(self._pending) + list(self._running.values()):
+                    if not old.cancelled and old.t_speak is None:
+                        old.cancel()
+                        self.superseded += 1
+            while len(self._pending) >= self.max_pending:
+                old = self._pending.popleft()
+                old.cancel()
+                self.dropped += 1
+                self._mark_finished(old)
+            self._pending.append(turn)
+            self.max_depth = max(self.max_depth, len(self._pending))
+            self._cond.notify_all()
+        return turn
+
+    def close(self):
+        """Cancel everything and let the workers exit."""
+        with self._cond:
+            self._closed = True
+            for turn in list(self._pending) + list(self._running.values()):
+                turn.cancel()
+            self._cond.notify_all()
+
+    # ---------- worker side ----------
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+                turn = self._pending.popleft()
+                self._running[turn.seq] = turn
+            turn.t_start = time.perf_counter()
+            self.queue_wait.add(turn.t_start - turn.t_submit)
+            try:
+                if not turn.cancelled:
+                    self.handler(turn)
+            except Exception as e:
+                print("Turn handler failed:", e)
+            finally:
+                turn.t_done = time.perf_counter()
+                self.handle_time.add(turn.t_done - turn.t_start)
+                with self._cond:
+                    self._running.pop(turn.seq, None)
+                    self._mark_finished(turn)
+
+    def _mark_finished(self, turn: Turn):
+        # caller holds self._cond
+        turn.done.set()
+        self._finished.add(turn.seq)
+        while self._next_speaker in self._finished:
+            self._finished.discard(self._next_speaker)
+            self._next_speaker += 1
+        self._cond.notify_all()
+
+    def acquire_speech(self, turn: Turn, timeout: float = 120.0) -> bool:
+        """
+        Block until every earlier turn is done, so replies are spoken in the
+        order the phrases were heard. Returns False if the turn was cancelled.
+        """
+        t0 = time.perf_counter()
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._next_speaker < turn.seq and not turn.cancelled:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(min(remaining, 0.5))
+            if turn.cancelled:
+                return False
+            turn.t_speak = time.perf_counter()
+        self.speech_wait.add(turn.t_speak - t0)
+        return True
+
+    # ---------- metrics ----------
+    def stats(self) -> dict:
+        with self._cond:
+            depth, running = len(self._pending), len(self._running)
+        return {
+            "queue_depth": depth,
+            "max_queue_depth": self.max_depth,
+            "running": running,
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "superseded": self.superseded,
+            "queue_wait": self.queue_wait.as_dict(),
+            "handle": self.handle_time.as_dict(),
+            "speech_wait": self.speech_wait.as_dict(),
+        }
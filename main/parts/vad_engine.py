@@ -0,0 +1,201 @@
+"""
+vad_engine.py
+
+Energy / zero-crossing voice activity detector shared by the listeners in
+Delta.py. All per-chunk work is vectorized with NumPy and runs on buffers that
+are allocated once up front, so the hot loop does not create Python ints or
+intermediate arrays for every sample.
+
+Usage:
+    vad = VadEngine(sample_rate=16000)
+    vad.calibrate(raw_silence_bytes)
+    for chunk in stream:
+        if vad.process(chunk) == VadEngine.PHRASE_END:
+            audio = vad.take_phrase()      # bytes, 16-bit mono PCM
+"""
+
+import numpy as np
+
+
+class VadEngine:
+    # events returned by process()
+    NONE = 0
+    SPEECH_START = 1
+    PHRASE_END = 2
+
+    def __init__(self,
+                    sample_rate: int = 16000,
+                    max_chunk_samples: int = 1024,
+                    energy_boost: float = 2.0,
+                    initial_floor: float = 100.0,
+                    min_floor: float = 50.0,
+                    noise_alpha: float = 0.05,
+                    zcr_max: float = 0.45,
+                    silence_chunks_end: int = 20,
+                    min_phrase_seconds: float = 0.5,
+                    max_phrase_seconds: float = 15.0,
+                    preroll_seconds: float = 0.3):
+        """
+        :param sample_rate:        Hz of the 16-bit mono input
+        :param max_chunk_samples:  largest chunk expected; scratch buffers grow if exceeded
+        :param energy_boost:       speech threshold = noise floor * energy_boost
+        :param initial_floor:      starting noise floor (RMS) before any adaptation
+        :param min_floor:          lower clamp for the adaptive floor
+        :param noise_alpha:        EMA weight for floor updates on non-speech chunks
+        :param zcr_max:            zero-crossing rate above which quiet chunks count as hiss
+        :param silence_chunks_end: silent chunks after speech that end a phrase
+        :param min_phrase_seconds: shorter phrases are dropped
+        :param max_phrase_seconds: phrases are cut at this length
+        :param preroll_seconds:    audio kept from before the speech onset
+        """
+        self.sample_rate = sample_rate
+        self.energy_boost = energy_boost
+        self.min_floor = min_floor
+        self.noise_floor = max(min_floor, float(initial_floor))
+        self.noise_alpha = noise_alpha
+        self.zcr_max = zcr_max
+        self.silence_chunks_end = silence_chunks_end
+        self.min_phrase_samples = int(sample_rate * min_phrase_seconds)
+        self.max_phrase_samples = int(sample_rate * max_phrase_seconds)
+        self.preroll_samples = int(sample_rate * preroll_seconds)
+
+        # scratch buffers for the per-chunk math
+        self._alloc_scratch(max_chunk_samples)
+
+        # audio ring: one max-length phrase plus pre-roll plus a chunk of slack
+        self._capacity = self.max_phrase_samples + self.preroll_samples + max_chunk_samples
+        self._ring = np.zeros(self._capacity, dtype=np.int16)
+        self._total = 0          # samples ever written (absolute position)
+        self._phrase_start = 0   # absolute position where the current phrase begins
+        self._floor_pos = 0      # nothing before this may end up in a phrase
+
+        # latest stats / state
+        self.rms = 0.0
+        self.zcr = 0.0
+        self.voiced = False
+        self.silence_chunks = 0
+
+    def _alloc_scratch(self, n: int):
+        self._scratch_len = n
+        self._f32 = np.empty(n, dtype=np.float32)
+        self._sign = np.empty(n, dtype=bool)
+        self._diff = np.empty(max(1, n - 1), dtype=bool)
+
+    @property
+    def threshold(self) -> float:
+        return self.noise_floor * self.energy_boost
+
+    # ---------- analysis ----------
+    def frame_stats(self, chunk) -> tuple:
+        """Return (rms, zcr) for a chunk of 16-bit PCM without touching VAD state."""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        return self._stats(samples)
+
+    def _stats(self, samples: np.ndarray) -> tuple:
+        n = samples.shape[0]
+        if n == 0:
+            return 0.0, 0.0
+        if n > self._scratch_len:
+            self._alloc_scratch(n)
+        f = self._f32[:n]
+        f[...] = samples
+        rms = float(np.sqrt(np.dot(f, f) / n))
+        if n < 2:
+            return rms, 0.0
+        sign = self._sign[:n]
+        np.signbit(samples, out=sign)
+        diff = self._diff[:n - 1]
+        np.not_equal(sign[1:], sign[:-1], out=diff)
+        zcr = np.count_nonzero(diff) / (n - 1)
+        return rms, zcr
+
+    def calibrate(self, raw) -> float:
+        """Seed the noise floor from a stretch of (mostly) silent audio."""
+        rms, _ = self.frame_stats(raw)
+        self.noise_floor = max(self.min_floor, rms)
+        return self.noise_floor
+
+    def is_speech(self, rms: float, zcr: float) -> bool:
+        thr = self.threshold
+        if rms <= thr:
+            return False
+        # quiet-but-noisy chunks (hiss, fans) have a high crossing rate; loud ones always count
+        return zcr <= self.zcr_max or rms > thr * 2
+
+    # ---------- ring buffer ----------
+    def _write(self, samples: np.ndarray):
+        n = samples.shape[0]
+        if n > self._capacity:
+            samples = samples[-self._capacity:]
+            self._total += n - self._capacity
+            n = self._capacity
+        pos = self._total % self._capacity
+        first = min(n, self._capacity - pos)
+        self._ring[pos:pos + first] = samples[:first]
+        if first < n:
+            self._ring[:n - first] = samples[first:]
+        self._total += n
+
+    def _read(self, start: int, end: int) -> bytes:
+        start = max(start, end - self._capacity)
+        a = start % self._capacity
+        b = end % self._capacity
+        if end - start == 0:
+            return b""
+        if a < b:
+            return self._ring[a:b].tobytes()
+        return self._ring[a:].tobytes() + self._ring[:b].tobytes()
+
+    # ---------- segmentation ----------
+    def process(self, chunk) -> int:
+        """Feed one chunk of 16-bit mono PCM; returns NONE, SPEECH_START or PHRASE_END."""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        before = self._total
+        self._write(samples)
+        self.rms, self.zcr = self._stats(samples)
+        speech = self.is_speech(self.rms, self.zcr)
+
+        if not self.voiced:
+            if speech:
+                self.voiced = True
+                self.silence_chunks = 0
+                self._phrase_start = max(self._floor_pos, before - self.preroll_samples)
+                return VadEngine.SPEECH_START
+            # only silence adapts the floor, so speech does not raise its own threshold
+            self.noise_floor = max(self.min_floor,
+                                   self.noise_floor + self.noise_alpha * (self.rms - self.noise_floor))
+            return VadEngine.NONE
+
+        if speech:
+            self.silence_chunks = 0
+        else:
+            self.silence_chunks += 1
+
+        if (self.silence_chunks >= self.silence_chunks_end
+                or self._total - self._phrase_start >= self.max_phrase_samples):
+            return VadEngine.PHRASE_END
+        return VadEngine.NONE
+
+    def current_phrase(self) -> bytes:
+        """Audio of the phrase in progress, pre-roll included; b"" when not voiced."""
+        if not self.voiced:
+            return b""
+        return self._read(self._phrase_start, self._total)
+
+    def take_phrase(self) -> bytes:
+        """
+        Return the finished phrase and reset for the next one.
+        Returns b"" when nothing was voiced or the phrase was too short.
+        """
+        data = b""
+        if self.voiced and self._total - self._phrase_start >= self.min_phrase_samples:
+            data = self._read(self._phrase_start, self._total)
+        self.reset()
+        return data
+
+    def reset(self):
+        """Forget any partial phrase (e.g. while TTS is speaking); the floor is kept."""
+        self.voiced = False
+        self.silence_chunks = 0
+        self._floor_pos = self._total
+        self._phrase_start = self._total
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+wake_word.py
+
+Small keyword spotter for the trigger word, so the always-on loop does not
+need full speech-to-text.
+
+    1) MfccExtractor turns 16-bit PCM into 10 ms MFCC frames (log-mel + DCT),
+       streaming-safe: leftover samples are carried to the next chunk.
+    2) WakeWordDetector keeps one subsequence-DTW column per enrolled template
+       and advances it by one step per feature frame. The step only looks at the
+       previous column, so each update is a handful of NumPy ops over the
+       template length instead of a full DTW per window.
+
+Templates are short WAV recordings of you saying the wake word (3-5 is plenty):
+    python parts/wake_word.py --enroll config/wake_word 4
+    python parts/wake_word.py --test config/wake_word      # live scores
+"""
+
+import os
+import glob
+import wave
+import numpy as np
+
+INF = np.float32(np.inf)
+
+
+def _mel_filterbank(n_mels: int, n_fft: int, sample_rate: int,
+                    fmin: float = 20.0, fmax: float = None) -> np.ndarray:
+    fmax = fmax or sample_rate / 2
+    hz_to_mel = lambda f: 2595.0 * np.log10(1.0 + f / 700.0)
+    mel_to_hz = lambda m: 700.0 * (10 ** (m / 2595.0) - 1.0)
+    mels = np.linspace(hz_to_mel(fmin), hz_to_mel(fmax), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mels) / sample_rate).astype(int)
+    fb = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        lo, c, hi = bins[m - 1], bins[m], bins[m + 1]
+        if c > lo:
+            fb[m - 1, lo:c] = (np.arange(lo, c) - lo) / (c - lo)
+        if hi > c:
+            fb[m - 1, c:hi] = (hi - np.arange(c, hi)) / (hi - c)
+    return fb
+
+
+def _dct_matrix(n_out: int, n_in: int) -> np.ndarray:
+    k = np.arange(n_out)[:, None]
+    n = np.arange(n_in)[None, :]
+    d = np.cos(np.pi / n_in * (n + 0.5) * k) * np.sqrt(2.0 / n_in)
+    d[0] /= np.sqrt(2.0)
+    return d.astype(np.float32)
+
+
+class MfccExtractor:
+    def __init__(self,
+                    sample_rate: int = 16000,
+                    win_ms: int = 25,
+                    hop_ms: int = 10,
+                    n_mels: int = 26,
+                    n_mfcc: int = 13):
+        """
+        :param sample_rate: Hz of the 16-bit mono input
+        :param win_ms:      analysis window length
+        :param hop_ms:      frame step (one feature vector per hop)
+        :param n_mels:      log-mel bands
+        :param n_mfcc:      cepstral coefficients kept, c0 included (dropped by the detector)
+        """
+        self.sample_rate = sample_rate
+        self.win = int(sample_rate * win_ms / 1000)
+        self.hop = int(sample_rate * hop_ms / 1000)
+        self.n_fft = 1 << (self.win - 1).bit_length()
+        self.window = np.hamming(self.win).astype(np.float32)
+        self.mel_fb = _mel_filterbank(n_mels, self.n_fft, sample_rate).T.copy()
+        self.dct = _dct_matrix(n_mfcc, n_mels).T.copy()
+        self._tail = np.zeros(0, dtype=np.float32)
+
+    def compute(self, samples: np.ndarray) -> np.ndarray:
+        """MFCCs for a whole buffer, shape (frames, n_mfcc)."""
+        x = np.asarray(samples, dtype=np.float32)
+        if x.shape[0] < self.win:
+            return np.zeros((0, self.dct.shape[1]), dtype=np.float32)
+        frames = np.lib.stride_tricks.sliding_window_view(x, self.win)[::self.hop]
+        spec = np.fft.rfft(frames * self.window, n=self.n_fft)
+        power = (spec.real ** 2 + spec.imag ** 2).astype(np.float32)
+        logmel = np.log(power @ self.mel_fb + 1e-3)
+        return logmel @ self.dct
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """Streaming variant: MFCCs for every full frame now available."""
+        x = np.concatenate((self._tail, samples.astype(np.float32)))
+        n_frames = 0 if x.shape[0] < self.win else 1 + (x.shape[0] - self.win) // self.hop
+        self._tail = x[n_frames * self.hop:]
+        return self.compute(x[:(n_frames - 1) * self.hop + self.win]) if n_frames else \
+            np.zeros((0, self.dct.shape[1]), dtype=np.float32)
+
+    def reset(self):
+        self._tail = np.zeros(0, dtype=np.float32)
+
+
+class WakeWordDetector:
+    def __init__(self,
+                    sample_rate: int = 16000,
+                    threshold: float = 1.8,
+                    refractory_seconds: float = 1.5,
+                    min_energy: float = 200.0):
+        """
+        :param threshold:          hit when the best template's mean frame distance drops below this
+        :param refractory_seconds: ignore further hits for this long after one fires
+        :param min_energy:         chunks quieter than this RMS skip the DTW update
+        """
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.features = MfccExtractor(sample_rate)
+        hops_per_sec = sample_rate / self.features.hop
+        self.refractory_frames = int(refractory_seconds * hops_per_sec)
+        self.min_energy = min_energy
+
+        # (T, d) float32 with c0 dropped. No cepstral mean normalization: templates are
+        # enrolled on the same mic the detector listens to, and a running mean cannot
+        # match the per-template mean at the word onset anyway.
+        self.templates = []
+        self._D = []          # accumulated cost per template frame
+        self._L = []          # path length per template frame
+        self._cooldown = 0
+        self._quiet_frames = 0
+        self._max_quiet_frames = int(0.3 * hops_per_sec)   # longer pauses break a partial match
+        self.score = float("inf")   # best normalized distance seen on the last frame
+
+    # ---------- templates ----------
+    def add_template(self, pcm: bytes):
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        feats = self.features.compute(samples)
+        # trim leading/trailing silence by c0 (log energy)
+        if feats.shape[0]:
+            voiced = np.nonzero(feats[:, 0] > feats[:, 0].max() - 20.0)[0]
+            feats = feats[voiced[0]:voiced[-1] + 1]
+        if feats.shape[0] < 5:
+            raise ValueError("wake word template is too short")
+        feats = feats[:, 1:]
+        self.templates.append(np.ascontiguousarray(feats, dtype=np.float32))
+        self._D.append(np.full(feats.shape[0], INF, dtype=np.float32))
+        self._L.append(np.ones(feats.shape[0], dtype=np.float32))
+
+    @classmethod
+    def from_directory(cls, path: str, **kwargs) -> "WakeWordDetector":
+        det = cls(**kwargs)
+        for wav_path in sorted(glob.glob(os.path.join(path, "*.wav"))):
+            with wave.open(wav_path, "rb") as wf:
+                if wf.getframerate() != det.sample_rate or wf.getsampwidth() != 2 or wf.getnchannels() != 1:
+                    print(f"[WakeWord] skipping {wav_path}: need {det.sample_rate} Hz 16-bit mono")
+                    continue
+                det.add_template(wf.readframes(wf.getnframes()))
+        return det
+
+    # ---------- streaming ----------
+    def reset(self):
+        self.features.reset()
+        for D in self._D:
+            D.fill(INF)
+        self._cooldown = 0
+        self._quiet_frames = 0
+        self.score = float("inf")
+
+    def process(self, chunk) -> bool:
+        """Feed 16-bit mono PCM; True when the wake word just finished."""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        feats = self.features.push(samples)
+        if not feats.shape[0] or not self.templates:
+            return False
+
+        quiet = samples.shape[0] and np.sqrt(np.mean(samples.astype(np.float32) ** 2)) < self.min_energy
+
+        hit = False
+        for f in feats:
+            if self._cooldown:
+                self._cooldown -= 1
+                continue
+            if quiet:
+                # short gaps (stop closures) freeze the match; longer silence drops it
+                self._quiet_frames += 1
+                if self._quiet_frames == self._max_quiet_frames:
+                    for D in self._D:
+                        D.fill(INF)
+                continue
+            self._quiet_frames = 0
+            if self._step(f[1:]) < self.threshold:
+                hit = True
+                self._cooldown = self.refractory_frames
+                for D in self._D:
+                    D.fill(INF)
+        return hit
+
+    def _step(self, x: np.ndarray) -> float:
+        """
+        Advance every template's DTW column by one input frame.
+        Allowed moves (template index i, input t): (i-1,t-1), (i,t-1), (i-2,t-1),
+        so the template may be spoken between ~0.5x and 2x its recorded speed and
+        the new column only depends on the old one.
+        """
+        best = float("inf")
+        for tmpl, D, L in zip(self.templates, self._D, self._L):
+            T = tmpl.shape[0]
+            diff = tmpl - x
+            cost = np.sqrt(np.einsum("ij,ij->i", diff, diff) / diff.shape[1])
+
+            cand_D = np.full((3, T), INF, dtype=np.float32)
+            cand_L = np.ones((3, T), dtype=np.float32)
+            cand_D[0, 0] = 0.0                       # a path may start on any input frame
+            cand_L[0, 0] = 0.0
+            cand_D[0, 1:], cand_L[0, 1:] = D[:-1], L[:-1]
+            cand_D[1, 1:], cand_L[1, 1:] = D[1:], L[1:]
+            cand_D[2, 2:], cand_L[2, 2:] = D[:-2], L[:-2]
+
+            k = np.argmin(cand_D / np.maximum(cand_L, 1.0), axis=0)
+            cols = np.arange(T)
+            D[:] = cand_D[k, cols] + cost
+            L[:] = cand_L[k, cols] + 1.0
+
+            if L[-1] <= 2 * T:
+                best = min(best, float(D[-1] / L[-1]))
+        self.score = best
+        return best
+
+
+def create_wake_word_detector(config: dict = None, sample_rate: int = 16000):
+    """
+    Build a detector from config {"templates_dir": ..., "threshold": ...}.
+    Returns None when no templates are enrolled, so callers can fall back to STT.
+    """
+    config = config or {}
+    path = config.get("templates_dir", os.path.join("config", "wake_word"))
+    if not os.path.isabs(path):
+        # relative to main/, where config/ lives
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), path)
+    if not os.path.isdir(path):
+        return None
+    kwargs = {k: v for k, v in config.items() if k != "templates_dir"}
+    try:
+        det = WakeWordDetector.from_directory(path, sample_rate=sample_rate, **kwargs)
+    except Exception as e:
+        print("[WakeWord] could not load templates:", e)
+        return None
+    return det if det.templates else None
+
+
+if __name__ == "__main__":
+    import sys
+    from mic_system import MicSystem
+
+    if len(sys.argv) > 2 and sys.argv[1] == "--enroll":
+        # python wake_word.py --enroll config/wake_word 4
+        out_dir = sys.argv[2]
+        count = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+        os.makedirs(out_dir, exist_ok=True)
+        start = len(glob.glob(os.path.join(out_dir, "*.wav")))
+        for i in range(count):
+            input(f"Take {i + 1}/{count}: press Enter, then say the wake word once")
+            MicSystem.record_to_file(os.path.join(out_dir, f"wake_{start + i:02d}.wav"), 1.5)
+    elif len(sys.argv) > 2 and sys.argv[1] == "--test":
+        det = WakeWordDetector.from_directory(sys.argv[2])
+        print(f"[WakeWord] {len(det.templates)} templates, threshold {det.threshold}")
+
+        def on_chunk(chunk):
+            if det.process(chunk):
+                print(f"\nHIT (score {det.score:.2f})")
+            else:
+                print(f"score={det.score:6.2f}", end="\r")
+
+        mic = MicSystem(callback=on_chunk, chunk_size=480)
+        mic.start_stream()
+        try:
+            input("Listening... press Enter to stop\n")
+        finally:
+            mic.stop_stream()
+    else:
+        print(__doc__)
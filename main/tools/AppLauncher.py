@@ -1,14 +1,16 @@
 # AppLauncher.py
 from langchain.tools import tool
-import os, glob, subprocess
-from difflib import get_close_matches
+import os, re, time, shlex, threading, subprocess
 
-class _Launcher:
-    START_MENU_DIRS = [
-        os.path.join(os.environ.get("PROGRAMDATA", r"C:\ProgramData"), r"Microsoft\Windows\Start Menu\Programs"),
-        os.path.join(os.environ.get("APPDATA", os.path.expanduser(r"~\AppData\Roaming")), r"Microsoft\Windows\Start Menu\Programs"),
-    ]
+from tools.app_index import AppIndex, desktop_entry
+from tools.fuzzy_match import FuzzyIndex
+
+# persisted next to the other caches under main/
+INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "app_index.sqlite")
+REFRESH_SECONDS = 300        # background re-check of directory mtimes at most this often
+MISS_REFRESH_SECONDS = 5     # on a miss, re-check right away unless we just did
 
+class _Launcher:
     ALIASES = {
         "vs code": "visual studio code",
         "vscode": "visual studio code",
@@ -21,30 +23,26 @@ class _Launcher:
         "spotify": "spotify",
     }
 
-    def __init__(self):
-        self.index = None  # name(lower) -> path
-
-    def _build_index(self):
-        idx = {}
-        # 1) Start Menu shortcuts (.lnk)
-        for root in self.START_MENU_DIRS:
-            if not os.path.isdir(root):
-                continue
-            for path in glob.glob(os.path.join(root, "**", "*.lnk"), recursive=True):
-                name = os.path.splitext(os.path.basename(path))[0].lower()
-                idx[name] = path
-        # 2) Executables in PATH
-        for d in os.environ.get("PATH", "").split(os.pathsep):
-            if not d or not os.path.isdir(d):
-                continue
-            for exe in glob.glob(os.path.join(d, "*.exe")):
-                name = os.path.splitext(os.path.basename(exe))[0].lower()
-                idx.setdefault(name, exe)  # prefer .lnk if it exists
-        self.index = idx
+    def __init__(self, db_path: str = INDEX_PATH):
+        self.db_path = db_path
+        self.index = None  # AppIndex: name(lower) -> path, Start Menu/.desktop preferred over PATH
+        self._warm_lock = threading.Lock()
+        self._fuzzy = None       # FuzzyIndex over index.names, rebuilt when load() swaps the dict
+        self._fuzzy_names = None
+        self._fuzzy_lock = threading.Lock()
+
+    def warm_up(self):
+        """Open the persistent index and refresh it in the background (call at startup)."""
+        with self._warm_lock:
+            if self.index is None:
+                self.index = AppIndex(self.db_path)
+                self.index.warm_up()
 
     def _ensure_index(self):
-        if self.index is None:
-            self._build_index()
+        self.warm_up()
+        self.index.wait_ready(30)
+        if time.time() - self.index.last_refresh > REFRESH_SECONDS:
+            threading.Thread(target=self.index.refresh, daemon=True).start()
 
     def _normalize_query(self, q: str) -> str:
         q = q.strip().lower()
@@ -52,22 +50,57 @@ class _Launcher:
             q = q[5:]
         return self.ALIASES.get(q, q)
 
+    def _fuzzy_index(self, names: dict) -> FuzzyIndex:
+        with self._fuzzy_lock:
+            if self._fuzzy_names is not names:
+                self._fuzzy = FuzzyIndex(names.keys(), aliases=self.ALIASES)
+                self._fuzzy_names = names
+            return self._fuzzy
+
+    def _lookup(self, q: str):
+        names = self.index.names
+        if q in names:
+            return names[q]
+        match = self._fuzzy_index(names).best(q, cutoff=0.6)
+        return names.get(match) if match else None
+
+    def is_known(self, query: str) -> bool:
+        """Exact app name or alias in the loaded index; False while it is still loading."""
+        if self.index is None:
+            return False
+        return self._normalize_query(query) in self.index.names
+
+    def suggest(self, query: str, k: int = 3) -> list:
+        """Closest app names below the launch cutoff, for a "did you mean" reply."""
+        if self.index is None:
+            return []
+        q = self._normalize_query(query)
+        return [name for name, _ in self._fuzzy_index(self.index.names).search(q, k=k, cutoff=0.4)]
+
     def find(self, query: str):
         self._ensure_index()
         q = self._normalize_query(query)
-        if q in self.index:
-            return self.index[q]
-        names = list(self.index.keys())
-        match = get_close_matches(q, names, n=1, cutoff=0.6)
-        return self.index[match[0]] if match else None
+        target = self._lookup(q)
+        if target is None and time.time() - self.index.last_refresh > MISS_REFRESH_SECONDS:
+            # maybe installed since the last refresh; only changed directories are re-listed
+            self.index.refresh()
+            target = self._lookup(q)
+        return target
 
     def launch(self, query: str) -> tuple[bool, str]:
         target = self.find(query)
         if not target:
+            close = self.suggest(query)
+            if close:
+                return False, f"I couldn't find {query}. Did you mean {', '.join(close)}?"
             return False, f"I couldn't find {query}."
         try:
             if target.lower().endswith((".lnk", ".url")):
                 os.startfile(target)  # type: ignore[attr-defined]
+            elif target.lower().endswith(".desktop"):
+                # Exec= line minus the %f/%U style field codes
+                cmd = re.sub(r"%[a-zA-Z%]", "", desktop_entry(target).get("Exec", ""))
+                subprocess.Popen(shlex.split(cmd), start_new_session=True)
             else:
                 cwd = os.path.dirname(target) or None
                 subprocess.Popen([target], cwd=cwd, shell=False)
@@ -79,10 +112,18 @@ class _Launcher:
 # single cached instance for the tool
 _LAUNCHER = _Launcher()
 
+def warm_up():
+    """Start loading/refreshing the app index in the background so the first "open X" is fast."""
+    _LAUNCHER.warm_up()
+
+def is_known_app(name: str) -> bool:
+    """True when `name` is an installed app by its exact name or alias (for the intent router)."""
+    return _LAUNCHER.is_known(name)
+
 @tool("AppLauncher", return_direct=True)
 def AppLauncher(query: str) -> str:
     """
-    Open a Windows app by name. Natural inputs work:
+    Open an installed app by name (Start Menu / PATH on Windows, .desktop / PATH on Linux). Natural inputs work:
 
     Examples:
     - "open chrome"
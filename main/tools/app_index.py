@@ -0,0 +1,269 @@
+# app_index.py
+"""
+Persistent index of launchable apps for AppLauncher, kept in SQLite.
+
+Sources:
+    Windows – Start Menu trees (.lnk / .url, recursive) and *.exe on PATH
+    Linux   – .desktop files in the XDG application dirs (recursive) and
+              executables on PATH
+
+Each scanned directory is stored with its mtime and its subdirectories.
+refresh() stats every known directory and only re-lists the ones whose
+mtime changed (a directory's mtime moves when entries are added, removed
+or renamed in it), so keeping the index current costs one stat per
+directory instead of a recursive glob. Directories that vanished are
+dropped with their entries.
+
+Usage:
+    index = AppIndex("cache/app_index.sqlite")
+    index.warm_up()                  # background: load from disk, then refresh
+    index.wait_ready()
+    path = index.lookup("google chrome")
+"""
+
+import os
+import json
+import time
+import sqlite3
+import fnmatch
+import threading
+
+
+class Source:
+    def __init__(self, root: str, patterns, kind: str, priority: int = 0,
+                 recursive: bool = True, executable_only: bool = False):
+        """
+        :param root:            directory to index
+        :param patterns:        filename globs, e.g. ("*.lnk",)
+        :param kind:            stored with each entry ("lnk", "desktop", "exe")
+        :param priority:        lower wins when two sources provide the same name
+        :param recursive:       descend into subdirectories
+        :param executable_only: only files with the execute bit (PATH on Linux)
+        """
+        self.root = os.path.normpath(root)
+        self.patterns = tuple(patterns)
+        self.kind = kind
+        self.priority = priority
+        self.recursive = recursive
+        self.executable_only = executable_only
+
+    def matches(self, entry) -> bool:
+        name = entry.name.lower()
+        if not any(fnmatch.fnmatchcase(name, p) for p in self.patterns):
+            return False
+        return not self.executable_only or os.access(entry.path, os.X_OK)
+
+
+def _path_dirs() -> list:
+    seen, out = set(), []
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        if d and d not in seen:
+            seen.add(d)
+            out.append(d)
+    return out
+
+
+def default_sources() -> list:
+    if os.name == "nt":
+        start_menu = [
+            os.path.join(os.environ.get("PROGRAMDATA", r"C:\ProgramData"), r"Microsoft\Windows\Start Menu\Programs"),
+            os.path.join(os.environ.get("APPDATA", os.path.expanduser(r"~\AppData\Roaming")), r"Microsoft\Windows\Start Menu\Programs"),
+        ]
+        # PATH order decides between PATH directories, as it does for the shell
+        return ([Source(d, ("*.lnk", "*.url"), "lnk") for d in start_menu] +
+                [Source(d, ("*.exe",), "exe", priority=1 + i, recursive=False) for i, d in enumerate(_path_dirs())])
+
+    data_home = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+    data_dirs = os.environ.get("XDG_DATA_DIRS", "/usr/local/share:/usr/share").split(":")
+    app_dirs = [os.path.join(d, "applications") for d in [data_home] + data_dirs if d]
+    app_dirs += ["/var/lib/flatpak/exports/share/applications",
+                 os.path.expanduser("~/.local/share/flatpak/exports/share/applications")]
+    seen, sources = set(), []
+    for d in app_dirs:
+        if d not in seen:
+            seen.add(d)
+            sources.append(Source(d, ("*.desktop",), "desktop"))
+    sources += [Source(d, ("*",), "exe", priority=1 + i, recursive=False, executable_only=True)
+                for i, d in enumerate(_path_dirs())]
+    return sources
+
+
+def desktop_entry(path: str) -> dict:
+    """Keys of the [Desktop Entry] group (Name, Exec, NoDisplay, ...); {} if unreadable."""
+    entry, in_group = {}, False
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    in_group = line == "[Desktop Entry]"
+                elif in_group and "=" in line:
+                    key, value = line.split("=", 1)
+                    entry.setdefault(key.strip(), value.strip())
+    except OSError:
+        pass
+    return entry
+
+
+def entry_name(path: str, kind: str):
+    """Lower-case display name for a file, or None to skip it (hidden .desktop entries)."""
+    if kind == "desktop":
+        entry = desktop_entry(path)
+        if entry.get("NoDisplay") == "true" or entry.get("Hidden") == "true":
+            return None
+        name = entry.get("Name")
+        if name:
+            return name.lower()
+    return os.path.splitext(os.path.basename(path))[0].lower()
+
+
+class AppIndex:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT NOT NULL, kind TEXT NOT NULL, mtime REAL NOT NULL, subdirs TEXT NOT NULL,
+            PRIMARY KEY (path, kind));
+        CREATE TABLE IF NOT EXISTS entries (
+            path TEXT PRIMARY KEY, name TEXT NOT NULL, dir TEXT NOT NULL,
+            kind TEXT NOT NULL, priority INTEGER NOT NULL);
+        CREATE INDEX IF NOT EXISTS entries_dir ON entries (dir, kind);
+    """
+
+    def __init__(self, db_path: str = None, sources: list = None):
+        """
+        :param db_path: SQLite file (None = in memory only, rebuilt each run)
+        :param sources: list of Source; default_sources() for this platform if None
+        """
+        self.db_path = db_path or ":memory:"
+        self.sources = default_sources() if sources is None else sources
+        self.names = {}                 # name -> path, best priority
+        self.ready = threading.Event()
+        self.last_refresh = 0.0
+        self._lock = threading.RLock()
+        self._refreshing = False
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.executescript(self.SCHEMA)
+
+    # ---------- startup ----------
+    def load(self):
+        """Read the stored index into memory (no filesystem access)."""
+        with self._lock:
+            rows = self._db.execute("SELECT name, path FROM entries ORDER BY priority DESC, path DESC").fetchall()
+            self.names = {name: path for name, path in rows}
+
+    def warm_up(self) -> threading.Thread:
+        """Load from disk, then refresh, on a daemon thread; lookups can start as soon as load() is done."""
+        def run():
+            try:
+                self.load()
+                if self.names:
+                    self.ready.set()
+                self.refresh()
+            except Exception as e:
+                print("[AppIndex] warm-up failed:", e)
+            finally:
+                self.ready.set()
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        return t
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        return self.ready.wait(timeout)
+
+    # ---------- refresh ----------
+    def refresh(self) -> dict:
+        """Re-list only directories whose mtime changed; returns counters."""
+        with self._lock:
+            if self._refreshing:
+                return {}
+            self._refreshing = True
+        try:
+            return self._refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _refresh(self) -> dict:
+        t0 = time.perf_counter()
+        stats = {"dirs": 0, "rescanned": 0, "removed_dirs": 0}
+        db = self._db
+        with self._lock:
+            stored = {(p, k): (m, json.loads(s)) for p, k, m, s in db.execute("SELECT path, kind, mtime, subdirs FROM dirs")}
+        seen = set()
+        rescanned = []      # (path, kind, priority, mtime, subdirs, files), written in one transaction
+        kept = []           # (priority, dir, kind, priority) of unchanged dirs: PATH order may have changed
+
+        for src in self.sources:
+            stack = [src.root]
+            while stack:
+                path = stack.pop()
+                key = (path, src.kind)
+                if key in seen:
+                    continue
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+                seen.add(key)
+                stats["dirs"] += 1
+                row = stored.get(key)
+                if row is not None and row[0] == mtime:
+                    kept.append((src.priority, path, src.kind, src.priority))
+                    stack.extend(row[1])
+                    continue
+                subdirs, files = self._scan_dir(src, path)
+                rescanned.append((path, src.kind, src.priority, mtime, subdirs, files))
+                stack.extend(subdirs)
+
+        gone = [key for key in stored if key not in seen]
+        stats["rescanned"], stats["removed_dirs"] = len(rescanned), len(gone)
+        with self._lock, db:
+            before = db.total_changes
+            db.executemany("UPDATE entries SET priority = ? WHERE dir = ? AND kind = ? AND priority != ?", kept)
+            reordered = db.total_changes != before
+        if rescanned or gone:
+            with self._lock, db:
+                db.executemany("DELETE FROM entries WHERE dir = ? AND kind = ?",
+                               gone + [(path, kind) for path, kind, *_ in rescanned])
+                db.executemany("DELETE FROM dirs WHERE path = ? AND kind = ?", gone)
+                db.executemany("INSERT OR REPLACE INTO entries (path, name, dir, kind, priority) VALUES (?, ?, ?, ?, ?)",
+                               [(f, name, path, kind, prio)
+                                for path, kind, prio, _, _, files in rescanned for f, name in files])
+                db.executemany("INSERT OR REPLACE INTO dirs (path, kind, mtime, subdirs) VALUES (?, ?, ?, ?)",
+                               [(path, kind, mtime, json.dumps(subdirs))
+                                for path, kind, _, mtime, subdirs, _ in rescanned])
+        if rescanned or gone or reordered or not self.names:
+            self.load()
+        self.last_refresh = time.time()
+        stats["entries"] = len(self.names)
+        stats["seconds"] = round(time.perf_counter() - t0, 4)
+        return stats
+
+    @staticmethod
+    def _scan_dir(src: Source, path: str):
+        subdirs, files = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if src.recursive:
+                                subdirs.append(entry.path)
+                        elif src.matches(entry):
+                            name = entry_name(entry.path, src.kind)
+                            if name:
+                                files.append((entry.path, name))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return subdirs, files
+
+    # ---------- lookup ----------
+    def lookup(self, name: str):
+        return self.names.get(name)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
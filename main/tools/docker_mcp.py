@@ -8,10 +8,25 @@
     # that turns a text prompt into the HTTP/WebSocket payload your MCP server expects and returns the response string.
 
 
-import os, requests, json
+import os, json
 from langchain.tools import tool
 
+from tools.mcp_client import McpClient
+
+# one or more base URLs, comma separated: calls are balanced across them
 MCP_URL = os.getenv("DELTA_MCP_URL", "http://127.0.0.1:7100")
+MCP_TIMEOUT = float(os.getenv("DELTA_MCP_TIMEOUT", "60"))
+
+# shared pooled client so calls reuse kept-alive connections
+_CLIENT = None
+
+def _client() -> McpClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = McpClient(MCP_URL, timeouts={"/invoke": (3.0, MCP_TIMEOUT)})
+        if len(_CLIENT.endpoints) > 1:
+            _CLIENT.start_health_checks()
+    return _CLIENT
 
 @tool("docker_mcp", return_direct=True)
 def docker_mcp(prompt: str) -> str:
@@ -19,8 +34,5 @@ def docker_mcp(prompt: str) -> str:
     Call the MCP server that is exposed from Docker.
     The server is expected to accept JSON { "query": ... } and return { "result": ... }.
     """
-    payload = {"query": prompt}
-    r = requests.post(f"{MCP_URL}/invoke", json=payload, timeout=60)
-    r.raise_for_status()
-    data = r.json()
+    data = _client().invoke(prompt)
     return data.get("result", json.dumps(data, indent=2))
\ No newline at end of file
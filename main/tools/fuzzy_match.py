@@ -0,0 +1,137 @@
+# fuzzy_match.py
+"""
+N-gram index for fuzzy name lookup (AppLauncher), replacing difflib's
+scan over every name.
+
+Names are split into tokens and each token contributes its padded bigrams
+and trigrams (" c", " ch", "chr", ..., "e "), so the gram set does not
+depend on token order ("code visual studio" ~ "visual studio code") and a
+swapped pair of letters still shares grams ("wrod" ~ "word"). A query:
+
+    1. collects the posting lists of its grams and counts shared grams
+       per name in one np.bincount (candidate generation)
+    2. scores candidates vectorized: mean of Dice overlap and query
+       coverage (so "chrome" ranks "google chrome" highly), keeping the
+       best `rerank` of them
+    3. re-scores those with difflib: the better of the ratio on
+       token-sorted strings and the mean best per-token ratio of the
+       query, blended with the n-gram score
+
+Aliases ("vs code" -> "visual studio code") are expanded as whole words
+inside the query before matching.
+
+Usage:
+    fuzzy = FuzzyIndex(["google chrome", "visual studio code"], aliases={"vs code": "visual studio code"})
+    fuzzy.search("crhome", k=3)     # [("google chrome", 0.71), ...]
+    fuzzy.best("code visual studio")
+"""
+
+import re
+from difflib import SequenceMatcher
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokens(text: str) -> list:
+    return _TOKEN.findall((text or "").lower())
+
+
+def ngrams(text: str) -> set:
+    grams = set()
+    for tok in tokens(text):
+        padded = f" {tok} "
+        grams.update(padded[i:i + 2] for i in range(len(padded) - 1))
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class FuzzyIndex:
+    def __init__(self, names=(), aliases: dict = None, rerank: int = 16):
+        """
+        :param names:   strings to index (e.g. lower-case app names)
+        :param aliases: phrase -> replacement, applied to queries on word boundaries
+        :param rerank:  candidates re-scored with difflib after the n-gram pass
+        """
+        self.rerank = rerank
+        self.aliases = {}
+        self._alias_re = None
+        self.set_aliases(aliases or {})
+        self.build(names)
+
+    def set_aliases(self, aliases: dict):
+        self.aliases = {" ".join(tokens(k)): v for k, v in aliases.items()}
+        if self.aliases:
+            # longest first so "vs code" wins over "code"
+            alt = "|".join(re.escape(k) for k in sorted(self.aliases, key=len, reverse=True))
+            self._alias_re = re.compile(rf"\b(?:{alt})\b")
+        else:
+            self._alias_re = None
+
+    def expand_aliases(self, query: str) -> str:
+        q = " ".join(tokens(query))
+        if self._alias_re is None:
+            return q
+        return self._alias_re.sub(lambda m: self.aliases[m.group(0)], q)
+
+    def build(self, names):
+        self.names = list(names)
+        self._tokens = [sorted(tokens(n)) for n in self.names]
+        postings = {}
+        sizes = np.zeros(len(self.names), dtype=np.float32)
+        for i, name in enumerate(self.names):
+            grams = ngrams(name)
+            sizes[i] = len(grams)
+            for g in grams:
+                postings.setdefault(g, []).append(i)
+        self._postings = {g: np.asarray(ids, dtype=np.int32) for g, ids in postings.items()}
+        self._sizes = sizes
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query: str, k: int = 5, cutoff: float = 0.6) -> list:
+        """Ranked [(name, score)] with score >= cutoff, best first, at most k."""
+        q = self.expand_aliases(query)
+        q_grams = ngrams(q)
+        if not q_grams or not self.names:
+            return []
+        lists = [self._postings[g] for g in q_grams if g in self._postings]
+        if not lists:
+            return []
+        counts = np.bincount(np.concatenate(lists), minlength=len(self.names))
+        cand = np.flatnonzero(counts)
+        common = counts[cand].astype(np.float32)
+        qn = float(len(q_grams))
+        score = 0.5 * (2.0 * common / (qn + self._sizes[cand]) + common / qn)
+        if cand.size > self.rerank:
+            top = np.argpartition(-score, self.rerank - 1)[:self.rerank]
+            cand, score = cand[top], score[top]
+
+        q_tokens = sorted(tokens(q))
+        q_sorted = " ".join(q_tokens)
+        whole, part = SequenceMatcher(autojunk=False), SequenceMatcher(autojunk=False)
+        whole.set_seq2(q_sorted)
+        ranked = []
+        for i, s in zip(cand.tolist(), score.tolist()):
+            name_tokens = self._tokens[i]
+            whole.set_seq1(" ".join(name_tokens))
+            cover = 0.0
+            for qt in q_tokens:
+                part.set_seq2(qt)
+                best = 0.0
+                for nt in name_tokens:
+                    part.set_seq1(nt)
+                    best = max(best, part.ratio())
+                cover += best
+            text = max(whole.ratio(), 0.95 * cover / len(q_tokens))
+            final = 0.3 * s + 0.7 * text
+            if final >= cutoff:
+                ranked.append((final, self.names[i]))
+        ranked.sort(key=lambda t: (-t[0], len(t[1])))
+        return [(name, round(sc, 3)) for sc, name in ranked[:k]]
+
+    def best(self, query: str, cutoff: float = 0.6):
+        hits = self.search(query, k=1, cutoff=cutoff)
+        return hits[0][0] if hits else None
@@ -1,7 +1,65 @@
 # kill_process.py
 from langchain.tools import tool
-import psutil
-from typing import Optional
+import re
+
+from tools.process_table import ProcessTable
+
+PER_PAGE = 30
+_SORT_WORDS = {"cpu": "cpu", "memory": "memory", "mem": "memory", "ram": "memory", "name": "name", "pid": "pid"}
+_LIST = re.compile(r"^list processes(?:\s+(?:by|sorted by)\s+(\w+))?(?:\s+page\s+(\d+))?$")
+
+# single cached table for the tool; the PID list is re-read at most every ttl seconds
+_TABLE = None
+
+
+def _table() -> ProcessTable:
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = ProcessTable(ttl=2.0)
+    return _TABLE
+
+
+def is_known_process(name: str) -> bool:
+    """Exact name of a running process ("notepad", "process chrome.exe"), for the intent router."""
+    name = " ".join((name or "").lower().split())
+    if name.startswith("process "):
+        name = name[len("process "):]
+    return _table().has_name(name)
+
+
+def _format_row(info, sort: str) -> str:
+    line = f"PID: {info.pid}, Name: {info.name or 'N/A'}, Status: {info.status}"
+    if sort == "cpu":
+        line += f", CPU: {info.cpu:.1f}%"
+    elif sort == "memory":
+        line += f", Memory: {info.rss / (1024 * 1024):.1f} MB"
+    return line
+
+
+def _list(sort: str, page: int) -> str:
+    rows, total = _table().list(sort=sort, page=page, per_page=PER_PAGE)
+    if not rows:
+        return f"No processes on page {page} ({total} running)."
+    response = "\n".join(_format_row(info, sort) for info in rows)
+    pages = (total + PER_PAGE - 1) // PER_PAGE
+    if pages > 1:
+        response += f"\n... (page {page} of {pages}, {total} processes; say 'list processes page {page + 1}' for more)"
+    return response
+
+
+def _kill(pids: list, label: str) -> str:
+    ended, failed = _table().kill(pids)
+    reasons = ", ".join(f"{pid} ({why})" for pid, why in failed.items())
+    if not ended:
+        return f"Could not kill {label}: {reasons}." if reasons else f"Could not kill {label}."
+    if len(ended) > 1:
+        msg = f"Killed {label} ({len(ended)} processes)."
+    elif label == str(ended[0]):
+        msg = f"Process {ended[0]} terminated."
+    else:
+        msg = f"Killed {label}."
+    return msg + (f" Not stopped: {reasons}." if reasons else "")
+
 
 @tool("kill_process", return_direct=True)
 def kill_process_tool(cmd: str) -> str:
@@ -12,47 +70,31 @@ def kill_process_tool(cmd: str) -> str:
     - "list processes"
     - "kill 1234"
     - "kill process chrome"
+
+    Listings can be sorted and paged, e.g. 'list processes by memory' or
+    'list processes by cpu page 2'.
     """
-    cmd = (cmd or "").strip().lower()
-
-    if cmd == "list processes":
-        processes = []
-        for proc in psutil.process_iter(attrs=["pid", "name", "status"]):
-            try:
-                info = proc.info
-                processes.append(
-                    f"PID: {info['pid']}, Name: {info.get('name','N/A')}, Status: {info.get('status','N/A')}"
-                )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        response = "\n".join(processes[:30])
-        if len(processes) > 30:
-            response += "\n... (listing first 30 processes)"
-        return response
+    cmd = " ".join((cmd or "").strip().lower().split())
+
+    listing = _LIST.match(cmd)
+    if listing:
+        sort = _SORT_WORDS.get(listing.group(1) or "pid")
+        if sort is None:
+            return "I can sort processes by cpu, memory, name or pid."
+        return _list(sort, int(listing.group(2) or 1))
 
     if cmd.startswith("kill process") or cmd.startswith("kill"):
         parts = cmd.split(maxsplit=2)
         if len(parts) < 2:
             return "Please specify a process ID or name to kill. Example: 'kill 1234' or 'kill process chrome'"
-        target = parts[-1]
-        try:
-            pid = int(target)
-            psutil.Process(pid).terminate()
-            return f"Process {pid} terminated."
-        except ValueError:
-            matched = [
-                p for p in psutil.process_iter(attrs=["pid","name"])
-                if target in (p.info["name"] or "").lower()
-            ]
-            if not matched:
-                return f"No process found with name containing '{target}'."
-            killed = []
-            for p in matched:
-                try:
-                    p.terminate()
-                    killed.append(p.info["pid"])
-                except Exception:
-                    pass
-            return f"Killed {target}" if killed else f"Could not kill any processes matching '{target}'."
-
-    return "Unsupported command. Use 'list processes' or 'kill <pid|name>'."
+        target = parts[-1] if parts[1] == "process" else " ".join(parts[1:])
+        ids = target.replace(",", " ").split()
+        if ids and all(t.isdigit() for t in ids):
+            pids = [int(t) for t in ids]
+            return _kill(pids, ", ".join(ids))
+        pids = _table().find(target)
+        if not pids:
+            return f"No process found with name containing '{target}'."
+        return _kill(pids, target)
+
+    return "Unsupported command. Use 'list processes [by cpu|memory]' or 'kill <pid|name>'."
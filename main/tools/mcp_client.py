@@ -0,0 +1,316 @@
+# mcp_client.py
+"""
+Pooled HTTP client for the MCP container(s) behind docker_mcp.
+
+    McpClient       – requests.Session with a sized HTTPAdapter pool, so
+                      calls reuse kept-alive connections instead of paying
+                      TCP setup every time
+    AsyncMcpClient  – same behaviour on aiohttp for asyncio callers
+
+Both share the endpoint handling in _Balancer:
+
+    • several base URLs; each call goes to the available endpoint with the
+      fewest requests in flight, ties broken by a moving average of latency
+    • an endpoint that fails `max_failures` times in a row is parked for
+      `cooldown` seconds; check_health() (or the background checker) GETs
+      `health_path` and brings it back early
+    • (connect, read) timeouts per path, e.g. a short one for /health
+    • bounded retries with full-jitter exponential backoff on connection
+      errors and 502/503/504, each on the next endpoint. POSTs are not
+      retried after a read timeout: the server may already be working on it
+
+Usage:
+    client = McpClient(["http://127.0.0.1:7100", "http://127.0.0.1:7101"])
+    client.start_health_checks()
+    data = client.invoke("list containers")          # {"result": ...}
+
+    async with AsyncMcpClient(urls) as aclient:
+        data = await aclient.invoke("list containers")
+"""
+
+import time
+import random
+import asyncio
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+DEFAULT_TIMEOUTS = {
+    "/invoke": (3.0, 60.0),     # (connect, read) seconds
+    "/health": (1.0, 2.0),
+}
+RETRY_STATUS = (502, 503, 504)
+
+
+class McpError(RuntimeError):
+    pass
+
+
+def _not_sent(e: requests.RequestException) -> bool:
+    # connecting failed, so the request never left this process
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    if isinstance(e, requests.ConnectionError):
+        reason = getattr(e.args[0], "reason", e.args[0]) if e.args else None
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+class Endpoint:
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.inflight = 0
+        self.failures = 0              # consecutive
+        self.down_until = 0.0
+        self.latency = None            # EWMA seconds
+        self.calls = 0
+
+    def available(self, now: float) -> bool:
+        return now >= self.down_until
+
+    def __repr__(self):
+        state = "up" if self.available(time.monotonic()) else "down"
+        lat = f"{self.latency * 1000:.1f} ms" if self.latency is not None else "-"
+        return f"<Endpoint {self.url} {state} inflight={self.inflight} latency={lat}>"
+
+
+class _Balancer:
+    def __init__(self, urls, timeouts: dict = None, retries: int = 2, backoff: float = 0.2,
+                 max_backoff: float = 2.0, max_failures: int = 2, cooldown: float = 10.0,
+                 health_path: str = "/health", pool_size: int = 16):
+        """
+        :param urls:         base URL or list of base URLs of the MCP servers
+        :param timeouts:     path -> (connect, read) seconds, merged over DEFAULT_TIMEOUTS;
+                             the "" key is the fallback for other paths
+        :param retries:      extra attempts after the first, each on the next endpoint
+        :param backoff:      base of the jittered exponential delay between attempts
+        :param max_backoff:  cap on that delay
+        :param max_failures: consecutive failures before an endpoint is parked
+        :param cooldown:     seconds a parked endpoint is skipped (unless a health check passes)
+        :param health_path:  GET path that answers 2xx when a server is up
+        :param pool_size:    kept-alive connections per endpoint
+        """
+        if isinstance(urls, str):
+            urls = [u for u in urls.split(",") if u.strip()]
+        if not urls:
+            raise ValueError("at least one MCP URL is required")
+        self.endpoints = [Endpoint(u.strip()) for u in urls]
+        self.timeouts = {"": (3.0, 30.0), **DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.health_path = health_path
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+
+    def timeout_for(self, path: str):
+        return self.timeouts.get(path, self.timeouts[""])
+
+    def _pick(self, exclude=()) -> Endpoint:
+        now = time.monotonic()
+        with self._lock:
+            pool = [e for e in self.endpoints if e.available(now) and e not in exclude]
+            if not pool:
+                # everything is parked (or already tried): take the one due back soonest
+                untried = [e for e in self.endpoints if e not in exclude] or self.endpoints
+                pool = [min(untried, key=lambda e: e.down_until)]
+            ep = min(pool, key=lambda e: (e.inflight, e.latency or 0.0))
+            ep.inflight += 1
+            ep.calls += 1
+            return ep
+
+    def _release(self, ep: Endpoint, ok: bool, elapsed: float):
+        with self._lock:
+            ep.inflight -= 1
+            if ok:
+                ep.failures = 0
+                ep.down_until = 0.0
+                ep.latency = elapsed if ep.latency is None else 0.8 * ep.latency + 0.2 * elapsed
+            else:
+                ep.failures += 1
+                if ep.failures >= self.max_failures:
+                    ep.down_until = time.monotonic() + self.cooldown
+
+    def _mark_health(self, ep: Endpoint, ok: bool):
+        with self._lock:
+            if ok:
+                ep.failures = 0
+                ep.down_until = 0.0
+            else:
+                ep.down_until = time.monotonic() + self.cooldown
+
+    def _delay(self, attempt: int) -> float:
+        return random.uniform(0.0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def status(self) -> list:
+        return [repr(e) for e in self.endpoints]
+
+
+class McpClient(_Balancer):
+    def __init__(self, urls, **kwargs):
+        super().__init__(urls, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.endpoints), pool_maxsize=self.pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._health_stop = threading.Event()
+        self._health_thread = None
+
+    def request(self, method: str, path: str, payload: dict = None) -> dict:
+        tried, last_error = [], None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._delay(attempt - 1))
+            ep = self._pick(exclude=tried)
+            tried.append(ep)
+            t0 = time.perf_counter()
+            try:
+                r = self.session.request(method, ep.url + path, json=payload, timeout=self.timeout_for(path))
+            except (requests.ConnectionError, requests.ConnectTimeout) as e:
+                self._release(ep, False, 0.0)
+                # a reset after the request went out may have run the tool already
+                if method != "GET" and not _not_sent(e):
+                    raise McpError(f"{ep.url}{path} failed mid-request: {e!r}") from e
+                last_error = e
+                continue
+            except requests.ReadTimeout as e:
+                self._release(ep, False, 0.0)
+                if method != "GET":
+                    raise McpError(f"{ep.url}{path} timed out after {self.timeout_for(path)[1]} s") from e
+                last_error = e
+                continue
+            if r.status_code in RETRY_STATUS:
+                self._release(ep, False, 0.0)
+                last_error = McpError(f"{ep.url}{path} answered {r.status_code}")
+                continue
+            self._release(ep, True, time.perf_counter() - t0)
+            r.raise_for_status()
+            return r.json()
+        raise McpError(f"{path} failed after {len(tried)} attempt(s): {last_error}") from last_error
+
+    def invoke(self, query: str) -> dict:
+        return self.request("POST", "/invoke", {"query": query})
+
+    # ---------- health ----------
+    def check_health(self) -> dict:
+        results = {}
+        for ep in self.endpoints:
+            try:
+                r = self.session.get(ep.url + self.health_path, timeout=self.timeout_for(self.health_path))
+                ok = r.ok
+            except requests.RequestException:
+                ok = False
+            self._mark_health(ep, ok)
+            results[ep.url] = ok
+        return results
+
+    def start_health_checks(self, interval: float = 15.0) -> threading.Thread:
+        if self._health_thread is not None:
+            return self._health_thread
+
+        def run():
+            while not self._health_stop.wait(interval):
+                self.check_health()
+        self._health_thread = threading.Thread(target=run, daemon=True)
+        self._health_thread.start()
+        return self._health_thread
+
+    def close(self):
+        self._health_stop.set()
+        self.session.close()
+
+
+class AsyncMcpClient(_Balancer):
+    def __init__(self, urls, **kwargs):
+        super().__init__(urls, **kwargs)
+        self._session = None
+        self._health_task = None
+
+    async def _get_session(self):
+        import aiohttp
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def _timeout(self, path: str):
+        import aiohttp
+        connect, read = self.timeout_for(path)
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    async def request(self, method: str, path: str, payload: dict = None) -> dict:
+        import aiohttp
+        session = await self._get_session()
+        tried, last_error = [], None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self._delay(attempt - 1))
+            ep = self._pick(exclude=tried)
+            tried.append(ep)
+            t0 = time.perf_counter()
+            try:
+                async with session.request(method, ep.url + path, json=payload, timeout=self._timeout(path)) as r:
+                    if r.status in RETRY_STATUS:
+                        self._release(ep, False, 0.0)
+                        last_error = McpError(f"{ep.url}{path} answered {r.status}")
+                        continue
+                    r.raise_for_status()
+                    data = await r.json(content_type=None)
+            except (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+                self._release(ep, False, 0.0)
+                # a dropped kept-alive connection fails before the server saw the request
+                never_sent = isinstance(e, (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError,
+                                            aiohttp.ServerDisconnectedError))
+                if method != "GET" and not never_sent:
+                    raise McpError(f"{ep.url}{path} failed mid-request: {e!r}") from e
+                last_error = e
+                continue
+            except aiohttp.ClientResponseError:
+                self._release(ep, True, time.perf_counter() - t0)
+                raise
+            self._release(ep, True, time.perf_counter() - t0)
+            return data
+        raise McpError(f"{path} failed after {len(tried)} attempt(s): {last_error}") from last_error
+
+    async def invoke(self, query: str) -> dict:
+        return await self.request("POST", "/invoke", {"query": query})
+
+    async def check_health(self) -> dict:
+        import aiohttp
+        session = await self._get_session()
+
+        async def probe(ep):
+            try:
+                async with session.get(ep.url + self.health_path, timeout=self._timeout(self.health_path)) as r:
+                    ok = r.status < 400
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                ok = False
+            self._mark_health(ep, ok)
+            return ep.url, ok
+        return dict(await asyncio.gather(*(probe(ep) for ep in self.endpoints)))
+
+    def start_health_checks(self, interval: float = 15.0) -> asyncio.Task:
+        if self._health_task is None:
+            async def run():
+                while True:
+                    await asyncio.sleep(interval)
+                    await self.check_health()
+            self._health_task = asyncio.get_running_loop().create_task(run())
+        return self._health_task
+
+    async def close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -1,25 +1,84 @@
 # opencode_module.py
-import os, sys, time, platform, shutil, subprocess, requests
+"""
+Bridge Delta <-> OpenCode.
+
+OpenCodeClient talks to one `opencode serve` for the life of the process:
+
+    • attach – if something already answers on host:port it is used as is
+    • start  – otherwise `opencode serve` is spawned once; readiness is the
+               "listening on http://..." line it prints (no ping loop), and
+               the URL in that line is used, so port 0 works too
+    • one requests.Session (kept-alive connections) and one OpenCode
+      session id reused across turns; recreated once if the server lost it
+    • on_part(text) gets the reply as it is produced, from one /event
+      subscription (message.part.updated), while the POST waits for the
+      finished message
+    • if serve mode cannot be used, the prompt goes through `opencode run`,
+      but only when it never reached the server (no server, connection
+      refused, connect timeout). A read timeout or an HTTP error after the
+      POST went out is reported instead: the server may already be working
+      on it, and running it again would make the same edits twice
+
+Usage:
+    client = OpenCodeClient()
+    reply = client.ask("add a --verbose flag to manager.py", on_part=print)
+    client.close()
+"""
+
+import os, re, json, atexit, platform, shutil, threading, subprocess
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 from langchain.tools import tool
 
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 4096
+_LISTENING = re.compile(r"(https?://[\w.\-\[\]:]+:\d+)")
 
-@tool("OpenCodeModule", return_direct=True)
-def OpenCodeModule() -> str:
-    """
-    Bridge Delta <-> OpenCode.
-    mode="run":   fire-and-forget via `opencode run`
-    mode="serve": ensure `opencode serve` is up, then call HTTP API.
-    """
-    def __init__(self, mode="run", binary="opencode", host=DEFAULT_HOST, port=DEFAULT_PORT):
-        self.mode   = mode
+
+class ServeUnavailable(RuntimeError):
+    """Serve mode could not take the prompt; it was not sent, so run mode may have it."""
+
+
+def _not_sent(e: requests.RequestException) -> bool:
+    # connecting failed, so the request never left this process
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    if isinstance(e, requests.ConnectionError):
+        reason = getattr(e.args[0], "reason", e.args[0]) if e.args else None
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+class OpenCodeClient:
+    def __init__(self, mode="serve", binary="opencode", host=DEFAULT_HOST, port=DEFAULT_PORT,
+                 cwd=None, start_timeout=15.0, reply_timeout=300.0, stream=True):
+        """
+        :param mode:          "serve" (HTTP API, falls back to run) or "run" (one process per prompt)
+        :param binary:        opencode executable name or full path
+        :param host:          serve hostname
+        :param port:          serve port (0 = let opencode pick; read from its output)
+        :param cwd:           project directory for the server / run
+        :param start_timeout: seconds to wait for `opencode serve` to report it is listening
+        :param reply_timeout: seconds to wait for one reply
+        :param stream:        follow /event for partial text when on_part is given
+        """
+        self.mode = mode
         self.binary = binary
-        self.host   = host
-        self.port   = port
-        self.proc   = None  # server process when mode="serve"
+        self.host = host
+        self.port = port
+        self.cwd = cwd or os.getcwd()
+        self.start_timeout = start_timeout
+        self.reply_timeout = reply_timeout
+        self.stream = stream
+        self.base_url = f"http://{host}:{port}" if port else None
+        self.proc = None            # server process when we started it
+        self.ready = False          # a server answered; skip the ping until a request fails
         self.session_id = None
+        self.http = requests.Session()
+        self._events = None         # thread following /event
+        self._turn = None           # (session id, on_part, idle Event) while a streamed reply is pending
+        self._lock = threading.Lock()
 
     # ---------- shared ----------
     def _which(self):
@@ -31,8 +90,22 @@ def OpenCodeModule() -> str:
             raise FileNotFoundError("opencode binary not found on PATH")
         return path
 
+    def ask(self, prompt: str, model: str | None = None, agent: str | None = None, on_part=None) -> str:
+        """Serve mode when possible, `opencode run` if the server could not be reached.
+        Raises RuntimeError if the server got the prompt but did not answer in time."""
+        if self.mode == "serve":
+            try:
+                return self.ask_serve(prompt, model=model, agent=agent, on_part=on_part)
+            except ServeUnavailable as e:
+                self.ready = False
+                print(f"[OpenCode] serve mode failed ({e}); using run mode")
+        text = self.ask_run(prompt, model=model)
+        if on_part and text:
+            on_part(text)
+        return text
+
     # ---------- run mode ----------
-    def ask_run(self, prompt: str, model: str|None=None, cwd: str|None=None) -> str:
+    def ask_run(self, prompt: str, model: str | None = None, cwd: str | None = None) -> str:
         exe = self._which()
         cmd = [exe, "run", prompt]
         if model:
@@ -40,71 +113,217 @@ def OpenCodeModule() -> str:
         p = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            text=True, cwd=cwd or os.getcwd()
+            text=True, cwd=cwd or self.cwd
         )
-        out, err = p.communicate()
+        try:
+            out, err = p.communicate(timeout=self.reply_timeout)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.communicate()
+            raise
         if p.returncode != 0 and not out:
             raise RuntimeError(err.strip() or "opencode run failed")
         return out.strip()
 
     # ---------- serve mode ----------
-    def _server_url(self, path: str) -> str:
-        return f"http://{self.host}:{self.port}{path}"
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
 
     def _ping(self) -> bool:
+        if not self.base_url:
+            return False
         try:
-            r = requests.get(self._server_url("/app"), timeout=0.4)
-            return r.ok
-        except Exception:
+            return self.http.get(self._url("/app"), timeout=0.5).ok
+        except requests.RequestException:
             return False
 
-    def ensure_server(self, cwd: str|None=None, quiet=True):
-        if self._ping():
-            return
+    def ensure_server(self):
+        with self._lock:
+            if self.ready and (self.proc is None or self.proc.poll() is None):
+                return
+            if not self._ping():
+                self._start_server()
+            # else: attach to a server someone else started
+            self.ready = True
+
+    def _start_server(self):
         exe = self._which()
         flags = 0
         if platform.system() == "Windows":
-            flags = subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+            flags = subprocess.CREATE_NO_WINDOW
         self.proc = subprocess.Popen(
             [exe, "serve", "--port", str(self.port), "--hostname", self.host],
-            stdout=(subprocess.DEVNULL if quiet else None),
-            stderr=(subprocess.DEVNULL if quiet else None),
-            cwd=cwd or os.getcwd(),
-            creationflags=flags
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            text=True, cwd=self.cwd, creationflags=flags
         )
-        # wait for readiness
-        for _ in range(60):
-            time.sleep(0.1)
-            if self._ping():
-                return
-        raise RuntimeError("Failed to start opencode server")
+        ready = threading.Event()
+
+        def watch(stream):
+            # first URL printed is where it listens; keep draining so the pipe never fills
+            for line in stream:
+                if not ready.is_set():
+                    m = _LISTENING.search(line)
+                    if m:
+                        self.base_url = m.group(1).rstrip("/")
+                        ready.set()
+            ready.set()     # process exited
+        threading.Thread(target=watch, args=(self.proc.stdout,), daemon=True).start()
+
+        if not ready.wait(self.start_timeout) or self.proc.poll() is not None or not self._ping():
+            self._stop_server()
+            raise RuntimeError("Failed to start opencode server")
+        self.session_id = None
+        print(f"[OpenCode] serve listening on {self.base_url}")
 
     def ensure_session(self):
         if self.session_id:
             return self.session_id
-        r = requests.post(self._server_url("/session"), json={}, timeout=5)
+        r = self.http.post(self._url("/session"), json={}, timeout=5)
         r.raise_for_status()
         data = r.json()
         # server returns a Session object; prefer `id` top-level or info.id
         self.session_id = (data.get("id")
-                            or data.get("info", {}).get("id"))
+                           or data.get("info", {}).get("id"))
         if not self.session_id:
             raise RuntimeError("Could not obtain session id")
         return self.session_id
 
-    def ask_serve(self, prompt: str, model: str|None=None, agent: str|None=None) -> str:
-        sid = self.ensure_session()
+    def _ensure_events(self):
+        """One /event subscription for the client's lifetime; reopened if it dropped."""
+        if self._events is not None and self._events.is_alive():
+            return
+        opened = threading.Event()
+        self._events = threading.Thread(target=self._follow_events, args=(opened,), daemon=True)
+        self._events.start()
+        opened.wait(3)      # subscribed before the prompt is sent, so the first parts are not missed
+
+    def _follow_events(self, opened: threading.Event):
+        """Feed the current turn's on_part the new text of its session's text parts."""
+        seen = {}       # part id -> text already delivered
+        try:
+            with self.http.get(self._url("/event"), stream=True, timeout=(3, None)) as r:
+                opened.set()
+                for line in r.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[5:])
+                    except ValueError:
+                        continue
+                    turn = self._turn
+                    if turn is None:
+                        continue
+                    sid, on_part, idle = turn
+                    props = event.get("properties") or {}
+                    if event.get("type") == "session.idle" and props.get("sessionID") == sid:
+                        idle.set()
+                        continue
+                    part = props.get("part") or {}
+                    if (event.get("type") != "message.part.updated" or part.get("sessionID") != sid
+                            or part.get("type") != "text"):
+                        continue
+                    text = part.get("text") or ""
+                    done = seen.get(part.get("id"), "")
+                    new = props.get("delta") or (text[len(done):] if text.startswith(done) else text)
+                    seen[part.get("id")] = text
+                    if new:
+                        on_part(new)
+        except requests.RequestException:
+            pass
+        finally:
+            opened.set()
+
+    def ask_serve(self, prompt: str, model: str | None = None, agent: str | None = None, on_part=None) -> str:
+        """Raises ServeUnavailable when the prompt was not sent, RuntimeError when it was but failed."""
+        try:
+            self.ensure_server()
+        except (requests.RequestException, RuntimeError, OSError) as e:
+            raise ServeUnavailable(str(e)) from e
         body = {"parts": [{"type": "text", "text": prompt}]}
-        if model: body["modelID"] = model
-        if agent: body["agentID"] = agent
-        r = requests.post(self._server_url(f"/session/{sid}/message"), json=body, timeout=120)
-        r.raise_for_status()
-        msg = r.json()
+        if model:
+            provider, _, model_id = model.partition("/")
+            body["model"] = {"providerID": provider, "modelID": model_id} if model_id else {"modelID": model}
+        if agent:
+            body["agent"] = agent
+
+        for attempt in range(2):
+            try:
+                sid = self.ensure_session()
+            except (requests.RequestException, RuntimeError, ValueError) as e:
+                raise ServeUnavailable(f"no session: {e}") from e      # the prompt has not been sent yet
+            idle = threading.Event()
+            if on_part and self.stream:
+                self._turn = (sid, on_part, idle)
+                self._ensure_events()
+            try:
+                r = self.http.post(self._url(f"/session/{sid}/message"), json=body, timeout=(3, self.reply_timeout))
+                if self._turn is not None:
+                    idle.wait(0.5)      # let parts that raced the reply through
+            except requests.RequestException as e:
+                if _not_sent(e):
+                    raise ServeUnavailable(str(e)) from e
+                self.ready = False
+                raise RuntimeError(f"no reply from opencode serve ({e}); the request may still be running") from e
+            finally:
+                self._turn = None
+            if r.status_code == 404 and attempt == 0:
+                self.session_id = None      # server restarted or session deleted
+                continue
+            try:
+                r.raise_for_status()
+                return self._message_text(r.json())
+            except (requests.RequestException, ValueError) as e:
+                raise RuntimeError(f"opencode serve failed the request ({e}); not retried") from e
+        raise RuntimeError("opencode session could not be created")
+
+    @staticmethod
+    def _message_text(msg: dict) -> str:
         # Extract text from `parts` if present (API returns Message object)
-        parts = msg.get("parts") or []
         texts = []
-        for p in parts:
+        for p in msg.get("parts") or []:
             # some implementations use {type:"text", content:"..."} or {type:"text", text:"..."}
             if isinstance(p, dict) and p.get("type") == "text":
                 texts.append(p.get("text") or p.get("content") or "")
         return "\n".join(t for t in texts if t)
+
+    # ---------- lifecycle ----------
+    def _stop_server(self):
+        if self.proc is not None:
+            if self.proc.poll() is None:
+                self.proc.terminate()
+                try:
+                    self.proc.wait(5)
+                except subprocess.TimeoutExpired:
+                    self.proc.kill()
+            self.proc = None
+
+    def close(self):
+        """Stop the server if this client started it; an attached server is left running."""
+        self._stop_server()
+        self.http.close()
+
+
+# single client for the tool: one server, one session across turns
+_CLIENT = None
+
+def _client() -> OpenCodeClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenCodeClient(mode=os.getenv("DELTA_OPENCODE_MODE", "serve"),
+                                 binary=os.getenv("DELTA_OPENCODE_BIN", "opencode"))
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
+@tool("OpenCodeModule", return_direct=True)
+def OpenCodeModule(prompt: str) -> str:
+    """
+    Send a coding request to OpenCode (the coding agent) and return its reply.
+    Use for writing, editing or explaining code in the current project.
+    The conversation with OpenCode carries over between calls.
+    """
+    def show(text):
+        print(text, end="", flush=True)
+    try:
+        return _client().ask(prompt, on_part=show) or "OpenCode returned no text."
+    except (FileNotFoundError, RuntimeError, subprocess.TimeoutExpired) as e:
+        return f"OpenCode is not available: {e}"
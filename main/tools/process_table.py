@@ -0,0 +1,258 @@
+# process_table.py
+"""
+Cached process table for kill_process_tool.
+
+A snapshot is kept between calls and refreshed at most every `ttl`
+seconds. A refresh is incremental: psutil.pids() is diffed against the
+cached table, only new PIDs are opened (name and create time are fixed for
+the life of a process) and exited ones are dropped. Alongside it the table
+keeps a lower-case name -> pids index and a FuzzyIndex over the distinct
+names, so "kill process chrome" does not walk every process.
+
+A PID can exit and be reused inside the TTL, which the PID diff does not
+see. Every entry keeps its create time; find() re-checks the PIDs it is
+about to return and replaces entries whose create time changed, and kill()
+goes through the cached psutil.Process, which refuses to signal a reused
+PID. New entries get a first cpu_percent() call so the next one measures
+something.
+
+Per-process work that changes over time is only done when it is needed:
+status for the rows of the page being shown, CPU/memory for every process
+only when the listing is sorted by them (on their own TTL).
+
+kill() runs terminate -> wait -> kill for all PIDs at once through
+psutil.wait_procs, so N stubborn processes cost one timeout, not N.
+
+Usage:
+    table = ProcessTable(ttl=2.0)
+    rows, total = table.list(sort="memory", page=1, per_page=30)
+    pids = table.find("chrome")
+    killed, failed = table.kill(pids, timeout=3.0)
+"""
+
+import os
+import time
+import threading
+
+from tools.fuzzy_match import FuzzyIndex
+
+SORT_KEYS = ("pid", "name", "cpu", "memory")
+
+
+class ProcessInfo:
+    __slots__ = ("pid", "name", "proc", "created", "cpu", "rss", "status")
+
+    def __init__(self, pid: int, name: str, proc, created: float):
+        self.pid = pid
+        self.name = name
+        self.proc = proc          # psutil.Process, kept so cpu_percent() has a previous sample
+        self.created = created    # create time; tells a reused PID apart
+        self.cpu = 0.0
+        self.rss = 0
+        self.status = "N/A"
+
+
+class ProcessTable:
+    def __init__(self, ttl: float = 2.0, metrics_ttl: float = 2.0, provider=None):
+        """
+        :param ttl:         seconds a snapshot of the PID list is reused
+        :param metrics_ttl: seconds CPU/memory samples are reused for sorted listings
+        :param provider:    psutil or a stand-in with the same API (benchmarks)
+        """
+        if provider is None:
+            import psutil as provider
+        self.ps = provider
+        self.ttl = ttl
+        self.metrics_ttl = metrics_ttl
+        self.procs = {}                 # pid -> ProcessInfo
+        self.by_name = {}               # lower-case name -> set of pids
+        self.refreshed_at = 0.0
+        self.metrics_at = 0.0
+        self._fuzzy = None
+        self._lock = threading.RLock()
+
+    # ---------- snapshot ----------
+    def refresh(self, force: bool = False) -> dict:
+        """Diff the PID list against the cache; returns counters (empty when the TTL has not expired)."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self.refreshed_at < self.ttl:
+                return {}
+            pids = set(self.ps.pids())
+            gone = self.procs.keys() - pids
+            for pid in gone:
+                self._forget(pid)
+            added = 0
+            for pid in pids - self.procs.keys():
+                added += self._add(pid)
+            if added or gone:
+                self._fuzzy = None
+            self.refreshed_at = now
+            return {"processes": len(self.procs), "added": added, "removed": len(gone)}
+
+    def _add(self, pid: int) -> bool:
+        try:
+            proc = self.ps.Process(pid)
+            with proc.oneshot():
+                name = proc.name() or ""
+                created = proc.create_time()
+            proc.cpu_percent(None)      # the first call only sets the baseline and returns 0.0
+        except (self.ps.NoSuchProcess, self.ps.AccessDenied, self.ps.ZombieProcess):
+            return False
+        self.procs[pid] = ProcessInfo(pid, name, proc, created)
+        self.by_name.setdefault(name.lower(), set()).add(pid)
+        return True
+
+    def _revalidate(self, pids) -> bool:
+        """Drop or replace cached entries whose PID now belongs to another process; True if any did."""
+        changed = False
+        for pid in pids:
+            info = self.procs.get(pid)
+            if info is None:
+                continue
+            try:
+                same = self.ps.Process(pid).create_time() == info.created
+            except (self.ps.NoSuchProcess, self.ps.ZombieProcess):
+                same = False
+            except self.ps.AccessDenied:
+                continue
+            if not same:
+                self._forget(pid)
+                self._add(pid)
+                changed = True
+        if changed:
+            self._fuzzy = None
+        return changed
+
+    def _forget(self, pid: int):
+        info = self.procs.pop(pid, None)
+        if info is None:
+            return
+        pids = self.by_name.get(info.name.lower())
+        if pids is not None:
+            pids.discard(pid)
+            if not pids:
+                del self.by_name[info.name.lower()]
+
+    def _sample_metrics(self):
+        now = time.monotonic()
+        if now - self.metrics_at < self.metrics_ttl:
+            return
+        for pid, info in list(self.procs.items()):
+            try:
+                with info.proc.oneshot():
+                    info.cpu = info.proc.cpu_percent(None)
+                    info.rss = info.proc.memory_info().rss
+            except (self.ps.NoSuchProcess, self.ps.ZombieProcess):
+                self._forget(pid)
+                self._fuzzy = None
+            except self.ps.AccessDenied:
+                pass
+        self.metrics_at = now
+
+    # ---------- queries ----------
+    def list(self, sort: str = "pid", page: int = 1, per_page: int = 30, descending: bool = None):
+        """One page of ProcessInfo rows and the total count; CPU/memory sorts are descending by default."""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"sort must be one of {SORT_KEYS}")
+        with self._lock:
+            self.refresh()
+            if sort in ("cpu", "memory"):
+                self._sample_metrics()
+            key = {"pid": lambda i: i.pid, "name": lambda i: (i.name.lower(), i.pid),
+                   "cpu": lambda i: i.cpu, "memory": lambda i: i.rss}[sort]
+            if descending is None:
+                descending = sort in ("cpu", "memory")
+            rows = sorted(self.procs.values(), key=key, reverse=descending)
+            total = len(rows)
+            start = max(0, (page - 1) * per_page)
+            rows = rows[start:start + per_page]
+            for info in rows:
+                try:
+                    info.status = info.proc.status()
+                except Exception:
+                    info.status = "N/A"
+            return rows, total
+
+    def find(self, name: str, fuzzy_cutoff: float = 0.7) -> list:
+        """PIDs whose name contains `name`; the closest names by fuzzy match if none do."""
+        target = (name or "").strip().lower()
+        if not target:
+            return []
+        with self._lock:
+            self.refresh()
+            pids = self._lookup(target, fuzzy_cutoff)
+            if self._revalidate(pids):      # a PID was reused since it was cached: look again
+                pids = self._lookup(target, fuzzy_cutoff)
+            return pids
+
+    def _lookup(self, target: str, fuzzy_cutoff: float) -> list:
+        if target in self.by_name:
+            return sorted(self.by_name[target])
+        pids = [pid for n, group in self.by_name.items() if target in n for pid in group]
+        if pids:
+            return sorted(pids)
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.by_name.keys())
+        best = self._fuzzy.best(target, cutoff=fuzzy_cutoff)
+        return sorted(self.by_name.get(best, ())) if best else []
+
+    def has_name(self, name: str) -> bool:
+        """True when a running process is called exactly `name` (".exe" optional), no substring or fuzzy match."""
+        target = (name or "").strip().lower()
+        if not target:
+            return False
+        with self._lock:
+            self.refresh()
+            return target in self.by_name or target + ".exe" in self.by_name
+
+    def name_of(self, pid: int) -> str:
+        info = self.procs.get(pid)
+        return info.name if info else "N/A"
+
+    # ---------- control ----------
+    def kill(self, pids, timeout: float = 3.0):
+        """
+        terminate() every PID, wait for all of them together, kill() the
+        survivors and wait again. Returns (ended_pids, failed) where failed
+        maps pid -> reason. Cached PIDs are signalled through their cached
+        psutil.Process, so a PID reused by another process is not touched.
+        """
+        procs, failed = [], {}
+        for pid in dict.fromkeys(pids):
+            if pid == os.getpid():
+                failed[pid] = "refusing to stop the assistant itself"
+                continue
+            with self._lock:
+                info = self.procs.get(pid)
+            try:
+                proc = info.proc if info is not None else self.ps.Process(pid)
+                proc.terminate()
+                procs.append(proc)
+            except self.ps.NoSuchProcess:
+                failed[pid] = "no such process"
+                with self._lock:
+                    self._forget(pid)
+            except self.ps.AccessDenied:
+                failed[pid] = "access denied"
+
+        gone, alive = self.ps.wait_procs(procs, timeout=timeout)
+        for proc in alive:
+            try:
+                proc.kill()
+            except self.ps.NoSuchProcess:
+                pass
+            except self.ps.AccessDenied:
+                failed[proc.pid] = "access denied"
+        if alive:
+            more_gone, alive = self.ps.wait_procs(alive, timeout=timeout)
+            gone += more_gone
+        for proc in alive:
+            failed.setdefault(proc.pid, "still running")
+
+        with self._lock:
+            for proc in gone:
+                self._forget(proc.pid)
+            if gone:
+                self._fuzzy = None
+        return sorted(p.pid for p in gone), failed
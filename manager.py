@@ -8,7 +8,6 @@ import subprocess
 import os
 import socket
 import json
-import datetime
 import glob
 
 from PyQt5.QtWidgets import (
@@ -16,11 +15,18 @@ from PyQt5.QtWidgets import (
     QMessageBox, QComboBox, QTabWidget, QLineEdit, QLabel, QFormLayout, QScrollArea,
     QSystemTrayIcon, QMenu, QAction, QStyle, QPlainTextEdit, QFileDialog, QAction, qApp
 )
-from PyQt5.QtGui import QIcon, QFont, QColor, QTextCursor, QGuiApplication, QPainter
-from PyQt5.QtCore import Qt, QProcess, QTimer, QProcessEnvironment, pyqtSignal
+from PyQt5.QtGui import QIcon, QFont, QColor, QTextCursor, QGuiApplication, QPainter, QDesktopServices
+from PyQt5.QtCore import Qt, QProcess, QTimer, QProcessEnvironment, pyqtSignal, QUrl
+
+from manager_parts.log_tail import LogFollower
+from manager_parts.job_runner import JobRunner, shell_job, python_job
+from manager_parts.output_sink import OutputSink
+from manager_parts.manager_log import ManagerLog, ManagerLogView
+from manager_parts.startup import StartupScheduler, build_jobs as build_startup_jobs, format_report
 
 # --- CONFIG SUPPORT ---
 CONFIG_PATH = os.path.join("main", "config", "terminal_config.json")
+MANAGER_LOG_PATH = os.path.join("main", "cache", "manager_log.sqlite")
 
 def load_config():
     if not os.path.exists(CONFIG_PATH):
@@ -31,7 +37,9 @@ def load_config():
             "script_directory": "scripts",
             "last_script": "",
             "auto_run_chain": False,
-            "script_chain": []
+            "script_chain": [],
+            "chain_mode": "sequential",
+            "max_parallel_jobs": 2
         }
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
@@ -41,6 +49,30 @@ def save_config(config):
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(config, f, indent=4)
 
+def connect_job_output(jobs, sink, chain_summary=True):
+    # stream a JobRunner's output into a terminal pane's OutputSink; job names only once several run
+    def on_output(name, text, is_err):
+        prefix = f"[{name}] " if jobs.active() > 1 else ""
+        if is_err:
+            prefix += "[stderr] "
+        sink.write(prefix + text.replace("\n", "\n" + prefix) if prefix else text)
+
+    def on_finished(name, state, code, seconds):
+        if state in ("done", "failed"):
+            sink.write(f"--- {name} exited with code {code} ({seconds:.2f} s) ---")
+        else:
+            sink.write(f"--- {name} {state} ---")
+
+    def on_chain_finished(group, summary):
+        sink.write(f"--- Chain finished ({len(summary)} scripts) ---")
+        for name, (state, code, seconds) in summary.items():
+            sink.write(f"    {name:<30} {state:<9} code {code:<4} {seconds:8.2f} s")
+
+    jobs.output.connect(on_output)
+    jobs.finished.connect(on_finished)
+    if chain_summary:
+        jobs.chain_finished.connect(on_chain_finished)
+
 class IntegratedTerminal(QWidget):
     # a widget providing an integrated terminal shell using QProcess.
     def __init__(self, parent=None):
@@ -50,7 +82,10 @@ class IntegratedTerminal(QWidget):
         self.history = []
         self.history_index = -1
         self.env = os.environ.copy()
+        self.jobs = JobRunner(max_parallel=2, parent=self)
         self.initUI()
+        self.sink = OutputSink(view=self.terminal_output, name="integrated_terminal", parent=self)
+        connect_job_output(self.jobs, self.sink)
         self.load_history()
         self.start_shell(self.shell_type)
 
@@ -105,6 +140,8 @@ class IntegratedTerminal(QWidget):
         # kill old
         if self.process:
             self.process.kill()
+            self.sink.end(self.process)
+            self.sink.end((self.process, "err"))
             self.process.deleteLater()
 
         # create and store on self.process
@@ -124,16 +161,16 @@ class IntegratedTerminal(QWidget):
         self.process.setProgram(prog)
         self.process.setArguments(args)
         self.process.start()
-        self.terminal_output.appendPlainText(f"[Launched {prog} in {os.getcwd()}]")
+        self.sink.write(f"[Launched {prog} in {os.getcwd()}]")
 
     def run_command(self):
         cmd = self.terminal_input.text().strip()
         # ← now this will actually see the QProcess you just started
         if not cmd or not self.process or self.process.state() != QProcess.Running:
-            self.terminal_output.appendPlainText("[No persistent shell process running!]")
+            self.sink.write("[No persistent shell process running!]")
             return
 
-        self.terminal_output.appendPlainText(f">>> {cmd}")
+        self.sink.write(f">>> {cmd}")
         self.terminal_input.clear()
         self.process.write((cmd + "\n").encode("utf-8"))
 
@@ -148,47 +185,36 @@ class IntegratedTerminal(QWidget):
             target = parts[1] if len(parts) > 1 else os.path.expanduser("~")
             try:
                 os.chdir(target)
-                self.terminal_output.appendPlainText(f"Changed directory to {os.getcwd()}")
+                self.sink.write(f"Changed directory to {os.getcwd()}")
             except Exception as e:
-                self.terminal_output.appendPlainText(f"cd {e}")
+                self.sink.write(f"cd {e}")
             self.terminal_input.clear()
             return
 
-        # your existing subprocess.run code
-        shell = self.config.get("default_shell", "cmd")
-        if shell == "cmd":
-            shell_cmd = ["cmd.exe", "/C", command]
-        # … other shells …
-        completed = subprocess.run(shell_cmd, capture_output=True, text=True)
-        if completed.stdout:
-            self.terminal_output.appendPlainText(completed.stdout)
-        if completed.stderr:
-            self.terminal_output.appendPlainText(f"[stderr] {completed.stderr}")
-        self.terminal_output.appendPlainText(f"--- Script exited with code {completed.returncode} ---")
+        # run in the background; output streams in through connect_job_output
+        self.sink.write(f">>> {command}")
+        self.jobs.submit(shell_job(self.jobs.unique_name(parts[0]), command, self.shell_type, cwd=os.getcwd()))
         self.terminal_input.clear()
 
     def handle_stdout(self):
         if self.process:
-            data = self.process.readAllStandardOutput()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_output.appendPlainText(text.rstrip())
-            self.terminal_output.moveCursor(QTextCursor.End)
+            self.sink.feed(bytes(self.process.readAllStandardOutput()), self.process)
 
     def handle_stderr(self):
         if self.process:
-            data = self.process.readAllStandardError()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_output.appendPlainText(f"[stderr] {text.rstrip()}")
-            self.terminal_output.moveCursor(QTextCursor.End)
+            self.sink.feed(bytes(self.process.readAllStandardError()), (self.process, "err"), "[stderr] ")
 
     def clear_output(self):
-        self.terminal_output.clear()
+        self.sink.clear()
 
     def kill_process(self):
+        if self.jobs.active():
+            self.jobs.cancel_all()
+            self.set_status("Killed")
         if self.process and self.process.state() != QProcess.NotRunning:
             self.process.kill()
             self.set_status("Killed")
-            self.terminal_output.appendPlainText("[Process killed]")
+            self.sink.write("[Process killed]")
 
     def set_status(self, status):
         if hasattr(self, "status_label") and self.status_label:
@@ -216,7 +242,7 @@ class IntegratedTerminal(QWidget):
         elif ext == ".ps1":
             cmd = f'powershell -ExecutionPolicy ByPass -File "{file_path}"'
         else:
-            self.terminal_output.appendPlainText("[Unsupported script type]")
+            self.sink.write("[Unsupported script type]")
             return
         self.terminal_input.setText(cmd)
         self.run_command()
@@ -271,7 +297,11 @@ class Terminal(QWidget):
 
         self.scripts_folder = self.config.get("script_directory", "scripts")
         self.last_script    = self.config.get("last_script", "")
+        self.jobs = JobRunner(max_parallel=self.config.get("max_parallel_jobs", 2), parent=self)
         self.initUI()
+        # every process writing into this pane (the manager's cmd shell, default commands, jobs) goes through here
+        self.sink = OutputSink(view=self.terminal_output, name="terminal", parent=self)
+        connect_job_output(self.jobs, self.sink)
         self.refresh_scripts_list()
 
     def initUI(self):
@@ -326,6 +356,14 @@ class Terminal(QWidget):
         btn_clear.clicked.connect(self.clear_output)
         top_bar.addWidget(btn_clear)
 
+        btn_stop = QPushButton("Stop")
+        btn_stop.clicked.connect(self.stop_jobs)
+        top_bar.addWidget(btn_stop)
+
+        btn_history = QPushButton("History")
+        btn_history.clicked.connect(self.open_scrollback)
+        top_bar.addWidget(btn_history)
+
         top_bar.addStretch()
         layout.addLayout(top_bar)
 
@@ -358,7 +396,7 @@ class Terminal(QWidget):
             )
             if completed.returncode == 0:
                 version = completed.stdout.strip() or completed.stderr.strip()
-                self.terminal_output.appendPlainText(f"[Interpreter connected: {interp_path} ({version})]")
+                self.sink.write(f"[Interpreter connected: {interp_path} ({version})]")
                 # Check CONDA_PREFIX
                 conda_check = subprocess.run(
                     [interp_path, "-c", "import os; print(os.environ.get('CONDA_PREFIX', 'Conda NOT active'))"],
@@ -368,16 +406,16 @@ class Terminal(QWidget):
                     timeout=5
                 )
                 conda_status = conda_check.stdout.strip() or conda_check.stderr.strip()
-                self.terminal_output.appendPlainText(f"[Conda status: {conda_status}]")
+                self.sink.write(f"[Conda status: {conda_status}]")
             else:
-                self.terminal_output.appendPlainText(f"[Interpreter set to: {interp_path} but failed to run]")
+                self.sink.write(f"[Interpreter set to: {interp_path} but failed to run]")
         except Exception as e:
-            self.terminal_output.appendPlainText(f"[Interpreter set to: {interp_path} but error: {e}]")
+            self.sink.write(f"[Interpreter set to: {interp_path} but error: {e}]")
 
     def change_shell(self, shell_type):
         self.config["default_shell"] = shell_type
         save_config(self.config)
-        self.terminal_output.appendPlainText(f"[Shell set to: {shell_type}]")
+        self.sink.write(f"[Shell set to: {shell_type}]")
 
     def open_and_run_script(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -403,7 +441,7 @@ class Terminal(QWidget):
         script_dir = os.path.dirname(full_path)
 
         if not os.path.exists(full_path):
-            self.terminal_output.appendPlainText(f"[Script not found: {full_path}]")
+            self.sink.write(f"[Script not found: {full_path}]")
             return
 
         # Always cd into the script’s directory first
@@ -432,34 +470,23 @@ class Terminal(QWidget):
                 # 2a) Activate base if needed, then run
                 activate_bat = r"C:/Users/iceke/anaconda3/condabin/activate.bat"
                 if not os.path.exists(activate_bat):
-                    self.terminal_output.appendPlainText("[Conda activate.bat not found!]")
+                    self.sink.write("[Conda activate.bat not found!]")
                     return
                 cmd = f'call "{activate_bat}" base && python "{full_path}"'
-                self.terminal_output.appendPlainText(f"[Running under conda base: {cmd}]")
+                self.sink.write(f"[Running under conda base: {cmd}]")
             else:
                 # 2b) Already active, just launch with interpreter
                 cmd = f'{interpreter} "{full_path}"'
-                self.terminal_output.appendPlainText(f">>> {cmd}")
+                self.sink.write(f">>> {cmd}")
 
             # 3) Send it into the live shell
             self.process.write((cmd + "\n").encode("utf-8"))
 
         else:
-            # Fallback: no persistent shell, run via subprocess
-            self.terminal_output.appendPlainText(f">>> Running via subprocess in {script_dir}")
-            try:
-                completed = subprocess.run(
-                    [interpreter, full_path],
-                    capture_output=True, text=True,
-                    cwd=script_dir
-                )
-                if completed.stdout:
-                    self.terminal_output.appendPlainText(completed.stdout)
-                if completed.stderr:
-                    self.terminal_output.appendPlainText(f"[stderr] {completed.stderr}")
-                self.terminal_output.appendPlainText(f"--- Exit code {completed.returncode} ---")
-            except Exception as e:
-                self.terminal_output.appendPlainText(f"[Error running script: {e}]")
+            # Fallback: no persistent shell, run as a background job
+            self.sink.write(f">>> Running in background in {script_dir}")
+            name = self.jobs.unique_name(os.path.basename(full_path))
+            self.jobs.submit(python_job(name, full_path, interpreter))
 
 
     def refresh_scripts_list(self):
@@ -478,7 +505,7 @@ class Terminal(QWidget):
     def run_selected_script(self):
         script_name = self.scripts_combo.currentText()
         if not script_name:
-            self.terminal_output.appendPlainText("[No script selected]")
+            self.sink.write("[No script selected]")
             return
         self.last_script = script_name
         self.config["last_script"] = script_name
@@ -486,39 +513,65 @@ class Terminal(QWidget):
         self.run_script(script_name)
 
     def run_chain(self):
+        """
+        Run config["script_chain"] in the background. Entries are script names, or
+        {"script": ..., "name": ..., "deps": [names], "timeout": s, "require_success": bool}.
+        chain_mode "sequential" (default) runs them one after another, as before;
+        "parallel" runs them as a dependency graph, max_parallel_jobs at a time.
+        """
         chain = self.config.get("script_chain", [])
         if not chain:
-            self.terminal_output.appendPlainText("[No script_chain defined in config]")
+            self.sink.write("[No script_chain defined in config]")
+            return
+        sequential = self.config.get("chain_mode", "sequential") != "parallel"
+        interpreter = self.config.get("interpreter", sys.executable)
+        jobs = []
+        for entry in chain:
+            if isinstance(entry, str):
+                entry = {"script": entry}
+            script_path = os.path.join(self.scripts_folder, entry["script"])
+            if not os.path.exists(script_path):
+                self.sink.write(f"[Script not found: {script_path}]")
+                return
+            jobs.append(python_job(
+                entry.get("name", entry["script"]), script_path, interpreter,
+                deps=entry.get("deps"), timeout=entry.get("timeout"),
+                # a sequential chain keeps going past a failing script, as it always has
+                require_success=entry.get("require_success", not sequential)))
+        try:
+            self.jobs.run_chain(jobs, sequential=sequential)
+        except ValueError as e:
+            self.sink.write(f"[Chain not started: {e}]")
             return
-        for script in chain:
-            self.run_script(script)
+        mode = "one after another" if sequential else f"up to {self.jobs.max_parallel} at a time"
+        self.sink.write(f">>> Running chain of {len(jobs)} scripts, {mode}")
 
     def run_script(self, script_name):
         interpreter = self.config.get("interpreter", sys.executable)
         script_path = os.path.join(self.scripts_folder, script_name)
         if not os.path.exists(script_path):
-            self.terminal_output.appendPlainText(f"[Script not found: {script_path}]")
+            self.sink.write(f"[Script not found: {script_path}]")
             return
 
-        self.terminal_output.appendPlainText(f">>> Running: {interpreter} {script_path}")
-        try:
-            completed = subprocess.run(
-                [interpreter, script_path],
-                capture_output=True,
-                text=True,
-                shell=False
-            )
-            if completed.stdout:
-                self.terminal_output.appendPlainText(completed.stdout)
-            if completed.stderr:
-                self.terminal_output.appendPlainText(f"[stderr] {completed.stderr}")
-            self.terminal_output.appendPlainText(f"--- Script exited with code {completed.returncode} ---")
-        except Exception as e:
-            self.terminal_output.appendPlainText(f"[Error running script: {e}]")
+        self.sink.write(f">>> Running: {interpreter} {script_path}")
+        self.jobs.submit(python_job(self.jobs.unique_name(script_name), script_path, interpreter))
+
+    def stop_jobs(self):
+        """Kill running scripts/commands and drop queued ones."""
+        if self.jobs.cancel_all():
+            self.sink.write("[Stopped running jobs]")
+
+    def open_scrollback(self):
+        """Open the full output history (the pane keeps only the last lines)."""
+        path = self.sink.scrollback_file()
+        if not path or not os.path.exists(path):
+            self.sink.write("[No scrollback yet]")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(path))
 
     def clear_output(self):
         """Clears the terminal output pane."""
-        self.terminal_output.clear()
+        self.sink.clear()
 
     def run_command(self):
         command = self.terminal_input.text().strip()
@@ -531,24 +584,16 @@ class Terminal(QWidget):
             target = parts[1] if len(parts) > 1 else os.path.expanduser("~")
             try:
                 os.chdir(os.path.expandvars(target))
-                self.terminal_output.appendPlainText(f"Changed directory to {os.getcwd()}")
+                self.sink.write(f"Changed directory to {os.getcwd()}")
             except Exception as e:
-                self.terminal_output.appendPlainText(f"cd: {e}")
+                self.sink.write(f"cd: {e}")
             self.terminal_input.clear()
             return
 
-        # 2) All other commands still go out to subprocess.run()
-        completed = subprocess.run(
-            command, shell=True,
-            cwd=os.getcwd(),       
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        if completed.stdout:
-            self.terminal_output.appendPlainText(completed.stdout)
-        if completed.stderr:
-            self.terminal_output.appendPlainText(f"[stderr] {completed.stderr}")
+        # 2) All other commands run in the background through the configured shell
+        shell = self.config.get("default_shell", "cmd" if os.name == "nt" else "bash")
+        self.sink.write(f">>> {command}")
+        self.jobs.submit(shell_job(self.jobs.unique_name(parts[0]), command, shell, cwd=os.getcwd()))
         self.terminal_input.clear()
 
 class PersistentTerminal(QWidget):
@@ -558,6 +603,7 @@ class PersistentTerminal(QWidget):
         self.shell = shell
         self.process = None
         self.initUI()
+        self.sink = OutputSink(view=self.terminal_output, name="persistent_terminal", parent=self)
         self.start_shell(self.shell)
 
     def initUI(self):
@@ -611,7 +657,7 @@ class PersistentTerminal(QWidget):
         else:
             self.process.setProgram("powershell.exe")
         self.process.start()
-        self.terminal_output.append(f"[Started {shell_type} in {project_dir}]")
+        self.sink.write(f"[Started {shell_type} in {project_dir}]")
 
     def change_shell(self, shell_type):
         self.shell = shell_type
@@ -621,22 +667,18 @@ class PersistentTerminal(QWidget):
         command = self.terminal_input.text().strip()
         if not command or not self.process or self.process.state() != QProcess.Running:
             return
-        self.terminal_output.append(f">>> {command}")
+        self.sink.write(f">>> {command}")
         self.terminal_input.clear()
         # Write command to the shell process
         self.process.write((command + "\n").encode("utf-8"))
 
     def handle_stdout(self):
         if self.process:
-            data = self.process.readAllStandardOutput()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_output.append(text.rstrip())
+            self.sink.feed(bytes(self.process.readAllStandardOutput()), self.process)
 
     def handle_stderr(self):
         if self.process:
-            data = self.process.readAllStandardError()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_output.append(f"[stderr] {text.rstrip()}")
+            self.sink.feed(bytes(self.process.readAllStandardError()), (self.process, "err"), "[stderr] ")
 
 class CortanaManager(QWidget):
     def __init__(self):
@@ -646,9 +688,14 @@ class CortanaManager(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
         self.voice_process = None
+        # voice output reaches the manager log a frame at a time; an on_text sink passes every line on
+        self.voice_sink = OutputSink(on_text=self._log_voice_lines, name="voice", fps=10, parent=self)
         # notifier removed
-        self.manager_log = []
+        # ring buffer in memory, batched writes to SQLite; flushed when the app quits
+        self.manager_log = ManagerLog(MANAGER_LOG_PATH)
+        QApplication.instance().aboutToQuit.connect(self.manager_log.close)
         self.terminal_process = None  # For terminal tab
+        self.startup = None  # StartupScheduler for default_commands, made on first use
 
         # --- Persistent QProcess Terminal Tab ---
         self.persistent_terminal = PersistentTerminal(shell="cmd", parent=self)
@@ -668,9 +715,13 @@ class CortanaManager(QWidget):
 
         self.initUI()
 
-        self.raphael_log_timer = QTimer(self)
-        self.raphael_log_timer.timeout.connect(self.refresh_raphael_logs)
-        self.raphael_log_timer.start(2000)  # Refresh every 2 seconds
+        # follow Delta_log_cache.txt: only appended bytes are read, on file-change notifications
+        self.raphael_log_follower = LogFollower("Delta_log_cache.txt", parent=self)
+        self.raphael_log_follower.appended.connect(self.raphael_log_view.appendPlainText)
+        self.raphael_log_follower.reset.connect(self.raphael_log_view.clear)
+        self.raphael_log_follower.missing.connect(
+            lambda: self.raphael_log_view.setPlainText("<No Delta logs found>"))
+        self.raphael_log_follower.start()
 
         # notifier timers removed
 
@@ -709,9 +760,8 @@ class CortanaManager(QWidget):
         # resource notifier removed from manager controls
         # btn_start_notifier / btn_stop_notifier removed
 
-        # Manager Logs pane
-        self.manager_log_view = QTextEdit()
-        self.manager_log_view.setReadOnly(True)
+        # Manager Logs pane (virtualized: filter/search runs against the on-disk log)
+        self.manager_log_view = ManagerLogView(self.manager_log)
         mgr_layout.addWidget(self.manager_log_view)
 
         main_tabs.addTab(mgr_tab, "Manager")
@@ -726,8 +776,9 @@ class CortanaManager(QWidget):
         # Raphael Logs
         raphael_tab = QWidget()
         r_layout = QVBoxLayout(raphael_tab)
-        self.raphael_log_view = QTextEdit()
+        self.raphael_log_view = QPlainTextEdit()
         self.raphael_log_view.setReadOnly(True)
+        self.raphael_log_view.setMaximumBlockCount(5000)  # oldest lines drop off the top
         r_layout.addWidget(self.raphael_log_view)
         btn_refresh_raphael = QPushButton("Refresh Delta Logs")
         btn_refresh_raphael.clicked.connect(lambda: self.refresh_raphael_logs(True))
@@ -795,7 +846,7 @@ class CortanaManager(QWidget):
             QTabWidget::pane { background: transparent; border: none; }
             QTabBar::tab { background: rgba(0,0,0,120); color: white; padding: 8px; border-top-left-radius: 10px; border-top-right-radius: 10px; }
             QTabBar::tab:selected { background: rgba(0,120,215,255); }
-            QTextEdit, QPlainTextEdit { background-color: rgba(0,0,0,120); color: white; border-radius: 10px; }
+            QTextEdit, QPlainTextEdit, QListView { background-color: rgba(0,0,0,120); color: white; border-radius: 10px; }
             QPushButton { background-color: #0078D7; color: white; border-radius: 10px; padding: 6px; }
             QPushButton:hover { background-color: #0a84ff; }
             QComboBox { background-color: rgba(0,0,0,120); color: white; border-radius: 10px; padding: 4px; }
@@ -841,14 +892,10 @@ class CortanaManager(QWidget):
         painter.setPen(QColor(0, 120, 215, 255))
         painter.drawRoundedRect(rect, 15, 15)
 
-    def append_manager_log(self, message, color="white"):
-        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = f"[{now}] {message}"
-        self.manager_log.append(entry)
-        # Use HTML for color styling
-        html_entry = f'<span style="color:{color}">{entry}</span>'
-        self.manager_log_view.append(html_entry)
-        print(entry)
+    def append_manager_log(self, message, color="white", source="manager"):
+        # color keeps the old call sites working: red entries are errors, orange/yellow warnings
+        level = {"red": "error", "orange": "warning", "yellow": "warning"}.get(color, "info")
+        self.manager_log.append(message, source=source, level=level)
 
     def start_voice_activation(self):
         path = os.path.abspath("voice_activation.py")
@@ -877,17 +924,15 @@ class CortanaManager(QWidget):
 
     def handle_voice_stdout(self):
         if self.voice_process:
-            data = self.voice_process.readAllStandardOutput()
-            text = bytes(data).decode(errors="replace")
-            for line in text.splitlines():
-                self.append_manager_log(f"[Voice][stdout] {line}", "white")
+            self.voice_sink.feed(bytes(self.voice_process.readAllStandardOutput()), "out", "[Voice][stdout] ")
 
     def handle_voice_stderr(self):
         if self.voice_process:
-            data = self.voice_process.readAllStandardError()
-            text = bytes(data).decode(errors="replace")
-            for line in text.splitlines():
-                self.append_manager_log(f"[Voice][stderr] {line}", "red")
+            self.voice_sink.feed(bytes(self.voice_process.readAllStandardError()), "err", "[Voice][stderr] ")
+
+    def _log_voice_lines(self, text):
+        for line in text.split("\n"):
+            self.append_manager_log(line, "red" if line.startswith("[Voice][stderr]") else "white", source="voice")
 
     def start_voice_activation(self):
         """CD into _internal then run voice_activation.py in the persistent shell."""
@@ -946,10 +991,10 @@ class CortanaManager(QWidget):
             QMessageBox.warning(self, "Error", str(e))
 
     def refresh_raphael_logs(self, log_user_action=False):
-        path = os.path.abspath("Delta_log_cache.txt")
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                self.raphael_log_view.setPlainText(f.read())
+        # the follower keeps the view current; this reloads the tail from scratch
+        self.raphael_log_view.clear()
+        self.raphael_log_follower.reload()
+        if self.raphael_log_follower.tail.exists():
             if log_user_action:
                 self.append_manager_log("Refreshed Delta logs")
         else:
@@ -1030,16 +1075,12 @@ class CortanaManager(QWidget):
 
     def handle_cmd_stdout(self):
         if self.cmd_process:
-            data = self.cmd_process.readAllStandardOutput()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_tab.terminal_output.appendPlainText(text.rstrip())
+            self.terminal_tab.sink.feed(bytes(self.cmd_process.readAllStandardOutput()), self.cmd_process)
 
     def handle_cmd_stderr(self):
         if self.cmd_process:
-            data = self.cmd_process.readAllStandardError()
-            text = bytes(data).decode(errors="replace")
-            for line in text.splitlines():
-                self.terminal_tab.terminal_output.appendPlainText(f"[stderr] {line}")
+            self.terminal_tab.sink.feed(bytes(self.cmd_process.readAllStandardError()),
+                                        (self.cmd_process, "err"), "[stderr] ")
 
     def run_terminal_command(self):
         command = self.terminal_input.text().strip()
@@ -1049,27 +1090,27 @@ class CortanaManager(QWidget):
         if command.startswith("!M"):
             # Manager command
             mgr_cmd = command[2:].strip()
-            self.terminal_tab.terminal_output.appendPlainText(f">>> !M {mgr_cmd}")
+            self.terminal_tab.sink.write(f">>> !M {mgr_cmd}")
             self.terminal_input.clear()
             self.handle_manager_command(mgr_cmd)
             return
 
         # Normal shell command
-        self.terminal_tab.terminal_output.appendPlainText(f">>> {command}")
+        self.terminal_tab.sink.write(f">>> {command}")
         self.terminal_input.clear()
         if self.cmd_process and self.cmd_process.state() == QProcess.Running:
             try:
                 self.cmd_process.write((command + "\n").encode("utf-8"))
             except Exception as e:
-                self.terminal_tab.terminal_output.appendPlainText(f"[Error writing to cmd.exe: {e}]")
+                self.terminal_tab.sink.write(f"[Error writing to cmd.exe: {e}]")
         else:
-            self.terminal_tab.terminal_output.appendPlainText("[cmd.exe process not running. Restarting shell...]")
+            self.terminal_tab.sink.write("[cmd.exe process not running. Restarting shell...]")
             self.cmd_process.start()
 
     def handle_manager_command(self, command):
         cmd = command.lower()
         if cmd == "help":
-            self.terminal_tab.terminal_output.appendPlainText(
+            self.terminal_tab.sink.write(
                 "Manager commands:\n"
                 "  help   - Show this help message\n"
                 "  status - Show system status\n"
@@ -1080,88 +1121,59 @@ class CortanaManager(QWidget):
             status_lines.append(f"Voice process: {'Running' if self.voice_process and self.voice_process.state() == QProcess.Running else 'Stopped'}")
             # notifier status removed
             status_lines.append(f"Terminal (cmd.exe): {'Running' if self.cmd_process and self.cmd_process.state() == QProcess.Running else 'Stopped'}")
-            self.terminal_tab.terminal_output.appendPlainText("System status:\n" + "\n".join(status_lines))
+            self.terminal_tab.sink.write("System status:\n" + "\n".join(status_lines))
         elif cmd == "reload":
             self.load_commands_json()
             self.load_default_commands_on_startup()
-            self.terminal_tab.terminal_output.appendPlainText("Configuration reloaded.")
+            self.terminal_tab.sink.write("Configuration reloaded.")
         else:
-            self.terminal_tab.terminal_output.appendPlainText(f"Unknown manager command: {command}")
+            self.terminal_tab.sink.write(f"Unknown manager command: {command}")
 
     def load_default_commands_on_startup(self):
         config_path = os.path.join("config", "terminal_config.json")
         if not os.path.exists(config_path):
-            self.terminal_tab.terminal_output.appendPlainText("[No terminal_config.json found. Skipping default commands.]")
+            self.terminal_tab.sink.write("[No terminal_config.json found. Skipping default commands.]")
             return
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 config = json.load(f)
             commands = config.get("default_commands", [])
             if not commands:
-                self.terminal_tab.terminal_output.appendPlainText("[No default_commands in terminal_config.json]")
+                self.terminal_tab.sink.write("[No default_commands in terminal_config.json]")
                 return
-            self.run_default_commands(commands)
+            self.run_default_commands(commands, config.get("default_commands_mode", "sequential"),
+                                      config.get("startup_max_parallel", 4))
         except Exception as e:
-            self.terminal_tab.terminal_output.appendPlainText(f"[Error loading terminal_config.json: {e}]")
-
-    def run_default_commands(self, commands):
-        self._default_cmd_queue = list(commands)
-        self._run_next_default_command()
+            self.terminal_tab.sink.write(f"[Error loading terminal_config.json: {e}]")
+
+    def run_default_commands(self, commands, mode="sequential", max_parallel=4):
+        # default commands run as a DAG: deps, parallel groups and readiness probes from terminal_config.json
+        sink = self.terminal_tab.sink
+        if self.startup is None:
+            self.startup = StartupScheduler(parent=self)
+            connect_job_output(self.startup.jobs, sink, chain_summary=False)
+            self.startup.jobs.started.connect(
+                lambda name: sink.write(f">>> [{name}] {self.startup.job(name).command_line}"))
+            self.startup.jobs.ready.connect(
+                lambda name, ok, secs: sink.write(f"--- {name} {'ready' if ok else 'NOT ready'} after {secs:.2f} s ---"))
+            self.startup.settled.connect(self._report_startup)
+            QApplication.instance().aboutToQuit.connect(self.startup.shutdown)
+        self.startup.jobs.max_parallel = max(1, int(max_parallel))
+        python = self.terminal_tab.config.get("interpreter", sys.executable)
+        busy = self.startup.start(build_startup_jobs(commands, mode, python))
+        if busy:
+            sink.write(f"[Already running: {', '.join(busy)}]")
+
+    def _report_startup(self, rows, seconds):
+        lines = format_report(rows, seconds)
+        for line in lines:
+            self.terminal_tab.sink.write(line)
+        slow = max(rows, key=lambda r: r[3] if r[3] is not None else r[4], default=None)
+        failed = [r[0] for r in rows if r[1] not in ("done", "ready")]
+        self.append_manager_log(lines[0].strip("- ") + (f", slowest {slow[0]}" if slow else "")
+                                + (f", not ok: {', '.join(failed)}" if failed else ""),
+                                "orange" if failed else "white", source="startup")
 
-    def _run_next_default_command(self):
-        if not hasattr(self, "_default_cmd_queue") or not self._default_cmd_queue:
-            return
-        cmd_entry = self._default_cmd_queue.pop(0)
-        # Support both string and dict for backward compatibility
-        if isinstance(cmd_entry, str):
-            interpreter = "cmd"
-            command = cmd_entry
-        else:
-            interpreter = cmd_entry.get("interpreter", "cmd").lower()
-            command = cmd_entry.get("command", "")
-
-        self.terminal_tab.terminal_output.appendPlainText(f">>> [{interpreter}] {command}")
-        self._default_process = QProcess(self)
-        self._default_process.setProcessChannelMode(QProcess.MergedChannels)
-        # Build args based on interpreter
-        if interpreter == "python":
-            args = [self.terminal_tab.config.get("interpreter", sys.executable), command]
-        elif interpreter == "node":
-            args = ["node", command]
-        elif interpreter == "powershell":
-            args = ["powershell.exe", "-Command", command]
-        elif interpreter == "bash":
-            args = ["bash", "-c", command]
-        elif interpreter == "cmd":
-            args = ["cmd.exe", "/c", command]
-        else:
-            # Fallback: try to run as a shell command
-            args = [interpreter, command]
-
-        self._default_process.setProgram(args[0])
-        self._default_process.setArguments(args[1:])
-        self._default_process.readyReadStandardOutput.connect(self._handle_default_stdout)
-        self._default_process.readyReadStandardError.connect(self._handle_default_stderr)
-        self._default_process.finished.connect(self._handle_default_finished)
-        self._default_process.start()
-
-    def _handle_default_stdout(self):
-        if hasattr(self, "_default_process") and self._default_process:
-            data = self._default_process.readAllStandardOutput()
-            text = bytes(data).decode(errors="replace")
-            self.terminal_tab.terminal_output.appendPlainText(text.rstrip())
-
-    def _handle_default_stderr(self):
-        if hasattr(self, "_default_process") and self._default_process:
-            data = self._default_process.readAllStandardError()
-            text = bytes(data).decode(errors="replace")
-            for line in text.splitlines():
-                self.terminal_tab.terminal_output.appendPlainText(f"[stderr] {line}")
-
-    def _handle_default_finished(self):
-        self.terminal_tab.terminal_output.appendPlainText("--- Process finished ---")
-        self._run_next_default_command()
-        
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -0,0 +1,516 @@
+"""
+job_runner.py
+
+Non-blocking script/command runner for the manager's terminals.
+
+Every job is a QProcess driven by the Qt event loop, so the GUI keeps
+painting while scripts run and their output arrives as it is written:
+
+    • stdout / stderr go through incremental decoders and are emitted a
+      line batch at a time (a partial last line waits for its newline, or
+      for the process to exit)
+    • jobs may name other jobs in `deps`; a job starts once all of them have
+      ended (successfully, unless require_success=False). Independent jobs
+      run side by side, at most `max_parallel` at once; the rest wait in
+      submission order
+    • a dependency that fails, is cancelled or times out skips the jobs
+      that require it
+    • cancel(name) / cancel_all() kill running jobs and drop queued ones;
+      a per-job `timeout` does the same on its own. The kill takes the
+      whole process tree (a shell_job's children too): each job leads its
+      own process group on POSIX, and Windows gets `taskkill /T /F`. Nothing
+      waits for the exit; the job ends when its finished signal arrives
+    • a job with a ReadyProbe (a TCP port that accepts connections, or a
+      line of its output matching a regex) is a service: its dependents
+      start once it is ready, not once it exits, and a ready service no
+      longer counts against max_parallel. A port is still probed after the
+      job exits 0 (launchers such as `start ollama serve` return at once)
+    • every job records queued / started / ready / ended times; finished()
+      carries the exit code and run time, ready() how long a service took,
+      chain_finished() the summary of a group
+
+Usage:
+    jobs = JobRunner(max_parallel=2, parent=self)
+    jobs.output.connect(lambda name, text, is_err: view.appendPlainText(text))
+    jobs.finished.connect(lambda name, state, code, secs: ...)
+    jobs.submit(Job("build", sys.executable, ["build.py"]))
+    jobs.run_chain([Job("a", ...), Job("b", ..., deps=["a"])])
+    jobs.submit(Job("ollama", "ollama", ["serve"], ready=ReadyProbe(port=11434)))
+"""
+
+import os
+import re
+import sys
+import time
+import signal
+import codecs
+import itertools
+
+from PyQt5.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QTcpSocket
+
+# job states
+QUEUED, RUNNING, DONE, FAILED, CANCELLED, SKIPPED = "queued", "running", "done", "failed", "cancelled", "skipped"
+ENDED = (DONE, FAILED, CANCELLED, SKIPPED)
+READY = "ready"                             # Job.readiness: None while probing, READY or FAILED
+KILL_GRACE_MS = 3000                        # a killed job ends after this even if its exit never arrives
+
+
+class ReadyProbe:
+    def __init__(self, port: int = None, host: str = "127.0.0.1", log: str = None, timeout: float = 60.0,
+                 interval: float = 0.25):
+        """
+        :param port:     ready once host:port accepts a TCP connection
+        :param host:     host to probe the port on
+        :param log:      ready once a line of the job's output matches this regex
+        :param timeout:  seconds after the job starts before it counts as not ready
+        :param interval: seconds between port attempts
+        """
+        if port is None and not log:
+            raise ValueError("a ReadyProbe needs a port or a log pattern")
+        self.port = int(port) if port is not None else None
+        self.host = host
+        self.pattern = re.compile(log, re.MULTILINE) if log else None
+        self.timeout = timeout
+        self.interval = interval
+
+    @classmethod
+    def from_config(cls, spec):
+        """None, a port number, a regex string, or {"port": 11434, "host": ..., "log": ..., "timeout": ...}."""
+        if spec is None or spec == {}:
+            return None
+        if isinstance(spec, int):
+            return cls(port=spec)
+        if isinstance(spec, str):
+            return cls(log=spec)
+        return cls(port=spec.get("port"), host=spec.get("host", "127.0.0.1"), log=spec.get("log"),
+                   timeout=spec.get("timeout", 60.0), interval=spec.get("interval", 0.25))
+
+    def describe(self) -> str:
+        parts = []
+        if self.port is not None:
+            parts.append(f"port {self.host}:{self.port}")
+        if self.pattern is not None:
+            parts.append(f"log /{self.pattern.pattern}/")
+        return " or ".join(parts)
+
+
+class Job:
+    def __init__(self, name: str, program: str, args=None, cwd: str = None, deps=None, timeout: float = None,
+                 require_success: bool = True, env: dict = None, ready: ReadyProbe = None):
+        """
+        :param name:            unique among the runner's live jobs; used in deps and signals
+        :param program:         executable to start (no shell involved; see shell_job)
+        :param args:            argument list
+        :param cwd:             working directory (default: the manager's)
+        :param deps:            names of jobs that must end before this one starts
+        :param timeout:         seconds before the job is killed (None = no limit)
+        :param require_success: when False, a failed dependency does not skip this job
+        :param env:             extra environment variables
+        :param ready:           ReadyProbe; dependents then wait for readiness instead of the exit
+        """
+        self.name = name
+        self.program = program
+        self.args = list(args or [])
+        self.cwd = cwd
+        self.deps = list(deps or [])
+        self.timeout = timeout
+        self.require_success = require_success
+        self.env = dict(env or {})
+        self.ready = ready
+        self.readiness = None
+        self.state = QUEUED
+        self.exit_code = None
+        self.error = ""
+        self.group = None
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.ready_at = None
+        self.ended_at = None
+        self.process = None
+        self._decoders = None
+        self._partial = ["", ""]
+
+    @property
+    def command_line(self) -> str:
+        return " ".join([self.program] + self.args)
+
+    @property
+    def seconds(self) -> float:
+        """Run time so far (or in total, once ended)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.ended_at or time.perf_counter()) - self.started_at
+
+    @property
+    def waited(self) -> float:
+        return ((self.started_at or self.ended_at or time.perf_counter()) - self.queued_at)
+
+    @property
+    def ready_after(self):
+        """Seconds from start to ready, or None."""
+        return None if self.ready_at is None else self.ready_at - self.started_at
+
+
+def shell_job(name: str, command: str, shell: str = None, **kwargs) -> Job:
+    """A Job that runs `command` through a shell ("cmd", "powershell", "bash"; default per platform).
+    Cancelling it kills the shell and everything the command started."""
+    shell = (shell or ("cmd" if os.name == "nt" else "sh")).lower()
+    if shell == "cmd":
+        return Job(name, "cmd.exe", ["/C", command], **kwargs)
+    if shell.startswith("powershell"):
+        return Job(name, "powershell.exe", ["-NoProfile", "-Command", command], **kwargs)
+    return Job(name, "bash" if shell == "bash" else "/bin/sh", ["-c", command], **kwargs)
+
+
+def python_job(name: str, script_path: str, interpreter: str = None, **kwargs) -> Job:
+    """A Job that runs a Python script unbuffered, in the script's folder unless cwd is given."""
+    script_path = os.path.abspath(script_path)
+    kwargs.setdefault("cwd", os.path.dirname(script_path))
+    kwargs.setdefault("env", {}).setdefault("PYTHONUNBUFFERED", "1")
+    return Job(name, interpreter or sys.executable, [script_path], **kwargs)
+
+
+class _JobProcess(QProcess):
+    """QProcess whose child leads a process group of its own on POSIX, so kill_tree() reaches its children."""
+    def setupChildProcess(self):
+        # runs in the forked child, just before exec
+        if os.name != "nt":
+            os.setpgid(0, 0)
+
+
+def kill_tree(proc: QProcess):
+    """Kill a running QProcess and the processes it started, without waiting for the exit."""
+    pid = int(proc.processId())
+    if pid > 0:
+        if os.name == "nt":
+            # /T walks the tree from the parent, so the parent must still be alive: no proc.kill() first
+            if QProcess.startDetached("taskkill", ["/T", "/F", "/PID", str(pid)]):
+                return
+        else:
+            try:
+                if os.getpgid(pid) == pid:      # never signal the manager's own group
+                    os.killpg(pid, signal.SIGKILL)
+                    return
+            except OSError:
+                pass
+    proc.kill()
+
+
+class JobRunner(QObject):
+    started = pyqtSignal(str)                   # job name
+    output = pyqtSignal(str, str, bool)         # job name, text (whole lines), from stderr
+    finished = pyqtSignal(str, str, int, float) # job name, state, exit code (-1: not run / killed), seconds
+    chain_finished = pyqtSignal(str, dict)      # group id, {job name: (state, exit code, seconds)}
+    ready = pyqtSignal(str, bool, float)        # job name, ready (False: probe gave up), seconds since start
+
+    def __init__(self, max_parallel: int = 2, parent=None):
+        """
+        :param max_parallel: jobs allowed to run at the same time
+        :param parent:       QObject owner (processes are children of the runner)
+        """
+        super().__init__(parent)
+        self.max_parallel = max(1, max_parallel)
+        self.jobs = {}                          # name -> Job, until it ends and is collected
+        self.history = []                       # ended jobs, most recent last
+        self._order = itertools.count()
+        self._seq = {}
+        self._groups = {}                       # group id -> [names]
+        self._group_ids = itertools.count(1)
+
+    # ---------- submitting ----------
+    def submit(self, job: Job) -> Job:
+        if job.name in self.jobs:
+            raise ValueError(f"a job named {job.name!r} is already queued or running")
+        job.queued_at = time.perf_counter()
+        self.jobs[job.name] = job
+        self._seq[job.name] = next(self._order)
+        QTimer.singleShot(0, self._schedule)
+        return job
+
+    def unique_name(self, base: str) -> str:
+        """`base`, or `base#2`, `base#3`... if a job by that name is still queued or running."""
+        name, n = base, 1
+        while name in self.jobs:
+            n += 1
+            name = f"{base}#{n}"
+        return name
+
+    def run_chain(self, jobs, sequential: bool = False) -> str:
+        """Submit a group of jobs; returns its id (see chain_finished).
+
+        sequential=True makes each job wait for the previous one, keeping any deps
+        it already has. Otherwise only the jobs' own deps order them. Raises
+        ValueError for unknown deps or a dependency cycle, before anything starts."""
+        jobs = list(jobs)
+        if sequential:
+            for before, job in zip(jobs, jobs[1:]):
+                if before.name not in job.deps:
+                    job.deps.append(before.name)
+        self._check_graph(jobs)
+        group = f"chain-{next(self._group_ids)}"
+        self._groups[group] = [j.name for j in jobs]
+        for job in jobs:
+            job.group = group
+            self.submit(job)
+        return group
+
+    def _check_graph(self, jobs):
+        names = {j.name for j in jobs}
+        if len(names) != len(jobs):
+            raise ValueError("job names in a chain must be unique")
+        busy = names & set(self.jobs)
+        if busy:
+            raise ValueError(f"jobs already queued or running: {sorted(busy)}")
+        known = names | set(self.jobs)
+        for job in jobs:
+            missing = [d for d in job.deps if d not in known]
+            if missing:
+                raise ValueError(f"{job.name}: unknown dependencies {missing}")
+        deps = {j.name: [d for d in j.deps if d in names] for j in jobs}
+        visiting, visited = set(), set()
+
+        def visit(name, path):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError("dependency cycle: " + " -> ".join(path + [name]))
+            visiting.add(name)
+            for d in deps[name]:
+                visit(d, path + [name])
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in deps:
+            visit(name, [])
+
+    # ---------- scheduling ----------
+    def running(self) -> list:
+        return [j for j in self.jobs.values() if j.state == RUNNING]
+
+    def active(self) -> int:
+        return len(self.jobs)
+
+    def _busy(self) -> int:
+        # ready services idle in the background; they do not hold a slot
+        return sum(1 for j in self.jobs.values() if j.state == RUNNING and j.readiness != READY)
+
+    def _dep_state(self, job: Job):
+        """'ready', 'wait' or 'skip' for a queued job."""
+        for name in job.deps:
+            dep = self.jobs.get(name) or self._ended(name)
+            if dep is None:
+                continue                # ended long ago and out of history
+            if dep.ready is not None:
+                if dep.readiness is None:
+                    return "wait"
+                if dep.readiness != READY and job.require_success:
+                    return "skip"
+                continue
+            if dep.state not in ENDED:
+                return "wait"
+            if dep.state != DONE and job.require_success:
+                return "skip"
+        return "ready"
+
+    def _ended(self, name: str):
+        for job in reversed(self.history):
+            if job.name == name:
+                return job
+        return None
+
+    def _schedule(self):
+        changed = True
+        while changed:
+            changed = False
+            queued = sorted((j for j in self.jobs.values() if j.state == QUEUED), key=lambda j: self._seq[j.name])
+            for job in queued:
+                state = self._dep_state(job)
+                if state == "skip":
+                    job.error = "dependency failed"
+                    self._end(job, SKIPPED, -1)
+                    changed = True
+                elif state == "ready" and self._busy() < self.max_parallel:
+                    self._start(job)
+
+    def _start(self, job: Job):
+        proc = _JobProcess(self)
+        env = QProcessEnvironment.systemEnvironment()
+        for key, value in job.env.items():
+            env.insert(key, str(value))
+        proc.setProcessEnvironment(env)
+        proc.setWorkingDirectory(job.cwd or os.getcwd())
+        proc.readyReadStandardOutput.connect(lambda j=job: self._read(j, False))
+        proc.readyReadStandardError.connect(lambda j=job: self._read(j, True))
+        proc.finished.connect(lambda code, status, j=job: self._on_finished(j, code, status))
+        proc.errorOccurred.connect(lambda err, j=job: self._on_error(j, err))
+        job.process = proc
+        job._decoders = [codecs.getincrementaldecoder("utf-8")(errors="replace") for _ in range(2)]
+        job.state = RUNNING
+        job.started_at = time.perf_counter()
+        if job.timeout:
+            QTimer.singleShot(int(job.timeout * 1000), lambda j=job: self._on_timeout(j))
+        proc.start(job.program, job.args)
+        self.started.emit(job.name)
+        if job.ready is not None:
+            QTimer.singleShot(int(job.ready.timeout * 1000), lambda j=job: self._set_ready(j, False))
+            if job.ready.port is not None:
+                self._probe_port(job)
+
+    # ---------- readiness ----------
+    def _probe_port(self, job: Job):
+        if job.readiness is not None or (job.state != RUNNING and job.state != DONE):
+            return
+        sock = QTcpSocket(self)
+
+        def connected():
+            sock.abort()
+            sock.deleteLater()
+            self._set_ready(job, True)
+
+        def refused(_err):
+            sock.deleteLater()
+            QTimer.singleShot(int(job.ready.interval * 1000), lambda: self._probe_port(job))
+
+        sock.connected.connect(connected)
+        sock.errorOccurred.connect(refused)
+        sock.connectToHost(job.ready.host, job.ready.port)
+
+    def _set_ready(self, job: Job, ok: bool):
+        if job.readiness is not None:
+            return
+        job.readiness = READY if ok else FAILED
+        if ok:
+            job.ready_at = time.perf_counter()
+        else:
+            job.error = job.error or f"not ready ({job.ready.describe()})"
+        self.ready.emit(job.name, ok, (job.ready_at or time.perf_counter()) - (job.started_at or job.queued_at))
+        QTimer.singleShot(0, self._schedule)
+
+    # ---------- process events ----------
+    def _read(self, job: Job, is_err: bool):
+        proc = job.process
+        if proc is None:
+            return
+        data = bytes(proc.readAllStandardError() if is_err else proc.readAllStandardOutput())
+        text = job._partial[is_err] + job._decoders[is_err].decode(data)
+        cut = text.rfind("\n")
+        if cut < 0:
+            job._partial[is_err] = text
+            return
+        job._partial[is_err] = text[cut + 1:]
+        self._emit_output(job, text[:cut].replace("\r\n", "\n"), is_err)
+
+    def _emit_output(self, job: Job, text: str, is_err: bool):
+        self.output.emit(job.name, text, is_err)
+        if job.readiness is None and job.ready is not None and job.ready.pattern is not None \
+                and job.ready.pattern.search(text):
+            self._set_ready(job, True)
+
+    def _flush(self, job: Job):
+        for is_err in (False, True):
+            self._read(job, is_err)
+            rest = job._partial[is_err] + job._decoders[is_err].decode(b"", final=True)
+            job._partial[is_err] = ""
+            if rest.strip():
+                self._emit_output(job, rest.rstrip("\r\n"), is_err)
+
+    def _on_finished(self, job: Job, code: int, status):
+        if job.ended_at is not None:
+            return
+        self._flush(job)
+        if job.state != RUNNING:        # killed by cancel() or its timeout; the exit code means nothing
+            self._end(job, job.state, -1)
+        elif status == QProcess.CrashExit:
+            self._end(job, FAILED, -1)
+        else:
+            self._end(job, DONE if code == 0 else FAILED, code)
+
+    def _on_error(self, job: Job, err):
+        if err == QProcess.FailedToStart and job.state == RUNNING:
+            job.error = job.process.errorString()
+            self.output.emit(job.name, f"[failed to start {job.program}: {job.error}]", True)
+            self._end(job, FAILED, -1)
+
+    def _on_timeout(self, job: Job):
+        if job.state == RUNNING:
+            job.error = f"timed out after {job.timeout:g} s"
+            self.output.emit(job.name, f"[{job.name} {job.error}]", True)
+            self._kill(job, FAILED)
+
+    # ---------- cancelling ----------
+    def cancel(self, name: str) -> bool:
+        job = self.jobs.get(name)
+        if job is None:
+            return False
+        if job.state == RUNNING:
+            self._kill(job, CANCELLED)
+        elif job.state not in ENDED:    # ENDED but still listed: killed, its exit is on the way
+            self._end(job, CANCELLED, -1)
+        QTimer.singleShot(0, self._schedule)
+        return True
+
+    def cancel_all(self) -> int:
+        names = list(self.jobs)
+        for name in names:
+            job = self.jobs.get(name)
+            if job is not None and job.state == QUEUED:
+                self._end(job, CANCELLED, -1)
+        for name in names:
+            if name in self.jobs:
+                self.cancel(name)
+        return len(names)
+
+    def _kill(self, job: Job, state: str):
+        """Kill the job's process tree; the job ends as `state` when the exit arrives (_on_finished)."""
+        proc = job.process
+        job.state = state
+        if proc is None or proc.state() == QProcess.NotRunning:
+            self._flush(job)
+            self._end(job, state, -1)
+            return
+        kill_tree(proc)
+        QTimer.singleShot(KILL_GRACE_MS, lambda j=job: self._end(j, j.state, -1))
+
+    # ---------- bookkeeping ----------
+    def _end(self, job: Job, state: str, code: int):
+        if job.ended_at is not None:
+            return
+        job.state = state
+        job.exit_code = code
+        job.ended_at = time.perf_counter()
+        if job.process is not None:
+            proc, job.process = job.process, None
+            if proc.state() == QProcess.NotRunning:
+                proc.deleteLater()
+            else:
+                # deleting a running QProcess blocks until it exits
+                proc.finished.connect(proc.deleteLater)
+        self.jobs.pop(job.name, None)
+        self._seq.pop(job.name, None)
+        self.history.append(job)
+        del self.history[:-200]
+        self.finished.emit(job.name, state, code, job.seconds)
+        if job.ready is not None and job.readiness is None and (state != DONE or job.ready.port is None):
+            self._set_ready(job, False)     # only a port can still open after the job is gone
+        self._check_group(job.group)
+        QTimer.singleShot(0, self._schedule)
+
+    def _check_group(self, group):
+        names = self._groups.get(group)
+        if not names or any(n in self.jobs and self.jobs[n].group == group for n in names):
+            return
+        del self._groups[group]
+        summary = {}
+        for name in names:
+            job = next((j for j in reversed(self.history) if j.name == name and j.group == group), None)
+            if job is not None:
+                summary[name] = (job.state, job.exit_code, round(job.seconds, 3))
+        self.chain_finished.emit(group, summary)
+
+    def timings(self) -> list:
+        """(name, state, exit code, waited s, ran s) for ended jobs, oldest first."""
+        return [(j.name, j.state, j.exit_code, round(j.waited, 3), round(j.seconds, 3)) for j in self.history]
+
+    def shutdown(self):
+        self.cancel_all()
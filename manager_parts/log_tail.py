@@ -0,0 +1,210 @@
+"""
+log_tail.py
+
+Tail-follow reader for the manager's log panes (Delta_log_cache.txt).
+
+LogTail keeps the file open and remembers its byte offset, so a poll only
+reads what was appended since the last one, however large the file is:
+
+    • first open shows only the last `initial_bytes` (from a line start)
+    • partial lines stay buffered until their newline arrives; bytes go
+      through an incremental UTF-8 decoder, so a multi-byte character cut
+      between two reads is not mangled
+    • rotation (path now names a different file): the rest of the old file
+      is drained, then the new one is read from the start
+    • truncation (size below our offset): poll() reports reset=True and
+      reading restarts at 0
+    • at most `max_read` bytes per poll; `pending` says more is waiting
+
+LogFollower drives a LogTail from QFileSystemWatcher (the file and its
+directory, re-armed after rotation) instead of a fixed timer. Change
+bursts are coalesced into one read per `debounce_ms`, and a slow
+`fallback_ms` timer covers platforms that report appends late.
+
+Usage:
+    follower = LogFollower("Delta_log_cache.txt", parent=self)
+    follower.appended.connect(view.appendPlainText)     # complete lines, no trailing newline
+    follower.reset.connect(view.clear)
+    follower.start()
+"""
+
+import os
+import codecs
+
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+
+class LogTail:
+    def __init__(self, path: str, initial_bytes: int = 256 * 1024, max_read: int = 4 * 1024 * 1024,
+                 encoding: str = "utf-8"):
+        """
+        :param path:          file to follow (may not exist yet)
+        :param initial_bytes: how much of an existing file to show on first open
+        :param max_read:      byte cap per poll, so a burst cannot stall the caller
+        :param encoding:      text encoding; undecodable bytes are replaced
+        """
+        self.path = os.path.abspath(path)
+        self.initial_bytes = initial_bytes
+        self.max_read = max_read
+        self.encoding = encoding
+        self._f = None
+        self._id = None                 # (st_dev, st_ino) of the open file
+        self.offset = 0
+        self.pending = False            # more bytes than max_read were waiting
+        self._decoder = None
+        self._partial = ""
+        self.bytes_read = 0
+
+    # ---------- file handling ----------
+    def _open(self, st, from_start: bool):
+        self.close()
+        self._f = open(self.path, "rb")
+        self._id = (st.st_dev, st.st_ino)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        self._partial = ""
+        self.offset = 0
+        if not from_start and st.st_size > self.initial_bytes:
+            # start mid-file, dropping the (probably partial) first line
+            self._f.seek(st.st_size - self.initial_bytes)
+            self._f.readline()
+            self.offset = self._f.tell()
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+        self._f = None
+        self._id = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def restart(self):
+        """Forget everything; the next poll starts over like a first open."""
+        self.close()
+
+    # ---------- reading ----------
+    def _read(self, limit: int) -> str:
+        self._f.seek(self.offset)
+        data = self._f.read(limit)
+        self.offset += len(data)
+        self.bytes_read += len(data)
+        return self._decoder.decode(data)
+
+    def _lines(self, text: str, final: bool = False) -> str:
+        text = self._partial + text
+        if final:
+            self._partial = ""
+            return text.rstrip("\n")
+        cut = text.rfind("\n")
+        if cut < 0:
+            self._partial = text
+            return ""
+        self._partial = text[cut + 1:]
+        return text[:cut]
+
+    def poll(self):
+        """Returns (text, reset): complete new lines joined by "\\n" (may be ""), and
+        whether the file was truncated or replaced so earlier output no longer applies."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self._f is None:
+                return "", False
+            self.close()        # deleted: show what is there when it comes back
+            return "", True
+
+        first_open = self._f is None
+        if first_open:
+            self._open(st, from_start=False)
+            return self._drain(st.st_size), True
+
+        if (st.st_dev, st.st_ino) != self._id:
+            # rotated: finish the old file, then follow the new one from its start
+            tail = self._read(self.max_read)
+            old = self._lines(tail, final=True)
+            self._open(st, from_start=True)
+            new = self._drain(st.st_size)
+            return "\n".join(t for t in (old, new) if t), False
+
+        if st.st_size < self.offset:
+            self._open(st, from_start=True)
+            return self._drain(st.st_size), True
+
+        return self._drain(st.st_size), False
+
+    def _drain(self, size: int) -> str:
+        want = size - self.offset
+        if want <= 0:
+            self.pending = False
+            return ""
+        self.pending = want > self.max_read
+        return self._lines(self._read(min(want, self.max_read)))
+
+
+class LogFollower(QObject):
+    appended = pyqtSignal(str)
+    reset = pyqtSignal()
+    missing = pyqtSignal()
+
+    def __init__(self, path: str, debounce_ms: int = 100, fallback_ms: int = 5000, parent=None, **tail_kwargs):
+        """
+        :param path:        file to follow
+        :param debounce_ms: change notifications within this window become one read
+        :param fallback_ms: safety re-check when no notification arrives (0 = off)
+        :param tail_kwargs: passed to LogTail (initial_bytes, max_read, encoding)
+        """
+        super().__init__(parent)
+        self.tail = LogTail(path, **tail_kwargs)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._schedule)
+        self.watcher.directoryChanged.connect(self._schedule)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.poll)
+        self._fallback = QTimer(self)
+        self._fallback.setInterval(fallback_ms)
+        self._fallback.timeout.connect(self.poll)
+        self.fallback_ms = fallback_ms
+        self.polls = 0
+
+    def start(self):
+        directory = os.path.dirname(self.tail.path)
+        if os.path.isdir(directory):
+            self.watcher.addPath(directory)
+        self.poll()
+        if self.fallback_ms:
+            self._fallback.start()
+
+    def stop(self):
+        self._debounce.stop()
+        self._fallback.stop()
+        self.tail.close()
+
+    def reload(self):
+        """Clear and show the tail again (the manual Refresh button)."""
+        self.tail.restart()
+        self.poll()
+
+    def _schedule(self, *_):
+        if not self._debounce.isActive():
+            self._debounce.start()
+
+    def _arm(self):
+        # the watcher drops a file once it is replaced or deleted; re-add it
+        if self.tail.exists() and self.tail.path not in self.watcher.files():
+            self.watcher.addPath(self.tail.path)
+
+    def poll(self):
+        self.polls += 1
+        was_open = self.tail._f is not None
+        text, reset = self.tail.poll()
+        self._arm()
+        if reset:
+            self.reset.emit()
+        if text:
+            self.appended.emit(text)
+        if not self.tail.exists() and (was_open or self.polls == 1):
+            self.missing.emit()
+        if self.tail.pending:
+            self._debounce.start(0)     # keep going in slices, letting the GUI breathe in between
@@ -0,0 +1,473 @@
+"""
+manager_log.py
+
+Bounded, structured log for CortanaManager (replaces the ever-growing
+manager_log list and the HTML QTextEdit).
+
+ManagerLog
+    • append() is cheap on the GUI thread: the entry goes into a fixed-size
+      ring (the most recent `capacity` entries, O(1) lookup by id) and onto
+      a queue
+    • a writer thread drains the queue every `flush_interval` seconds and
+      stores the batch in one SQLite transaction (WAL): table `entries`
+      (id, ts, source, level, message) indexed by ts and (source, id), plus
+      an FTS5 trigram index on message when this SQLite has it, so
+      substring search does not scan. History beyond `max_rows` is pruned
+      from the oldest end
+    • ids keep counting across runs; earlier sessions stay searchable
+    • query_ids() filters by text / source / level (any thread; each
+      thread gets its own connection) and entries() fetches rows by id,
+      from the ring when it can
+
+LogModel / ManagerLogView
+    A QListView over a LogModel, which never holds more than the ids of
+    the current filter (an array of int64) and a few cached pages of rows,
+    so it scrolls through millions of entries. Unfiltered, row r is simply
+    id first + r. Filters run on a worker thread and the newest result
+    wins; new entries show up on a 200 ms tick.
+
+Usage:
+    log = ManagerLog("main/cache/manager_log.sqlite")
+    log.append("Started voice activation", source="voice")
+    view = ManagerLogView(log)                  # a QWidget: filter box, source picker, list
+    ...
+    log.close()                                 # on quit: flush and stop the writer
+"""
+
+import os
+import time
+import queue
+import sqlite3
+import threading
+from array import array
+from collections import namedtuple, OrderedDict
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QLabel, QListView
+
+LogEntry = namedtuple("LogEntry", "id ts source level message")
+
+LEVEL_COLORS = {"error": QColor("#ff6b6b"), "warning": QColor("#ffb347"), "info": QColor("white")}
+
+
+class ManagerLog:
+    SCHEMA = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    CREATE TABLE IF NOT EXISTS entries (
+        id      INTEGER PRIMARY KEY,
+        ts      REAL NOT NULL,
+        source  TEXT NOT NULL,
+        level   TEXT NOT NULL,
+        message TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts);
+    CREATE INDEX IF NOT EXISTS entries_source ON entries (source, id);
+    """
+    FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts
+        USING fts5(message, content='entries', content_rowid='id', tokenize='trigram');
+    """
+    COLUMNS = "id, ts, source, level, message"
+
+    def __init__(self, db_path: str = None, capacity: int = 20000, flush_interval: float = 0.5,
+                 max_rows: int = 5_000_000, fts: bool = True, echo: bool = True):
+        """
+        :param db_path:        SQLite file (None = in memory, gone on exit)
+        :param capacity:       entries kept in the in-memory ring
+        :param flush_interval: seconds between batched writes
+        :param max_rows:       history kept on disk; older entries are pruned
+        :param fts:            trigram full-text index for substring search (if SQLite has FTS5)
+        :param echo:           also print each entry, as the manager always did
+        """
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._uri = f"file:{os.path.abspath(db_path)}"
+        else:
+            self._uri = f"file:manager_log_{id(self)}?mode=memory&cache=shared"
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self.echo = echo
+        self._local = threading.local()
+        self._keep = self._connect()                # also keeps a memory db alive
+        self._keep.executescript(self.SCHEMA)
+        self.fts = False
+        if fts:
+            try:
+                self._keep.executescript(self.FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                print(f"[ManagerLog] no trigram search ({e}); filtering scans")
+        row = self._keep.execute("SELECT MIN(id), MAX(id) FROM entries").fetchone()
+        self.first_id = row[0] or 1
+        self.last_id = row[1] or 0                  # newest appended (maybe not written yet)
+        self._ring = [None] * capacity
+        self._queue = queue.SimpleQueue()
+        self._sources = {r[0] for r in self._keep.execute("SELECT DISTINCT source FROM entries")}
+        self.written = 0
+        self.pruned = 0
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="manager-log", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._uri, uri=True, check_same_thread=False, timeout=10)
+
+    def _db(self) -> sqlite3.Connection:
+        """This thread's connection (the writer has its own)."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = self._connect()
+        return db
+
+    # ---------- writing ----------
+    def append(self, message: str, source: str = "manager", level: str = "info") -> LogEntry:
+        self.last_id += 1
+        entry = LogEntry(self.last_id, time.time(), source, level, message)
+        self._ring[entry.id % self.capacity] = entry
+        self._sources.add(source)
+        self._queue.put(entry)
+        if self.echo:
+            print(f"[{format_ts(entry.ts)}] {message}")
+        return entry
+
+    def _write_loop(self):
+        db = self._connect()
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain(db)
+        self._drain(db)
+        db.close()
+
+    def _drain(self, db):
+        batch, waiters = [], []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                batch.append(item)
+        if batch:
+            try:
+                with db:
+                    db.executemany(f"INSERT INTO entries ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?)", batch)
+                    if self.fts:
+                        db.executemany("INSERT INTO entries_fts (rowid, message) VALUES (?, ?)",
+                                       [(e.id, e.message) for e in batch])
+                self.written += len(batch)
+                if batch[-1].id - self.first_id >= self.max_rows * 1.05:
+                    self._prune(db, batch[-1].id - self.max_rows + 1)
+            except sqlite3.Error as e:
+                print(f"[ManagerLog] write failed, {len(batch)} entries lost: {e}")
+        for event in waiters:
+            event.set()
+
+    def _prune(self, db, keep_from: int):
+        with db:
+            if self.fts:
+                db.execute("INSERT INTO entries_fts (entries_fts, rowid, message) "
+                           "SELECT 'delete', id, message FROM entries WHERE id < ?", (keep_from,))
+            n = db.execute("DELETE FROM entries WHERE id < ?", (keep_from,)).rowcount
+        self.pruned += n
+        self.first_id = keep_from
+
+    def flush(self, timeout: float = 10.0):
+        """Block until everything appended so far is on disk."""
+        if self._closed.is_set():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        self._wake.set()
+        done.wait(timeout)
+
+    def close(self):
+        if not self._closed.is_set():
+            self._closed.set()
+            self._wake.set()
+            self._writer.join(10)
+
+    # ---------- reading ----------
+    def sources(self) -> list:
+        return sorted(self._sources)
+
+    def entry(self, entry_id: int):
+        e = self._ring[entry_id % self.capacity]
+        return e if e is not None and e.id == entry_id else None
+
+    def entries(self, ids) -> list:
+        """Rows for `ids` in the same order (None for ids that no longer exist)."""
+        found, missing = {}, []
+        for i in ids:
+            e = self.entry(i)
+            if e is None:
+                missing.append(i)
+            else:
+                found[i] = e
+        for start in range(0, len(missing), 500):
+            part = missing[start:start + 500]
+            marks = ",".join("?" * len(part))
+            for row in self._db().execute(f"SELECT {self.COLUMNS} FROM entries WHERE id IN ({marks})", part):
+                found[row[0]] = LogEntry(*row)
+        return [found.get(i) for i in ids]
+
+    def query_ids(self, text: str = "", source: str = None, level: str = None, until_id: int = None) -> array:
+        """Ids of entries matching all given filters (text: case-insensitive substring), oldest first,
+        up to `until_id` (default: everything appended so far)."""
+        until_id = self.last_id if until_id is None else until_id
+        self.flush()
+        where, args, table = ["e.id <= ?"], [until_id], "entries e"
+        if text:
+            if self.fts and len(text) >= 3:
+                # the trigram index serves LIKE but not LIKE ... ESCAPE, so the text goes in as is; a
+                # literal % or _ in it then matches too much, and instr() narrows that down exactly
+                table = "entries_fts f JOIN entries e ON e.id = f.rowid"
+                where.append("f.message LIKE ?")
+                args.append(f"%{text}%")
+                if "%" in text or "_" in text:
+                    where.append("instr(lower(e.message), lower(?)) > 0")
+                    args.append(text)
+            else:
+                where.append("e.message LIKE ? ESCAPE '\\'")
+                args.append("%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        if source:
+            where.append("e.source = ?")
+            args.append(source)
+        if level:
+            where.append("e.level = ?")
+            args.append(level)
+        sql = f"SELECT e.id FROM {table} WHERE " + " AND ".join(where) + " ORDER BY e.id"
+        ids = array("q")
+        cur = self._db().execute(sql, args)
+        while True:
+            rows = cur.fetchmany(50000)
+            if not rows:
+                return ids
+            ids.extend(r[0] for r in rows)
+
+    @staticmethod
+    def matches(entry: LogEntry, text: str, source: str, level: str) -> bool:
+        return ((not source or entry.source == source) and (not level or entry.level == level)
+                and (not text or text.lower() in entry.message.lower()))
+
+    def count(self) -> int:
+        return self.last_id - self.first_id + 1
+
+
+def format_ts(ts: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+class LogModel(QAbstractListModel):
+    filtered = pyqtSignal(int, float)          # matching rows, seconds the query took
+    _result = pyqtSignal(int, object, int, float)   # generation, ids, last id covered, seconds (query thread)
+
+    PAGE = 256
+
+    def __init__(self, log: ManagerLog, parent=None, tick_ms: int = 200, cache_pages: int = 64):
+        super().__init__(parent)
+        self.log = log
+        self.ids = None                         # array of ids under a filter; None = everything
+        self.filter = ("", None, None)
+        self._first = log.first_id
+        self._rows = max(0, log.count())
+        self._seen = log.last_id
+        self._pages = OrderedDict()
+        self._cache_pages = cache_pages
+        self._generation = 0
+        self._result.connect(self._apply_result)
+        self._tick = QTimer(self)
+        self._tick.timeout.connect(self.refresh)
+        self._tick.start(tick_ms)
+
+    # ---------- Qt model ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def _id_at(self, row: int) -> int:
+        return self.ids[row] if self.ids is not None else self._first + row
+
+    def _entry(self, row: int):
+        page = row // self.PAGE
+        rows = self._pages.get(page)
+        if rows is None:
+            start = page * self.PAGE
+            end = min(self._rows, start + self.PAGE)
+            rows = self.log.entries([self._id_at(r) for r in range(start, end)])
+            self._pages[page] = rows
+            if len(self._pages) > self._cache_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        offset = row - page * self.PAGE
+        return rows[offset] if offset < len(rows) else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._rows:
+            return None
+        if role == Qt.DisplayRole:
+            e = self._entry(index.row())
+            return f"[{format_ts(e.ts)}] {e.message}" if e else ""
+        if role == Qt.ForegroundRole:
+            e = self._entry(index.row())
+            return LEVEL_COLORS.get(e.level, LEVEL_COLORS["info"]) if e else None
+        if role == Qt.ToolTipRole:
+            e = self._entry(index.row())
+            return f"#{e.id}  {e.source}  {e.level}" if e else None
+        return None
+
+    # ---------- updates ----------
+    def refresh(self):
+        """Pick up appended entries (and pruning) since the last tick."""
+        last = self.log.last_id
+        if self.log.first_id != self._first and self.ids is None:
+            self._reset_all()
+            return
+        if last == self._seen:
+            return
+        if self.ids is None:
+            new_rows = last - self._first + 1
+            self._insert(new_rows - self._rows, lambda: None, new_rows)
+        else:
+            text, source, level = self.filter
+            fresh = [i for i in range(self._seen + 1, last + 1)
+                     if (e := self.log.entry(i)) is not None and self.log.matches(e, text, source, level)]
+            if fresh:
+                self._insert(len(fresh), lambda: self.ids.extend(fresh), len(self.ids) + len(fresh))
+        self._seen = last
+
+    def _insert(self, count: int, apply, new_rows: int):
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows + count - 1)
+        apply()
+        self._pages.pop(self._rows // self.PAGE, None)      # the last page may have been partial
+        self._rows = new_rows
+        self.endInsertRows()
+
+    def _reset_all(self):
+        self.beginResetModel()
+        self._first = self.log.first_id
+        self._seen = self.log.last_id
+        self._rows = max(0, self.log.count()) if self.ids is None else len(self.ids)
+        self._pages.clear()
+        self.endResetModel()
+
+    def set_filter(self, text: str = "", source: str = None, level: str = None):
+        """Filter in the background; the model switches when the result arrives."""
+        self.filter = (text.strip(), source or None, level or None)
+        self._generation += 1
+        generation = self._generation
+        upto = self.log.last_id                 # later entries arrive through refresh()
+        if not any(self.filter):
+            self._apply_result(generation, None, upto, 0.0)
+            return
+
+        def run():
+            t0 = time.perf_counter()
+            try:
+                ids = self.log.query_ids(*self.filter, until_id=upto)
+            except sqlite3.Error as e:
+                print(f"[ManagerLog] filter failed: {e}")
+                ids = array("q")
+            self._result.emit(generation, ids, upto, time.perf_counter() - t0)
+        threading.Thread(target=run, daemon=True).start()
+
+    def _apply_result(self, generation: int, ids, upto: int, seconds: float):
+        if generation != self._generation:
+            return                              # a newer filter is on its way
+        self.beginResetModel()
+        self.ids = ids
+        self._first = self.log.first_id
+        self._seen = upto
+        self._rows = len(ids) if ids is not None else max(0, upto - self._first + 1)
+        self._pages.clear()
+        self.endResetModel()
+        self.refresh()
+        self.filtered.emit(self._rows, seconds)
+
+
+class ManagerLogView(QWidget):
+    def __init__(self, log: ManagerLog, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.model = LogModel(log, self)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        bar = QHBoxLayout()
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Filter log...")
+        self.search.setClearButtonEnabled(True)
+        bar.addWidget(self.search)
+        self.source = _SourceBox(log)
+        bar.addWidget(self.source)
+        self.level = QComboBox()
+        self.level.addItem("All levels", None)
+        for lv in ("info", "warning", "error"):
+            self.level.addItem(lv, lv)
+        bar.addWidget(self.level)
+        self.status = QLabel("")
+        bar.addWidget(self.status)
+        layout.addLayout(bar)
+
+        self.list = QListView()
+        self.list.setModel(self.model)
+        self.list.setUniformItemSizes(True)     # lets the view lay out millions of rows without asking each
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setSelectionMode(QListView.ExtendedSelection)
+        layout.addWidget(self.list)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(250)
+        self._debounce.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(lambda _: self._debounce.start())
+        self.source.currentIndexChanged.connect(lambda _: self._apply_filter())
+        self.level.currentIndexChanged.connect(lambda _: self._apply_filter())
+        self.model.filtered.connect(self._on_filtered)
+        self.model.rowsAboutToBeInserted.connect(self._remember_bottom)
+        self.model.rowsInserted.connect(self._follow)
+        self._at_bottom = True
+        QTimer.singleShot(0, self.list.scrollToBottom)
+
+    def _apply_filter(self):
+        self.status.setText("filtering...")
+        self.model.set_filter(self.search.text(), self.source.currentData(), self.level.currentData())
+
+    def _on_filtered(self, rows: int, seconds: float):
+        self.status.setText(f"{rows:,} entries" + (f" ({seconds * 1000:.0f} ms)" if seconds else ""))
+        self.list.scrollToBottom()
+
+    def _remember_bottom(self, *_):
+        bar = self.list.verticalScrollBar()
+        self._at_bottom = bar.value() >= bar.maximum() - 2
+
+    def _follow(self, *_):
+        if self._at_bottom:
+            self.list.scrollToBottom()
+
+
+class _SourceBox(QComboBox):
+    """Source picker that lists sources first seen after it was built when it opens."""
+    def __init__(self, log: ManagerLog, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self.addItem("All sources", None)
+        self._add_new()
+
+    def _add_new(self):
+        known = {self.itemData(i) for i in range(self.count())}
+        for s in self.log.sources():
+            if s not in known:
+                self.addItem(s, s)
+
+    def showPopup(self):
+        self._add_new()
+        super().showPopup()
@@ -0,0 +1,263 @@
+"""
+output_sink.py
+
+One place for child-process output to reach a terminal pane without
+flooding the GUI thread.
+
+readyRead handlers hand their raw bytes to OutputSink.feed(); nothing
+touches the widget there. At most once per frame (`fps`) the sink:
+
+    • joins everything that arrived since the last frame into one
+      appendPlainText / append call
+    • appends only the last `max_blocks` lines of a burst; the pane's
+      document is capped at the same count, so older lines would be
+      dropped anyway. Every line still goes to the scrollback file, and an
+      `on_text` consumer (a log, not a view) gets every line
+    • past `frame_lines` new lines, rebuilds the pane from its own tail
+      with one setPlainText instead: appending to a full capped document
+      removes blocks one by one and costs ~10x more. The frame interval
+      stretches (up to 250 ms) while frames are expensive
+    • keeps every line in a spill-to-disk scrollback (rotated to `.1` past
+      `scrollback_bytes`) for the history beyond the cap. Lines are written
+      when they are queued for the pane, so the file has stdout, stderr and
+      write() lines in the same order as the pane. Unprefixed streams keep
+      the raw bytes of their completed lines, with no re-encoding
+
+Bytes go through one incremental decoder per source (stdout and stderr of
+each process), so multi-byte characters split between reads survive.
+"\\r\\n" and bare "\\r" become line breaks. A partial line (a shell prompt
+has no newline) is shown once it has waited a whole frame without growing.
+If the pending text outgrows 4 × max_blocks lines between frames, it is
+trimmed (it is on disk already), so memory stays bounded even when the GUI
+falls behind.
+
+Usage:
+    sink = OutputSink(view=self.terminal_output, name="terminal", parent=self)
+    sink.feed(bytes(proc.readAllStandardOutput()), source=proc)
+    sink.feed(bytes(proc.readAllStandardError()), source=(proc, "err"), prefix="[stderr] ")
+    sink.end(proc)                      # process gone: flush its partial line
+    sink.write("--- Process finished ---")
+"""
+
+import os
+import time
+import codecs
+import tempfile
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer
+
+SCROLLBACK_DIR = os.path.join(tempfile.gettempdir(), "cortana_manager_scrollback")
+
+
+class _Source:
+    __slots__ = ("decoder", "partial", "prefix", "stale", "raw")
+
+    def __init__(self, prefix: str):
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.partial = ""
+        self.prefix = prefix
+        self.stale = False              # partial unchanged for a whole frame
+        self.raw = bytearray()          # unprefixed: bytes not yet on disk (the partial line)
+
+    def take_raw(self, final: bool = False) -> bytes:
+        """Raw bytes of the completed lines (all of them when `final`), for the scrollback."""
+        raw = self.raw
+        if final:
+            end = len(raw)
+        else:
+            # a trailing "\r" is held back by feed() (may be half of "\r\n"), so it ends no line yet
+            end = max(raw.rfind(b"\n"), raw.rfind(b"\r", 0, len(raw) - 1)) + 1
+        data = bytes(raw[:end])
+        del raw[:end]
+        return data
+
+
+class OutputSink(QObject):
+    def __init__(self, view=None, on_text=None, name: str = "output", max_blocks: int = 5000, fps: int = 30,
+                 frame_lines: int = 500, scrollback: bool = True, scrollback_bytes: int = 64 * 1024 * 1024,
+                 parent=None):
+        """
+        :param view:             QPlainTextEdit / QTextEdit to append to (its document gets capped)
+        :param on_text:          instead of a view: called once per frame with all new lines joined by "\\n"
+        :param name:             scrollback file name (SCROLLBACK_DIR/<name>.log)
+        :param max_blocks:       lines kept in the view, and the most appended per frame
+        :param fps:              appends per second at most
+        :param frame_lines:      new lines per frame above which the pane is rebuilt rather than appended to
+        :param scrollback:       keep every line on disk
+        :param scrollback_bytes: rotate the scrollback file past this size
+        """
+        super().__init__(parent)
+        self.view = view
+        self.on_text = on_text
+        self.max_blocks = max_blocks
+        self.frame_lines = frame_lines
+        self._tail = deque(maxlen=max_blocks)      # what the pane shows, for rebuilds
+        if view is not None:
+            view.document().setMaximumBlockCount(max_blocks)
+            self._append = getattr(view, "appendPlainText", None) or view.append
+        self._sources = {}
+        self._pending = []              # complete lines, each chunk ending in "\n"
+        self._pending_lines = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._frame_ms = max(1, 1000 // fps)
+        self._timer.setInterval(self._frame_ms)
+        self._timer.timeout.connect(self.flush)
+        self.scrollback_path = os.path.join(SCROLLBACK_DIR, f"{name}.log") if scrollback else None
+        self.scrollback_bytes = scrollback_bytes
+        self._spill = None
+        # numbers, for the benchmark and for curiosity
+        self.bytes_in = 0
+        self.lines_out = 0
+        self.lines_skipped = 0
+        self.frames = 0
+        self.rebuilds = 0
+
+    # ---------- input ----------
+    def _source(self, key, prefix: str) -> _Source:
+        src = self._sources.get(key)
+        if src is None:
+            src = self._sources[key] = _Source(prefix)
+        return src
+
+    def feed(self, data: bytes, source="default", prefix: str = ""):
+        """Raw bytes from one stream; `source` is any hashable that tells the streams apart."""
+        if not data:
+            return
+        self.bytes_in += len(data)
+        src = self._source(source, prefix)
+        if not prefix:
+            src.raw += data
+        text = src.partial + src.decoder.decode(data)
+        held = ""
+        if "\r" in text:
+            if text.endswith("\r"):
+                text, held = text[:-1], "\r"      # may be the first half of "\r\n"
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        cut = text.rfind("\n")
+        if cut < 0:
+            src.partial, src.stale = text + held, False
+            self._schedule()
+            return
+        src.partial, src.stale = text[cut + 1:] + held, False
+        self._queue(text[:cut + 1], src.prefix, None if prefix else src.take_raw())
+
+    def end(self, source="default"):
+        """The stream is done: its partial line (if any) becomes a line."""
+        src = self._sources.pop(source, None)
+        if src is None:
+            return
+        rest = (src.partial + src.decoder.decode(b"", final=True)).rstrip("\r")
+        if rest:
+            self._queue(rest + "\n", src.prefix, None if src.prefix else src.take_raw(final=True) + b"\n")
+
+    def write(self, text: str):
+        """Already-decoded text, shown in order with the streamed output."""
+        self._queue(text.rstrip("\n") + "\n", "")
+
+    def _queue(self, chunk: str, prefix: str, data: bytes = None):
+        """Complete lines for the pane; `data` is their raw bytes for the scrollback, if the stream has them."""
+        if prefix:
+            chunk = prefix + chunk[:-1].replace("\n", "\n" + prefix) + "\n"
+        # on disk in queue order: a partial stdout line never has a stderr line spliced into it
+        self._to_disk(chunk.encode("utf-8") if data is None else data)
+        self._pending.append(chunk)
+        self._pending_lines += chunk.count("\n")
+        if self.on_text is None and self._pending_lines > 4 * self.max_blocks:
+            self._compact()
+        self._schedule()
+
+    def _compact(self):
+        # the GUI is behind: keep only what the view could show (all of it is on disk already)
+        text = "".join(self._pending)
+        keep = text.rsplit("\n", self.max_blocks + 1)
+        self.lines_skipped += max(0, self._pending_lines - self.max_blocks)
+        self._pending = ["\n".join(keep[1:]) if len(keep) > self.max_blocks + 1 else text]
+        self._pending_lines = min(self._pending_lines, self.max_blocks)
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    # ---------- output ----------
+    def flush(self):
+        """Append what is pending now (the frame timer calls this)."""
+        waiting = False
+        for src in self._sources.values():
+            if src.partial:
+                if src.stale:
+                    self._queue(src.partial.rstrip("\r") + "\n", src.prefix,
+                                None if src.prefix else src.take_raw(final=True) + b"\n")
+                    src.partial, src.stale = "", False
+                else:
+                    src.stale = waiting = True
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending = []
+            lines = self._pending_lines
+            self._pending_lines = 0
+            text = text[:-1]
+            if lines > self.max_blocks and self.on_text is None:
+                text = text.rsplit("\n", self.max_blocks)
+                text = "\n".join(text[1:])
+                self.lines_skipped += lines - self.max_blocks
+                lines = self.max_blocks
+            self.lines_out += lines
+            self.frames += 1
+            t0 = time.perf_counter()
+            if self.on_text is not None:
+                self.on_text(text)
+            else:
+                self._show(text, lines)
+            cost_ms = (time.perf_counter() - t0) * 1000
+            self._timer.setInterval(min(250, max(self._frame_ms, int(cost_ms * 3))))
+        if waiting:
+            self._schedule()
+
+    def _show(self, text: str, lines: int):
+        self._tail.extend(text.split("\n"))
+        if lines <= self.frame_lines:
+            self._append(text)
+            return
+        bar = self.view.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 2
+        self.rebuilds += 1
+        self.view.setPlainText("\n".join(self._tail))
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def clear(self):
+        """The pane was cleared; forget its tail (the scrollback keeps everything)."""
+        self._tail.clear()
+        if self.view is not None:
+            self.view.clear()
+
+    def _to_disk(self, data: bytes):
+        if not self.scrollback_path or not data:
+            return
+        try:
+            if self._spill is None:
+                os.makedirs(SCROLLBACK_DIR, exist_ok=True)
+                self._spill = open(self.scrollback_path, "wb", buffering=1024 * 1024)
+            self._spill.write(data)
+            if self._spill.tell() > self.scrollback_bytes:
+                self._spill.close()
+                os.replace(self.scrollback_path, self.scrollback_path + ".1")
+                self._spill = open(self.scrollback_path, "wb", buffering=1024 * 1024)
+        except OSError as e:
+            print(f"[OutputSink] scrollback disabled: {e}")
+            self.scrollback_path = None
+
+    def scrollback_file(self) -> str:
+        """Path of the scrollback file, with everything written so far on disk."""
+        self.flush()
+        if self._spill is not None:
+            self._spill.flush()
+        return self.scrollback_path
+
+    def close(self):
+        self.flush()
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
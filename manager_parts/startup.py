@@ -0,0 +1,186 @@
+"""
+startup.py
+
+Runs the manager's default_commands (config/terminal_config.json) as a
+dependency graph on a JobRunner instead of strictly one after another.
+
+Each entry is a command string (run through cmd, as before) or a dict:
+
+    name             how deps and the timing report refer to it (default cmd<N>)
+    interpreter      cmd / powershell / bash / python / node / any program
+    command          the command line, or the script for python / node
+    deps             names of commands, or of groups, that must be done or ready first
+    group            a label; consecutive entries with the same group are one parallel block
+    ready            a readiness probe: a port number, a regex for a log line, or
+                     {"port": 11434, "host": "127.0.0.1", "log": "...", "timeout": 60}
+    timeout          seconds before the command is killed
+    require_success  false: start even if a dependency failed or never got ready
+    cwd, env         working directory, extra environment variables
+
+"default_commands_mode" decides what orders the entries besides deps:
+
+    sequential (default)  each block waits for the block before it, as the
+                          old one-at-a-time runner did, but a block runs its
+                          members side by side and a service only has to be
+                          ready, not exited. A failure does not stop the rest
+    parallel              only deps order them; everything else starts at once
+
+"startup_max_parallel" caps how many commands start up at the same time.
+
+StartupScheduler.settled fires once every command is done, failed, skipped
+or running and ready (or given up on), with per-command timings: time spent
+waiting for dependencies, time to ready, run time.
+
+Usage:
+    startup = StartupScheduler(max_parallel=4, parent=self)
+    startup.settled.connect(lambda rows, secs: print("\\n".join(format_report(rows, secs))))
+    startup.start(build_jobs(config["default_commands"], config.get("default_commands_mode")))
+"""
+
+import sys
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from manager_parts.job_runner import JobRunner, Job, ReadyProbe, ENDED, READY, RUNNING, DONE
+
+MODES = ("sequential", "parallel")
+
+
+def command_args(interpreter: str, command: str, python: str = None) -> list:
+    """Program and arguments for one default command."""
+    if interpreter == "python":
+        return [python or sys.executable, command]
+    if interpreter == "node":
+        return ["node", command]
+    if interpreter == "powershell":
+        return ["powershell.exe", "-Command", command]
+    if interpreter == "bash":
+        return ["bash", "-c", command]
+    if interpreter == "cmd":
+        return ["cmd.exe", "/c", command]
+    # Fallback: try to run as a shell command
+    return [interpreter, command]
+
+
+def build_jobs(entries, mode: str = "sequential", python: str = None) -> list:
+    """Jobs for the default_commands entries. Raises ValueError for a bad entry or mode."""
+    mode = (mode or "sequential").lower()
+    if mode not in MODES:
+        raise ValueError(f"default_commands_mode must be one of {MODES}, not {mode!r}")
+    specs = []
+    for i, entry in enumerate(entries, 1):
+        # Support both string and dict for backward compatibility
+        if isinstance(entry, str):
+            entry = {"command": entry}
+        elif not isinstance(entry, dict):
+            raise ValueError(f"default_commands entry {i} must be a string or an object")
+        specs.append(dict(entry, name=str(entry.get("name") or f"cmd{i}")))
+
+    groups = {}
+    for spec in specs:
+        if spec.get("group"):
+            groups.setdefault(spec["group"], []).append(spec["name"])
+    clash = {spec["name"] for spec in specs} & set(groups)
+    if clash:
+        raise ValueError(f"names used for a command and for a group: {sorted(clash)}")
+
+    # blocks: runs of consecutive entries sharing a group; an entry without a group is a block of its own
+    blocks = []
+    for spec in specs:
+        if blocks and spec.get("group") and blocks[-1][0].get("group") == spec["group"]:
+            blocks[-1].append(spec)
+        else:
+            blocks.append([spec])
+
+    jobs, previous = [], []
+    for block in blocks:
+        for spec in block:
+            deps = []
+            for dep in spec.get("deps", []):
+                deps.extend(n for n in groups.get(dep, [dep]) if n != spec["name"] and n not in deps)
+            if mode == "sequential":
+                deps.extend(n for n in previous if n not in deps)
+            interpreter = str(spec.get("interpreter", "cmd")).lower()
+            args = command_args(interpreter, spec.get("command", ""), python)
+            jobs.append(Job(spec["name"], args[0], args[1:], cwd=spec.get("cwd"), deps=deps,
+                            timeout=spec.get("timeout"), env=spec.get("env"),
+                            require_success=spec.get("require_success", mode == "parallel"),
+                            ready=ReadyProbe.from_config(spec.get("ready"))))
+        previous = [spec["name"] for spec in block]
+    return jobs
+
+
+class StartupScheduler(QObject):
+    settled = pyqtSignal(list, float)           # report rows (see report()), seconds since start()
+
+    def __init__(self, max_parallel: int = 4, parent=None):
+        """
+        :param max_parallel: commands starting up at the same time (ready services do not count)
+        :param parent:       QObject owner
+        """
+        super().__init__(parent)
+        self.jobs = JobRunner(max_parallel=max_parallel, parent=self)
+        self.names = []
+        self.started_at = None
+        self._settled = True
+        self.jobs.ready.connect(lambda *a: self._check())
+        self.jobs.finished.connect(lambda *a: self._check())
+
+    def start(self, jobs) -> list:
+        """Schedule `jobs`; returns the names left out because they are still running from
+        an earlier start() (deps on them still work). Raises ValueError (unknown deps, cycles) before anything starts."""
+        jobs = list(jobs)
+        busy = [j.name for j in jobs if j.name in self.jobs.jobs]
+        jobs = [j for j in jobs if j.name not in busy]
+        if not jobs:
+            return busy
+        self.jobs.run_chain(jobs)
+        self.names = [j.name for j in jobs]
+        self.started_at = time.perf_counter()
+        self._settled = False
+        return busy
+
+    def job(self, name: str):
+        return self.jobs.jobs.get(name) or self.jobs._ended(name)
+
+    def _is_settled(self, job: Job) -> bool:
+        if job.ready is not None:
+            return job.readiness is not None    # ready, or given up on (it may still be running)
+        return job.state in ENDED
+
+    def _check(self):
+        if self._settled:
+            return
+        jobs = [self.job(name) for name in self.names]
+        if all(job is None or self._is_settled(job) for job in jobs):
+            self._settled = True
+            self.settled.emit(self.report(), time.perf_counter() - self.started_at)
+
+    def report(self) -> list:
+        """(name, state, waited s, ready after s or None, ran s) per command, in config order."""
+        rows = []
+        for name in self.names:
+            job = self.job(name)
+            if job is None:
+                continue
+            state = job.state
+            if job.ready is not None and job.readiness is not None and state in (RUNNING, DONE):
+                state = "ready" if job.readiness == READY else "not ready"
+            rows.append((name, state, round(job.waited, 3), None if job.ready_after is None else round(job.ready_after, 3),
+                         round(job.seconds, 3)))
+        return rows
+
+    def shutdown(self):
+        self.jobs.shutdown()
+
+
+def format_report(rows: list, seconds: float) -> list:
+    """Lines of the startup timing table."""
+    one_by_one = sum(ready if ready is not None else ran for _, _, _, ready, ran in rows)
+    lines = [f"--- Startup: {len(rows)} commands settled in {seconds:.2f} s "
+             f"(one after another: {one_by_one:.2f} s) ---"]
+    for name, state, waited, ready, ran in rows:
+        took = f"ready after {ready:7.2f} s" if ready is not None else f"ran {ran:15.2f} s"
+        lines.append(f"    {name:<20} {state:<10} waited {waited:6.2f} s   {took}")
+    return lines